@@ -0,0 +1,3 @@
+"""
+Benchmarks do projeto (executar a partir de src/, ex.: `python -m benchmarks.raster_bench`).
+"""
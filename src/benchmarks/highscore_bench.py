@@ -0,0 +1,134 @@
+"""
+Benchmark da leitura de arquivos de highscores grandes.
+
+Gera um highscores.txt sintético (milhões de linhas, com uma fração de linhas
+malformadas) e compara:
+- ingênuo: lê tudo, guarda listas de tempos por dificuldade e ordena;
+- streaming: `TopKReader` (blocos de bytes + heap limitado por dificuldade);
+- retomada: após anexar linhas novas, o leitor salvo só lê o final do arquivo.
+
+Uso (a partir de src/):
+    python -m benchmarks.highscore_bench
+    python -m benchmarks.highscore_bench --lines 5000000 --append 1000 --json highscores.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from game.highscore_reader import TopKReader, CHUNK_SIZE
+
+DIFFICULTIES = ("EASY", "NORMAL", "HARD")
+
+
+def generate(path, lines, malformed=0.01, seed=1234, mode="w"):
+    """Escreve `lines` linhas DIFICULDADE|MS|TIMESTAMP (uma fração malformada)."""
+    rng = random.Random(seed)
+    with open(path, mode) as f:
+        batch = []
+        for i in range(lines):
+            if rng.random() < malformed:
+                batch.append(rng.choice(("HARD|abc|2024-01-01 00:00:00", "lixo", "|123|", "NORMAL|")))
+            else:
+                batch.append(f"{rng.choice(DIFFICULTIES)}|{rng.randint(5000, 600000)}|"
+                             f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00")
+            if len(batch) == 10000:
+                f.write("\n".join(batch) + "\n")
+                batch.clear()
+        if batch:
+            f.write("\n".join(batch) + "\n")
+
+
+def naive_top(path, k):
+    """A leitura antiga: listas completas por dificuldade + sort."""
+    scores = {}
+    with open(path) as f:
+        for line in f:
+            parts = line.strip().split("|")
+            if len(parts) < 2 or not parts[0]:
+                continue
+            try:
+                scores.setdefault(parts[0], []).append(int(parts[1]))
+            except ValueError:
+                continue
+    return {name: sorted(times)[:k] for name, times in scores.items()}
+
+
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - t0) * 1000.0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, {"ms": round(elapsed, 1), "peak_kib": round(peak / 1024, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark da leitura de highscores grandes")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="Linhas do arquivo sintético")
+    parser.add_argument("--malformed", type=float, default=0.01, help="Fração de linhas malformadas")
+    parser.add_argument("--append", type=int, default=1000, help="Linhas anexadas antes da retomada")
+    parser.add_argument("--k", type=int, default=3, help="Tempos mantidos por dificuldade")
+    parser.add_argument("--chunk-kib", type=int, default=CHUNK_SIZE // 1024, help="Tamanho do bloco de leitura (KiB)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Mede só o tempo (tracemalloc deixa as leituras bem mais lentas)")
+    parser.add_argument("--json", help="Salva resultados em JSON")
+    args = parser.parse_args(argv)
+
+    measure = _measure
+    if args.no_memory:
+        def measure(fn):
+            t0 = time.perf_counter()
+            result = fn()
+            return result, {"ms": round((time.perf_counter() - t0) * 1000.0, 1)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "highscores.txt")
+        state_path = os.path.join(tmp, "highscores.state.json")
+        t0 = time.perf_counter()
+        generate(path, args.lines, args.malformed)
+        print(f"{args.lines} linhas ({os.path.getsize(path) / 2**20:.1f} MiB) geradas em "
+              f"{time.perf_counter() - t0:.1f} s")
+
+        expected, naive = measure(lambda: naive_top(path, args.k))
+        reader = TopKReader(args.k, args.chunk_kib * 1024)
+        _, streaming = measure(lambda: reader.feed(path))
+        if reader.top_all() != expected:
+            print("ERRO: top-k do streaming difere da leitura ingênua")
+            return 1
+        reader.save(state_path)
+
+        generate(path, args.append, args.malformed, seed=4321, mode="a")
+        resumed = TopKReader.load(state_path, args.chunk_kib * 1024)
+        read, resume = measure(lambda: resumed.feed(path))
+        if resumed.top_all() != naive_top(path, args.k):
+            print("ERRO: top-k após retomada difere da leitura completa")
+            return 1
+
+    results = {
+        "lines": args.lines,
+        "malformed": reader.malformed,
+        "naive": naive,
+        "streaming": streaming,
+        "resume": dict(resume, lines=read),
+        "top": reader.top_all(),
+    }
+    for name in ("naive", "streaming"):
+        r = results[name]
+        print(f"{name:>10}: {r['ms']:>9.1f} ms" + (f"  pico {r['peak_kib']:>10.1f} KiB" if "peak_kib" in r else ""))
+    print(f"{'retomada':>10}: {resume['ms']:>9.1f} ms  ({read} linhas novas)")
+    print(f"{reader.malformed} linhas malformadas ignoradas; top {args.k}: {resumed.top_all()}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
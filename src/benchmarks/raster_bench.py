@@ -0,0 +1,436 @@
+"""
+Microbenchmark das primitivas de rasterização (engine/raster.py).
+
+Mede cada primitiva variando o tamanho (8 px até a tela inteira), o número de
+vértices e o tamanho da textura. Reporta custo por pixel e throughput em JSON
+e/ou CSV, e compara dois arquivos de resultado para detectar regressões.
+
+Uso (a partir de src/):
+    python -m benchmarks.raster_bench --json bench.json --csv bench.csv
+    python -m benchmarks.raster_bench --quick
+    python -m benchmarks.raster_bench --compare antes.json depois.json
+"""
+import os
+import sys
+import csv
+import json
+import math
+import time
+import platform
+import argparse
+import statistics
+from datetime import datetime
+
+# Drivers "dummy": o benchmark não precisa de janela nem de placa de som
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from engine.raster import (
+    paintPolygon, paintTexturedPolygon, paintTexturedEllipse, bresenham,
+    draw_circle, flood_fill_iterativo, paint_ellipse, draw_text_raster,
+    draw_gradient_rect,
+)
+from game.model.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Eixos de variação
+SIZES = [8, 16, 32, 64, 128, 256, 512, "full"]
+QUICK_SIZES = [8, 32, 128, "full"]
+VERTEX_COUNTS = [3, 4, 8, 16, 32, 64]
+TEXTURE_SIZES = [8, 32, 128, 512]
+FONT_SIZES = [8, 16, 32, 64, 128]
+
+# Tamanho fixo usado quando o eixo variado não é o tamanho da primitiva
+FIXED_SIZE = 256
+
+# Campos do CSV / chave de comparação
+CSV_FIELDS = [
+    "primitive", "variant", "axis", "size", "vertices", "texture",
+    "pixels", "calls", "median_ms", "min_ms", "ns_per_pixel", "mpix_per_s",
+]
+KEY_FIELDS = ("primitive", "variant", "axis", "size", "vertices", "texture")
+
+# Cores usadas pelas primitivas
+COLOR_FILL = (255, 200, 0)
+COLOR_BORDER = (255, 255, 255)
+
+
+def _make_texture(size):
+    """Gera textura xadrez (size x size) no formato do engine: matriz [x][y] de cores."""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    cell = max(1, size // 8)
+    for x in range(size):
+        for y in range(size):
+            if ((x // cell) + (y // cell)) % 2:
+                surf.set_at((x, y), (255, 255, 255, 255))
+            else:
+                surf.set_at((x, y), (40, 40, 90, 255))
+    matrix = [[surf.get_at((x, y)) for y in range(size)] for x in range(size)]
+    return matrix, size, size
+
+
+def _dimensions(size):
+    """Converte o rótulo de tamanho em (largura, altura) em pixels."""
+    if size == "full":
+        return SCREEN_WIDTH, SCREEN_HEIGHT
+    return size, size
+
+
+def _regular_polygon(cx, cy, radius, n):
+    """Vértices de um polígono regular de n lados centrado em (cx, cy)."""
+    return [
+        (cx + radius * math.cos(2 * math.pi * i / n),
+         cy + radius * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+
+
+def _quad_uv(w, h, tex_w, tex_h):
+    """Quad centrado na tela com UVs cobrindo a textura inteira."""
+    x0 = (SCREEN_WIDTH - w) // 2
+    y0 = (SCREEN_HEIGHT - h) // 2
+    return [
+        (x0,     y0,     0,     0),
+        (x0 + w, y0,     tex_w, 0),
+        (x0 + w, y0 + h, tex_w, tex_h),
+        (x0,     y0 + h, 0,     tex_h),
+    ]
+
+
+def _time_calls(fn, setup=None, min_time=0.2, max_calls=200, min_calls=3):
+    """
+    Executa `fn` repetidamente e retorna a lista de tempos (segundos) por chamada.
+    `setup` (opcional) roda antes de cada chamada e não entra na medição.
+    """
+    timings = []
+    total = 0.0
+    while len(timings) < max_calls and (len(timings) < min_calls or total < min_time):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        timings.append(dt)
+        total += dt
+    return timings
+
+
+class RasterBench:
+    """Monta os casos de teste e coleta os resultados de cada primitiva."""
+
+    def __init__(self, sizes, min_time=0.2, max_calls=200, verbose=True):
+        self.sizes = sizes
+        self.min_time = min_time
+        self.max_calls = max_calls
+        self.verbose = verbose
+        self.results = []
+
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.textures = {s: _make_texture(s) for s in TEXTURE_SIZES}
+        font_path = os.path.normpath(os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "fonts", "PixeloidSans.ttf"
+        ))
+        self.font_path = font_path if os.path.exists(font_path) else None
+
+    def _record(self, primitive, variant, axis, size, pixels, fn, setup=None,
+                vertices="", texture=""):
+        """Mede um caso e adiciona a linha de resultado."""
+        with pygame.PixelArray(self.surface) as px_array:
+            timings = _time_calls(
+                lambda: fn(px_array),
+                setup=(lambda: setup(px_array)) if setup else None,
+                min_time=self.min_time, max_calls=self.max_calls,
+            )
+        median = statistics.median(timings)
+        pixels = max(1, int(pixels))
+        row = {
+            "primitive": primitive,
+            "variant": variant,
+            "axis": axis,
+            "size": size,
+            "vertices": vertices,
+            "texture": texture,
+            "pixels": pixels,
+            "calls": len(timings),
+            "median_ms": round(median * 1000, 4),
+            "min_ms": round(min(timings) * 1000, 4),
+            "ns_per_pixel": round(median * 1e9 / pixels, 2),
+            "mpix_per_s": round(pixels / median / 1e6, 4) if median > 0 else 0.0,
+        }
+        self.results.append(row)
+        if self.verbose:
+            print(f"{primitive:<22} {variant:<9} {axis:<8} size={size!s:<5} "
+                  f"v={vertices!s:<3} tex={texture!s:<4} "
+                  f"{row['median_ms']:>10.3f} ms  {row['ns_per_pixel']:>9.1f} ns/px")
+        return row
+
+    def _clear(self, px_array):
+        px_array[:] = 0
+
+    # --- Casos por primitiva ---
+
+    def bench_paint_polygon(self):
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            poly = [(x, y) for x, y, _, _ in _quad_uv(w, h, 1, 1)]
+            self._record("paintPolygon", "quad", "size", size, w * h,
+                         lambda px, p=poly: paintPolygon(px, p, COLOR_FILL))
+
+        radius = FIXED_SIZE // 2
+        area_circle = math.pi * radius * radius
+        for n in VERTEX_COUNTS:
+            poly = _regular_polygon(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, radius, n)
+            # Área do polígono regular inscrito: n/2 * r² * sin(2π/n)
+            area = 0.5 * n * radius * radius * math.sin(2 * math.pi / n) if n > 2 else area_circle
+            self._record("paintPolygon", "regular", "vertices", FIXED_SIZE, area,
+                         lambda px, p=poly: paintPolygon(px, p, COLOR_FILL), vertices=n)
+
+    def bench_paint_textured_polygon(self):
+        tex_matrix, tex_w, tex_h = self.textures[128]
+        for method in ("standard", "tiling"):
+            for size in self.sizes:
+                w, h = _dimensions(size)
+                verts = _quad_uv(w, h, tex_w, tex_h)
+                self._record(
+                    "paintTexturedPolygon", method, "size", size, w * h,
+                    lambda px, v=verts, m=method: paintTexturedPolygon(
+                        px, SCREEN_WIDTH, SCREEN_HEIGHT, v, tex_matrix, tex_w, tex_h, m),
+                    texture=tex_w,
+                )
+
+            for tex_size in TEXTURE_SIZES:
+                t_matrix, t_w, t_h = self.textures[tex_size]
+                verts = _quad_uv(FIXED_SIZE, FIXED_SIZE, t_w, t_h)
+                self._record(
+                    "paintTexturedPolygon", method, "texture", FIXED_SIZE, FIXED_SIZE * FIXED_SIZE,
+                    lambda px, v=verts, m=method, tm=t_matrix, tw=t_w, th=t_h: paintTexturedPolygon(
+                        px, SCREEN_WIDTH, SCREEN_HEIGHT, v, tm, tw, th, m),
+                    texture=tex_size,
+                )
+
+        radius = FIXED_SIZE // 2
+        for n in VERTEX_COUNTS:
+            verts = []
+            for i in range(n):
+                angle = 2 * math.pi * i / n
+                verts.append((
+                    SCREEN_WIDTH // 2 + radius * math.cos(angle),
+                    SCREEN_HEIGHT // 2 + radius * math.sin(angle),
+                    (0.5 + 0.5 * math.cos(angle)) * tex_w,
+                    (0.5 + 0.5 * math.sin(angle)) * tex_h,
+                ))
+            area = 0.5 * n * radius * radius * math.sin(2 * math.pi / n)
+            self._record(
+                "paintTexturedPolygon", "standard", "vertices", FIXED_SIZE, area,
+                lambda px, v=verts: paintTexturedPolygon(
+                    px, SCREEN_WIDTH, SCREEN_HEIGHT, v, tex_matrix, tex_w, tex_h, "standard"),
+                vertices=n, texture=tex_w,
+            )
+
+    def bench_paint_textured_ellipse(self):
+        tex_matrix, tex_w, tex_h = self.textures[128]
+        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            rx, ry = max(1, w // 2), max(1, h // 2)
+            self._record(
+                "paintTexturedEllipse", "standard", "size", size, math.pi * rx * ry,
+                lambda px, rx=rx, ry=ry: paintTexturedEllipse(
+                    px, SCREEN_WIDTH, SCREEN_HEIGHT, center, rx, ry, tex_matrix, tex_w, tex_h),
+                texture=tex_w,
+            )
+
+        rx = ry = FIXED_SIZE // 2
+        for tex_size in TEXTURE_SIZES:
+            t_matrix, t_w, t_h = self.textures[tex_size]
+            self._record(
+                "paintTexturedEllipse", "standard", "texture", FIXED_SIZE, math.pi * rx * ry,
+                lambda px, tm=t_matrix, tw=t_w, th=t_h: paintTexturedEllipse(
+                    px, SCREEN_WIDTH, SCREEN_HEIGHT, center, rx, ry, tm, tw, th),
+                texture=tex_size,
+            )
+
+    def bench_bresenham(self):
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            x0 = (SCREEN_WIDTH - w) // 2
+            y0 = (SCREEN_HEIGHT - h) // 2
+            x1, y1 = x0 + w - 1, y0 + h - 1
+            # Linha diagonal: um pixel por passo no eixo dominante
+            self._record("bresenham", "diagonal", "size", size, max(w, h),
+                         lambda px, a=(x0, y0, x1, y1): bresenham(px, *a, COLOR_BORDER))
+
+    def bench_draw_circle(self):
+        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            radius = max(1, min(w, h) // 2)
+            self._record("draw_circle", "midpoint", "size", size, 2 * math.pi * radius,
+                         lambda px, r=radius: draw_circle(px, center, r, COLOR_BORDER))
+
+    def bench_flood_fill(self):
+        cx, cy = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            radius = max(2, min(w, h) // 2 - 1)
+
+            def setup(px, r=radius):
+                # Redesenha a borda sobre a tela limpa (fora da medição)
+                px[:] = 0
+                draw_circle(px, (cx, cy), r, COLOR_BORDER)
+
+            self._record("flood_fill_iterativo", "circle", "size", size, math.pi * radius * radius,
+                         lambda px: flood_fill_iterativo(px, cx, cy, COLOR_FILL, COLOR_BORDER),
+                         setup=setup)
+
+    def bench_paint_ellipse(self):
+        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            rx, ry = max(1, w // 2), max(1, h // 2)
+            self._record("paint_ellipse", "scanline", "size", size, math.pi * rx * ry,
+                         lambda px, rx=rx, ry=ry: paint_ellipse(px, center, rx, ry, COLOR_FILL))
+
+    def bench_draw_text(self):
+        text = "GABRIELZITO 0123"
+        for font_size in FONT_SIZES:
+            font = pygame.font.Font(self.font_path, font_size)
+            w, h = font.size(text)
+            self._record("draw_text_raster", "font", "size", font_size, w * h,
+                         lambda px, f=font: draw_text_raster(px, f, text, 10, 10, COLOR_FILL))
+
+    def bench_gradient_rect(self):
+        for size in self.sizes:
+            w, h = _dimensions(size)
+            x0 = (SCREEN_WIDTH - w) // 2
+            y0 = (SCREEN_HEIGHT - h) // 2
+            self._record("draw_gradient_rect", "vertical", "size", size, w * h,
+                         lambda px, a=(x0, y0, w, h): draw_gradient_rect(
+                             px, *a, (40, 40, 90), (10, 10, 20)))
+
+    def run(self, only=None):
+        """Executa todos os grupos (ou apenas os listados em `only`)."""
+        groups = {
+            "paintPolygon": self.bench_paint_polygon,
+            "paintTexturedPolygon": self.bench_paint_textured_polygon,
+            "paintTexturedEllipse": self.bench_paint_textured_ellipse,
+            "bresenham": self.bench_bresenham,
+            "draw_circle": self.bench_draw_circle,
+            "flood_fill_iterativo": self.bench_flood_fill,
+            "paint_ellipse": self.bench_paint_ellipse,
+            "draw_text_raster": self.bench_draw_text,
+            "draw_gradient_rect": self.bench_gradient_rect,
+        }
+        for name, bench in groups.items():
+            if only and name not in only:
+                continue
+            bench()
+        return self.results
+
+
+def _metadata():
+    return {
+        "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "screen": [SCREEN_WIDTH, SCREEN_HEIGHT],
+    }
+
+
+def write_json(path, results):
+    with open(path, "w") as f:
+        json.dump({"meta": _metadata(), "results": results}, f, indent=2)
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for row in results:
+            writer.writerow({k: row[k] for k in CSV_FIELDS})
+
+
+def load_results(path):
+    """Lê um arquivo de resultados (JSON ou CSV) e retorna a lista de linhas."""
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            row["ns_per_pixel"] = float(row["ns_per_pixel"])
+            row["median_ms"] = float(row["median_ms"])
+        return rows
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def _row_key(row):
+    return tuple(str(row[k]) for k in KEY_FIELDS)
+
+
+def compare(base_path, new_path, threshold=0.10):
+    """
+    Compara dois arquivos de resultado caso a caso (custo por pixel).
+    Retorna o número de regressões acima de `threshold` (fração, ex.: 0.10 = 10%).
+    """
+    base = {_row_key(r): r for r in load_results(base_path)}
+    new = {_row_key(r): r for r in load_results(new_path)}
+
+    regressions = 0
+    print(f"{'caso':<62} {'base ns/px':>11} {'novo ns/px':>11} {'delta':>8}")
+    for key in sorted(set(base) & set(new)):
+        old_cost = float(base[key]["ns_per_pixel"])
+        new_cost = float(new[key]["ns_per_pixel"])
+        delta = (new_cost - old_cost) / old_cost if old_cost > 0 else 0.0
+        flag = ""
+        if delta > threshold:
+            flag = "  REGRESSAO"
+            regressions += 1
+        elif delta < -threshold:
+            flag = "  melhora"
+        label = " ".join(f"{k}={v}" for k, v in zip(KEY_FIELDS, key) if v != "")
+        print(f"{label:<62} {old_cost:>11.1f} {new_cost:>11.1f} {delta:>+7.1%}{flag}")
+
+    only_base = set(base) - set(new)
+    only_new = set(new) - set(base)
+    if only_base or only_new:
+        print(f"\n{len(only_base)} caso(s) só na base, {len(only_new)} caso(s) só no novo arquivo.")
+    print(f"\n{regressions} regressão(ões) acima de {threshold:.0%}.")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmark das primitivas de engine/raster.py")
+    parser.add_argument("--json", help="Salva resultados em JSON")
+    parser.add_argument("--csv", help="Salva resultados em CSV")
+    parser.add_argument("--quick", action="store_true", help="Menos tamanhos e repetições")
+    parser.add_argument("--only", nargs="+", help="Mede apenas as primitivas listadas")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Tempo mínimo de medição por caso (s)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NOVO"),
+                        help="Compara dois arquivos de resultado em vez de medir")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Limite de regressão no modo --compare (fração)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        regressions = compare(args.compare[0], args.compare[1], args.threshold)
+        return 1 if regressions else 0
+
+    pygame.init()
+    sizes = QUICK_SIZES if args.quick else SIZES
+    min_time = min(args.min_time, 0.05) if args.quick else args.min_time
+    bench = RasterBench(sizes, min_time=min_time, max_calls=50 if args.quick else 200)
+    results = bench.run(only=args.only)
+
+    if args.json:
+        write_json(args.json, results)
+    if args.csv:
+        write_csv(args.csv, results)
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Benchmark de escala com enxames de gabrielzitos (dificuldade personalizada).
+
+Para cada quantidade de prêmios, mede:
+- criação do mundo (posicionamento inicial);
+- ticks de simulação por segundo (GameLoop.update com input roteirizado);
+- tempo de frame da renderização completa (GameLoop.render).
+
+Uso (a partir de src/):
+    python -m benchmarks.swarm_bench
+    python -m benchmarks.swarm_bench --counts 10 100 1000 10000 --ticks 600 --frames 30 --json swarm.json
+    python -m benchmarks.swarm_bench --collisions exchange --frames 0
+    python -m benchmarks.swarm_bench --motion analytic
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+# Drivers "dummy": o benchmark não precisa de janela nem de placa de som
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game.clock import SimulatedClock
+from game.game_loop import GameLoop
+from game.benchmark import InputScript, percentiles
+from game.model.world import World
+from game.model.difficulty import Difficulty
+from game.model.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+DEFAULT_COUNTS = [10, 30, 100, 300, 1000, 3000, 10000]
+SPEED_RANGE = (0.5, 3.0)
+
+
+def _swarm_difficulty(count, min_gap, collisions="off", motion="step"):
+    name = Difficulty.register(f"SWARM{count}", (count, count), SPEED_RANGE, min_gap=min_gap,
+                               prize_collisions=collisions, prize_motion=motion)
+    return Difficulty(name)
+
+
+def bench_count(game_loop, count, ticks, frames, min_gap=0, seed=1234, collisions="off", motion="step"):
+    """
+    Mede uma quantidade de prêmios reaproveitando o GameLoop (as texturas são
+    carregadas uma única vez); só o mundo é recriado.
+    """
+    random.seed(seed)
+    difficulty = _swarm_difficulty(count, min_gap, collisions, motion)
+
+    t0 = time.perf_counter()
+    game_loop.world = World(SCREEN_WIDTH, SCREEN_HEIGHT, difficulty, clock=game_loop.clock)
+    world_ms = (time.perf_counter() - t0) * 1000.0
+    game_loop.initial_snapshot = game_loop.world.snapshot()
+    game_loop.restart()
+    # A partida não termina por tempo durante a medição
+    game_loop.duration = float("inf")
+
+    script = InputScript()
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        for event in script.next_frame(game_loop.world):
+            game_loop.handle_input(event)
+        game_loop.update(script.keys)
+    sim_s = time.perf_counter() - t0
+
+    screen = pygame.display.get_surface()
+    game_loop.render(screen)  # aquecimento (sprites do desenho em lote)
+    frame_ms = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        game_loop.render(screen)
+        frame_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    return {
+        "prizes": count,
+        "collisions": collisions,
+        "motion": motion,
+        "world_init_ms": round(world_ms, 3),
+        "ticks": ticks,
+        "ticks_per_s": round(ticks / sim_s, 1) if sim_s > 0 else None,
+        "tick_ms": round(sim_s * 1000.0 / ticks, 4) if ticks else None,
+        "render_ms": percentiles(frame_ms),
+    }
+
+
+def _cell(value, width, fmt):
+    """Célula da tabela; '-' para medidas não feitas (ex.: --frames 0)."""
+    return f"{'-' if value is None else format(value, fmt):>{width}}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escala com enxames de gabrielzitos")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+                        help="Quantidades de prêmios a medir")
+    parser.add_argument("--ticks", type=int, default=600, help="Ticks de simulação por quantidade")
+    parser.add_argument("--frames", type=int, default=20, help="Frames renderizados por quantidade")
+    parser.add_argument("--min-gap", type=int, default=0, help="Distância mínima entre prêmios (px)")
+    parser.add_argument("--collisions", choices=Difficulty.PRIZE_COLLISION_MODES, default="off",
+                        help="Colisões entre prêmios (sweep-and-prune)")
+    parser.add_argument("--motion", choices=Difficulty.PRIZE_MOTION_MODES, default="step",
+                        help="Modelo de movimento dos prêmios")
+    parser.add_argument("--json", help="Salva resultados em JSON")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game_loop = GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, Difficulty("EASY"), clock=SimulatedClock())
+
+    results = []
+    print(f"{'prêmios':>8} {'init ms':>9} {'ticks/s':>10} {'tick ms':>9} {'frame p50':>10} {'frame p95':>10}")
+    for count in args.counts:
+        r = bench_count(game_loop, count, args.ticks, args.frames, args.min_gap, collisions=args.collisions, motion=args.motion)
+        results.append(r)
+        print(f"{r['prizes']:>8} {r['world_init_ms']:>9.2f} {_cell(r['ticks_per_s'], 10, '.0f')} "
+              f"{_cell(r['tick_ms'], 9, '.4f')} {_cell(r['render_ms']['p50'], 10, '.2f')} "
+              f"{_cell(r['render_ms']['p95'], 10, '.2f')}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"pygame": pygame.version.ver, "results": results}, f, indent=2)
+            f.write("\n")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
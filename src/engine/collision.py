@@ -1,3 +1,4 @@
+import numpy as np
 from game.audio_manager import play_audio
 
 def point_in_box(px, py, box):
@@ -5,25 +6,119 @@ def point_in_box(px, py, box):
     x, y, w, h = box
     return x <= px <= x + w and y <= py <= y + h
 
-def simple_grab(claw, prize):
-    """Detecta colisão entre garra e prêmio, prendendo-o se houver contato."""
-    # Se a garra não estiver fechada, não pega nada
+class SortedAxisIndex:
+    """
+    Broad phase 1-D: índices dos objetos ordenados pela coordenada X.
+
+    Guarda uma referência ao array de posições (atualizado no lugar pelo
+    dono, que chama `refresh()` depois de mover os objetos) e a ordem do
+    último `refresh()`. Como os objetos se movem pouco entre ticks, a ordem
+    anterior já está quase ordenada e a reordenação (timsort,
+    `kind="stable"`) custa perto de O(n). Consultas de intervalo usam busca
+    binária: O(log n + k).
+    """
+
+    def __init__(self, xs):
+        self.xs = xs
+        self.order = np.argsort(xs, kind="stable")
+        self.sorted_xs = xs[self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def refresh(self):
+        """Reordena a partir da ordem anterior (coerência temporal)."""
+        keys = self.xs[self.order]
+        perm = np.argsort(keys, kind="stable")
+        self.order = self.order[perm]
+        self.sorted_xs = keys[perm]
+
+    def query(self, x_min, x_max):
+        """Índices dos objetos com x_min <= x <= x_max (em ordem de X)."""
+        lo = np.searchsorted(self.sorted_xs, x_min, side="left")
+        hi = np.searchsorted(self.sorted_xs, x_max, side="right")
+        return self.order[lo:hi]
+
+
+def points_in_box(index, ys, box):
+    """
+    Índices de todos os pontos dentro da caixa (x, y, w, h): o índice
+    ordenado dá os candidatos em X e um teste vetorizado filtra os de Y.
+    """
+    x, y, w, h = box
+    candidates = index.query(x, x + w)
+    candidate_ys = ys[candidates]
+    return candidates[(candidate_ys >= y) & (candidate_ys <= y + h)]
+
+
+def grab_prizes(claw, prizes, index):
+    """
+    Prende, se a garra estiver fechada, todos os prêmios livres do PrizeArray
+    dentro da hitbox dela (tocando "me-solta") em uma única consulta ao índice,
+    O(log n + k) com o índice já em dia (World.update_prizes o reordena a
+    cada tick). Retorna os índices dos prêmios presos.
+    """
     if not claw.is_closed:
-        return False
-        
-    # Se o prêmio já estiver capturado ou sendo segurado, ignora
-    if prize.captured or prize.being_held:
-        return False
-
-    grab_box = claw.get_grab_hitbox()
-    grabbed = point_in_box(prize.x, prize.y, grab_box)
-    
-    if grabbed:
-        # Prende o prêmio, mas não captura ainda
-        prize.attach() 
+        return np.empty(0, dtype=np.intp)
+
+    hits = points_in_box(index, prizes.y, claw.get_grab_hitbox())
+    grabbed = prizes.attach(hits)
+    if len(grabbed):
         try:
             play_audio("me-solta")
         except Exception:
             pass
-            
-    return grabbed
\ No newline at end of file
+    return grabbed
+
+def track_contacts(index, velocities, active, min_dist):
+    """
+    Sweep-and-prune 1-D: pares de objetos ativos vizinhos na ordem de X que
+    estão a menos de `min_dist` e se aproximando (velocidade do da esquerda
+    maior que a do da direita).
+
+    Numa reta basta testar vizinhos: se dois objetos se sobrepõem, todos os
+    que estão entre eles também se sobrepõem aos vizinhos. Com a ordem já
+    atualizada pelo dono do índice, a varredura é O(n).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Índices da esquerda e da direita de cada par.
+    """
+    mask = active[index.order]
+    order = index.order[mask]
+    xs = index.sorted_xs[mask]
+    vs = velocities[order]
+    hits = np.flatnonzero((np.diff(xs) < min_dist) & (vs[:-1] > vs[1:]))
+    return order[hits], order[hits + 1]
+
+
+def resolve_prize_collisions(prizes, index, mode="reverse"):
+    """
+    Colisões entre gabrielzitos livres na linha do chão (PrizeArray).
+
+    Modos:
+        "reverse"  - cada um do par volta para o seu lado (esquerdo vai para
+                     a esquerda, direito para a direita);
+        "exchange" - trocam velocidade e direção (choque elástico, massas iguais).
+
+    Só pares que se aproximam são resolvidos, então prêmios sobrepostos que já
+    estão se separando não ficam grudados. O índice deve estar em dia com as
+    posições (ver World.update_prizes). Retorna os índices dos prêmios que
+    mudaram de velocidade.
+    """
+    active = ~prizes.captured & ~prizes.being_held
+    left, right = track_contacts(index, prizes.speed * prizes.direction, active, prizes.size)
+    if not len(left):
+        return left
+
+    if mode == "exchange":
+        # Um prêmio espremido entre dois pares troca só com o da esquerda;
+        # o outro par é resolvido num tick seguinte
+        chained = np.zeros(len(left), dtype=bool)
+        chained[1:] = left[1:] == right[:-1]
+        left, right = left[~chained], right[~chained]
+        prizes.speed[left], prizes.speed[right] = prizes.speed[right], prizes.speed[left]
+        prizes.direction[left], prizes.direction[right] = prizes.direction[right], prizes.direction[left]
+    else:
+        prizes.direction[left] = -1
+        prizes.direction[right] = 1
+    return np.concatenate((left, right))
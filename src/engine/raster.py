@@ -143,6 +143,7 @@ def paintTexturedPolygon(
     tex_w,
     tex_h,
     method="standard",
+    rows=None,
 ):
     """
     Optimized version using Direct Memory Access (PixelArray) and Texture Matrices.
@@ -154,11 +155,15 @@ def paintTexturedPolygon(
         texture_matrix: list of lists containing colors (pre-loaded texture)
         tex_w, tex_h: int (dimensions of the texture)
         method: 'standard' or 'tiling'
+        rows: optional (first, end) scanline range; the polygon is drawn in
+            parts with identical output (incremental loading)
     """
     # Extrai coordenadas Y para definir o range do scanline
     y_values = [v[1] for v in vertices_uv]
     y_min = max(0, int(min(y_values)))
     y_max = min(screen_h, int(max(y_values)))
+    if rows is not None:
+        y_min, y_max = max(y_min, rows[0]), min(y_max, rows[1])
 
     # Pré-cálculo de limites para evitar lookups repetidos
     tex_w_max = tex_w - 1
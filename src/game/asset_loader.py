@@ -0,0 +1,266 @@
+"""
+Carga paralela das texturas (PNG -> matriz de cores do engine).
+
+Em vez de `pygame.image.load` + um `get_at` por pixel, uma imagem de cada vez,
+o registro envia cada textura do manifesto para um pool de threads:
+
+- decodificação com Pillow (libera o GIL enquanto descomprime o PNG);
+- conversão para o formato do engine (matriz [x][y] de tuplas RGBA) via
+  NumPy: cada coluna vira tuplas com `zip` dos canais, sem chamada por pixel.
+  O coletor de ciclos fica pausado durante o lote: os milhões de tuplas
+  novas o disparariam várias vezes (dobrava o tempo de conversão), e tuplas
+  de inteiros não formam ciclos.
+
+As texturas ficam no registro (`assets`) pelo caminho, então o Menu e o
+GameLoop pedem só o que falta. `report()` traz os tempos de cada asset
+(decodificação, conversão) e do lote, além das etapas medidas com
+`measure()` (ex.: pré-renderização dos fundos), para enxergar o caminho
+crítico da inicialização.
+
+`load_steps()` é a versão incremental (para plataformas sem thread de
+carga): roda na thread atual e para após cada passo (um PNG decodificado ou
+CONVERT_COLUMNS colunas convertidas), para o chamador intercalar com frames.
+
+Sem Pillow, a decodificação cai para `pygame.image.load` (mesmo resultado).
+"""
+import gc
+import os
+import time
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # decodifica com pygame
+    Image = None
+
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets"))
+
+# Manifestos (caminhos relativos a assets/)
+GAME_BACKGROUNDS = ("pelourinho.png", "pelourinho-ufo.png", "pelourinho-mocking-lens.png")
+PRIZE_FRAMES = tuple(f"gabrielzito/movement/step{i}.png" for i in range(1, 13))
+GAME_TEXTURES = GAME_BACKGROUNDS + PRIZE_FRAMES + (
+    "gabrielzito/mocking/gabriel-mocking4.png",
+    "gabrielzito/caught/gabriel-caught3.png",
+    "ufo.png", "cable.png", "claw.png", "claw_open.png",
+)
+MENU_TEXTURES = (
+    "gabrielzito/mocking/gabriel-mocking4.png",
+    "ufo.png",
+    "gabrielzito/gabriel-front.png",
+    "gabrielzito/gabriel-side.png",
+)
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Colunas convertidas por passo de `load_steps` (~2 ms num fundo 800x600)
+CONVERT_COLUMNS = 16
+
+
+def asset_path(name):
+    """Caminho absoluto de um asset (nome relativo a assets/ ou caminho absoluto)."""
+    return name if os.path.isabs(name) else os.path.normpath(os.path.join(ASSETS_DIR, name))
+
+
+def decode_png(path):
+    """Decodifica a imagem em um array (largura, altura, 4) RGBA uint8."""
+    if Image is not None:
+        with Image.open(path) as image:
+            pixels = np.asarray(image.convert("RGBA"))
+        return pixels.transpose(1, 0, 2)
+    import pygame
+    surf = pygame.image.load(path)
+    rgb = pygame.surfarray.array3d(surf)
+    try:
+        alpha = pygame.surfarray.array_alpha(surf)
+    except ValueError:
+        alpha = np.full(rgb.shape[:2], 255, dtype=np.uint8)
+    return np.dstack((rgb, alpha))
+
+
+def pixels_to_matrix(pixels):
+    """Array (w, h, 4) -> (matriz [x][y] de tuplas RGBA, w, h), o formato do engine."""
+    w, h = pixels.shape[:2]
+    channels = [pixels[..., c].tolist() for c in range(4)]
+    return [list(zip(r, g, b, a)) for r, g, b, a in zip(*channels)], w, h
+
+
+def png_width(path):
+    """Largura lida do cabeçalho IHDR do PNG (sem decodificar); 0 se não for PNG."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return 0
+    if header[:8] != b"\x89PNG\r\n\x1a\n":
+        return 0
+    return struct.unpack(">I", header[16:20])[0]
+
+
+def _load_one(path):
+    start = time.perf_counter()
+    pixels = decode_png(path)
+    decoded = time.perf_counter()
+    texture = pixels_to_matrix(pixels)
+    done = time.perf_counter()
+    return texture, {
+        "decode_ms": round((decoded - start) * 1000.0, 2),
+        "convert_ms": round((done - decoded) * 1000.0, 2),
+        "thread": threading.current_thread().name,
+    }
+
+
+@contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class AssetRegistry:
+    """
+    Texturas carregadas, por caminho, com tempos de carga.
+
+    Args:
+        workers (int): Threads do pool (0 ou 1 = carga sequencial na thread atual).
+        debug (bool): Se True, imprime o relatório de cada lote.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, debug=False):
+        self.workers = workers
+        self.debug = debug
+        self.textures = {}     # caminho absoluto -> (matriz, w, h)
+        self.timings = {}      # nome -> tempos da carga
+        self.stages = {}       # etapa medida com measure() -> ms
+        self.batches = []      # [{"assets", "workers", "wall_ms"}]
+        self._lock = threading.Lock()
+
+    def load(self, names):
+        """
+        Carrega (em paralelo) as texturas de `names` que ainda não estão no
+        registro. Erros de um asset são impressos e não interrompem o lote.
+        """
+        with self._lock:
+            pending = list(dict.fromkeys(n for n in names if asset_path(n) not in self.textures))
+        if not pending:
+            return
+        start = time.perf_counter()
+        paths = [asset_path(n) for n in pending]
+        with gc_paused():
+            if self.workers > 1 and len(pending) > 1:
+                with ThreadPoolExecutor(min(self.workers, len(pending)), thread_name_prefix="asset") as pool:
+                    futures = [pool.submit(_load_one, p) for p in paths]
+                    results = [self._result(n, f.result) for n, f in zip(pending, futures)]
+            else:
+                results = [self._result(n, lambda p=p: _load_one(p)) for n, p in zip(pending, paths)]
+        wall_ms = (time.perf_counter() - start) * 1000.0
+
+        with self._lock:
+            for name, path, result in zip(pending, paths, results):
+                if result is not None:
+                    self.textures[path], self.timings[name] = result
+        self.batches.append({"assets": len(pending), "workers": self.workers, "wall_ms": round(wall_ms, 2)})
+        if self.debug:
+            self.print_report(pending)
+
+    def plan_steps(self, names, columns=CONVERT_COLUMNS):
+        """Quantos passos `load_steps(names)` vai dar (para a barra de progresso)."""
+        steps = 0
+        for name in dict.fromkeys(names):
+            path = asset_path(name)
+            if path not in self.textures:
+                steps += 1 + -(-png_width(path) // columns)
+        return steps
+
+    def load_steps(self, names, columns=CONVERT_COLUMNS):
+        """
+        Carga incremental das texturas de `names` na thread atual: gerador que
+        dá um `yield` depois de cada passo (decodificar um PNG, que não se
+        divide, ou converter `columns` colunas).
+        """
+        for name in dict.fromkeys(names):
+            path = asset_path(name)
+            if path in self.textures:
+                continue
+            start = time.perf_counter()
+            try:
+                pixels = decode_png(path)
+            except (OSError, ValueError) as e:
+                print(f"Erro ao carregar textura '{name}': {e}")
+                yield
+                continue
+            decode_ms = (time.perf_counter() - start) * 1000.0
+            yield
+
+            w, h = pixels.shape[:2]
+            matrix = []
+            convert_ms = 0.0
+            for x in range(0, w, columns):
+                start = time.perf_counter()
+                matrix.extend(pixels_to_matrix(pixels[x:x + columns])[0])
+                convert_ms += (time.perf_counter() - start) * 1000.0
+                yield
+            with self._lock:
+                self.textures[path] = (matrix, w, h)
+                self.timings[name] = {"decode_ms": round(decode_ms, 2), "convert_ms": round(convert_ms, 2),
+                                      "thread": "incremental"}
+
+    def _result(self, name, get):
+        try:
+            return get()
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar textura '{name}': {e}")
+            return None
+
+    def texture(self, name):
+        """(matriz, w, h) de `name`, carregando na hora se não estiver no registro."""
+        path = asset_path(name)
+        if path not in self.textures:
+            self.load([name])
+        return self.textures[path]
+
+    def release(self, names):
+        """Descarta texturas que não serão mais usadas (ex.: fundos já pré-renderizados)."""
+        with self._lock:
+            for name in names:
+                self.textures.pop(asset_path(name), None)
+
+    @contextmanager
+    def measure(self, stage):
+        """Mede uma etapa da carga fora do pool (entra no relatório)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage] = round((time.perf_counter() - start) * 1000.0, 2)
+
+    def report(self):
+        """Tempos por asset (mais lento primeiro), por lote e das etapas medidas."""
+        assets = sorted(self.timings.items(), key=lambda item: -(item[1]["decode_ms"] + item[1]["convert_ms"]))
+        return {
+            "assets": [dict(name=name, **t) for name, t in assets],
+            "batches": self.batches,
+            "stages": self.stages,
+            "total_wall_ms": round(sum(b["wall_ms"] for b in self.batches) + sum(self.stages.values()), 2),
+        }
+
+    def print_report(self, names=None):
+        names = self.timings if names is None else names
+        for name in names:
+            t = self.timings.get(name)
+            if t:
+                print(f"  {name:<45} decode {t['decode_ms']:>7.2f} ms  conversão {t['convert_ms']:>7.2f} ms  [{t['thread']}]")
+        if self.batches:
+            b = self.batches[-1]
+            print(f"Texturas: {b['assets']} em {b['wall_ms']:.1f} ms ({b['workers']} threads)")
+
+
+# Registro compartilhado (Menu e GameLoop)
+assets = AssetRegistry()
@@ -1,9 +1,53 @@
 """
 Audio management system for Claw Machine Game.
 Handles background music and sound effects playback.
+
+Sound effects go through a shared `SoundBank`: each OGG file is decoded once
+(at startup, in the background, or on first use) and the resulting
+`pygame.mixer.Sound` is reused on every play, on a small pool of reserved
+mixer channels with per-effect and total voice caps.
+
+Decoded PCM is also cached on disk (`.cache/pcm/`), keyed by a hash of the
+source file and the mixer format (rate, sample size, channels). Warm starts
+build the Sound straight from the memory-mapped PCM, skipping the OGG decoder;
+a different source file or mixer format simply maps to a different cache file.
+
+Mixer initialization is configured here too (`configure_mixer`, called before
+`pygame.init()`), with presets trading latency for CPU, and an optional
+`LatencyProbe` measures input-to-sound latency per effect.
+
+Playback goes through a pluggable backend: `PygameAudio` (the real mixer) or
+`NullAudio`, which plays nothing and only records which sounds would have
+played and when. The null backend is selected automatically when there is no
+audio device (or the SDL "dummy" audio driver is in use, as in headless runs,
+replays and benchmarks), or explicitly with `select_backend(null=True)`.
 """
 import pygame
 import os
+import mmap
+import time
+import hashlib
+import threading
+from collections import deque
+from game.profiler import profiler
+
+# Decoded PCM cache (project root/.cache/pcm)
+PCM_CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              "..", "..", ".cache", "pcm"))
+
+# Effects preloaded at startup (assets/audio/<name>.ogg)
+SOUND_EFFECTS = ("homens-verde", "me-solta", "vai-comendo", "ufo")
+
+# Mixer presets: frequency (Hz), size (bits, negative = signed), channels and
+# buffer (samples per callback; smaller = lower latency, more wakeups)
+MIXER_PRESETS = {
+    "default": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512},
+    "low-latency": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 128},
+    "low-cpu": {"frequency": 22050, "size": -16, "channels": 1, "buffer": 2048},
+}
+
+# Settings passed to pygame.mixer.pre_init by configure_mixer
+mixer_settings = dict(MIXER_PRESETS["default"])
 
 
 def _resolve_audio_path(filename):
@@ -14,6 +58,40 @@ def _resolve_audio_path(filename):
     return os.path.normpath(audio_path)
 
 
+def configure_mixer(preset="default", frequency=None, buffer=None, channels=None):
+    """
+    Configures the mixer through pygame.mixer.pre_init. Must be called before
+    pygame.init() (or pygame.mixer.init()) to take effect.
+
+    Args:
+        preset (str): Key of MIXER_PRESETS ("default", "low-latency", "low-cpu").
+        frequency (int): Overrides the preset sample rate (Hz).
+        buffer (int): Overrides the preset buffer size (samples, power of two).
+        channels (int): Overrides the preset channel count (1 = mono, 2 = stereo).
+
+    Returns:
+        dict: The settings applied.
+    """
+    if preset not in MIXER_PRESETS:
+        print(f"Warning: Unknown audio preset '{preset}'. Using default.")
+        preset = "default"
+    settings = dict(MIXER_PRESETS[preset])
+    for key, value in (("frequency", frequency), ("buffer", buffer), ("channels", channels)):
+        if value is not None:
+            settings[key] = int(value)
+    pygame.mixer.pre_init(**settings)
+    mixer_settings.clear()
+    mixer_settings.update(settings)
+    return settings
+
+
+def output_latency_ms():
+    """Latency added by one mixer buffer (ms), from the actual mixer rate."""
+    init = pygame.mixer.get_init()
+    frequency = init[0] if init else mixer_settings["frequency"]
+    return mixer_settings["buffer"] * 1000.0 / frequency
+
+
 def play_soundtrack(volume=0.5):
     """
     Plays the main game soundtrack (soundtrack.ogg) in an infinite loop.
@@ -26,15 +104,342 @@ def play_soundtrack(volume=0.5):
         Plays at 1x speed (pygame doesn't support speed adjustment).
         To play at different speeds, pre-process the audio file externally.
     """
-    soundtrack_path = _resolve_audio_path("soundtrack.ogg")
-    
-    # Stop any currently playing music
-    pygame.mixer.music.stop()
-    
-    # Load and play
-    pygame.mixer.music.load(soundtrack_path)
-    pygame.mixer.music.set_volume(volume)
-    pygame.mixer.music.play(-1)  # -1 = loop indefinitely
+    get_backend().play_soundtrack(volume)
+
+
+class SoundBank:
+    """
+    Cache of decoded sound effects with a reserved channel pool.
+
+    Args:
+        names (tuple[str]): Effects decoded by `preload()`.
+        channels (int): Mixer channels reserved for effects (total voice cap).
+        max_voices (int): Simultaneous voices of the same effect. When the
+            cap is reached, the oldest voice of that effect is restarted.
+        cache_dir (str): Decoded PCM cache directory (None disables it).
+
+    Notes:
+        - The pool is reserved with `pygame.mixer.set_reserved`, so automatic
+          channel selection (and other code) never steals these channels
+        - When every channel is busy, the oldest voice is cut
+        - `stats()` reports hits, misses and load time per effect, and
+          whether it came from the PCM cache or the OGG decoder
+    """
+
+    def __init__(self, names=SOUND_EFFECTS, channels=4, max_voices=2, cache_dir=PCM_CACHE_DIR):
+        self.names = tuple(names)
+        self.num_channels = channels
+        self.max_voices = max_voices
+        self.cache_dir = cache_dir
+        self.sounds = {}        # name -> pygame.mixer.Sound (None if missing/broken)
+        self.decode_ms = {}     # name -> load time (PCM cache or OGG decode)
+        self.sources = {}       # name -> "pcm" or "ogg"
+        self.hits = 0
+        self.misses = 0
+        self.pool = None        # reserved channels (created on first play)
+        self.voices = []        # per channel: (name, start order) or None
+        self._order = 0
+        self._lock = threading.Lock()
+        self._loader = None
+
+    def preload(self, background=False):
+        """
+        Decodes every effect in `names`. With `background=True`, decoding runs
+        on a daemon thread and `play()` decodes on demand anything not ready yet.
+        """
+        if background:
+            self._loader = threading.Thread(target=self.preload, name="sound-preload", daemon=True)
+            self._loader.start()
+            return
+        for name in self.names:
+            self._load(name)
+
+    def _load(self, name):
+        """Decodes `name` once (thread-safe). Returns the Sound or None."""
+        with self._lock:
+            if name in self.sounds:
+                return self.sounds[name]
+            audio_path = _resolve_audio_path(f"{name}.ogg")
+            sound = None
+            if not os.path.exists(audio_path):
+                print(f"Warning: Audio file not found: {audio_path}")
+            else:
+                start = time.perf_counter()
+                try:
+                    sound = self._decode(name, audio_path)
+                except pygame.error as e:
+                    print(f"Error loading audio '{name}': {e}")
+                self.decode_ms[name] = (time.perf_counter() - start) * 1000.0
+            self.sounds[name] = sound
+            return sound
+
+    def _cache_path(self, name, audio_path):
+        """PCM cache file for `name`: source hash + current mixer format."""
+        frequency, size, channels = pygame.mixer.get_init()
+        digest = hashlib.sha1()
+        with open(audio_path, "rb") as f:
+            digest.update(f.read())
+        key = f"{digest.hexdigest()[:16]}-{frequency}-{size}-{channels}"
+        return os.path.join(self.cache_dir, f"{name}-{key}.pcm")
+
+    def _decode(self, name, audio_path):
+        """Sound from the PCM cache if present; otherwise decodes the OGG and fills the cache."""
+        if not self.cache_dir or not pygame.mixer.get_init():
+            self.sources[name] = "ogg"
+            return pygame.mixer.Sound(audio_path)
+
+        cache_path = self._cache_path(name, audio_path)
+        try:
+            if os.path.getsize(cache_path) > 0:
+                with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pcm:
+                    sound = pygame.mixer.Sound(buffer=pcm)
+                self.sources[name] = "pcm"
+                return sound
+        except (OSError, ValueError):
+            pass  # Missing or unreadable: decode again
+
+        sound = pygame.mixer.Sound(audio_path)
+        self.sources[name] = "ogg"
+        self._store(name, cache_path, sound.get_raw())
+        return sound
+
+    def _store(self, name, cache_path, raw):
+        """Writes the PCM atomically and removes stale entries of the same effect."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, cache_path)
+            for entry in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, entry)
+                if entry.startswith(f"{name}-") and entry.endswith(".pcm") and path != cache_path:
+                    os.remove(path)
+        except OSError as e:
+            print(f"Warning: could not write PCM cache for '{name}': {e}")
+
+    def get(self, name):
+        """Returns the decoded Sound for `name` (decoding it on a miss)."""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            self.hits += 1
+            return sound
+        self.misses += 1
+        return self._load(name)
+
+    def _init_pool(self):
+        count = self.num_channels
+        if pygame.mixer.get_num_channels() < count:
+            pygame.mixer.set_num_channels(count)
+        pygame.mixer.set_reserved(count)
+        self.pool = [pygame.mixer.Channel(i) for i in range(count)]
+        self.voices = [None] * count
+
+    def _pick_channel(self, name):
+        """Channel for a new voice of `name`, respecting the voice caps."""
+        same = [i for i, v in enumerate(self.voices)
+                if v is not None and v[0] == name and self.pool[i].get_busy()]
+        if len(same) >= self.max_voices:
+            return min(same, key=lambda i: self.voices[i][1])
+        for i, channel in enumerate(self.pool):
+            if not channel.get_busy():
+                return i
+        return min(range(len(self.pool)), key=lambda i: self.voices[i][1] if self.voices[i] else -1)
+
+    def play(self, name, volume=1.0):
+        """Plays `name` once on the reserved pool. Returns the Channel or None."""
+        sound = self.get(name)
+        if sound is None:
+            return None
+        if self.pool is None:
+            self._init_pool()
+        index = self._pick_channel(name)
+        channel = self.pool[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self._order += 1
+        self.voices[index] = (name, self._order)
+        return channel
+
+    def cache_stats(self):
+        """(hits, misses), in the format of `FrameMetrics.register_cache`."""
+        return self.hits, self.misses
+
+    def stats(self):
+        """Hits, misses and decode time (total and per effect, in ms)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "decode_ms_total": round(sum(self.decode_ms.values()), 3),
+            "decode_ms": {name: round(ms, 3) for name, ms in self.decode_ms.items()},
+            "sources": dict(self.sources),
+        }
+
+
+class LatencyProbe:
+    """
+    Input-to-sound latency instrumentation (main.py --audio-latency).
+
+    Timestamps the last input event, the play_audio call and the moment the
+    sound is started on its channel. The audible latency is estimated as
+    input -> call -> channel start + one mixer buffer (`output_latency_ms`).
+
+    A play_audio call is attributed to the last input event if it happens
+    within INPUT_WINDOW_MS; sounds not triggered by input (e.g. time-out)
+    only count towards call -> start.
+    """
+
+    INPUT_WINDOW_MS = 1000.0
+
+    def __init__(self):
+        self.last_input = None
+        self.samples = []   # (name, input -> call ms or None, call -> start ms)
+
+    def input_event(self):
+        self.last_input = time.perf_counter()
+
+    def record(self, name, call_time, start_time):
+        input_ms = None
+        if self.last_input is not None:
+            elapsed = (call_time - self.last_input) * 1000.0
+            if elapsed <= self.INPUT_WINDOW_MS:
+                input_ms = elapsed
+                self.last_input = None
+        self.samples.append((name, input_ms, (start_time - call_time) * 1000.0))
+
+    def report(self):
+        """Latency distributions (p50/p95/p99/max in ms) and the mixer settings."""
+        from game.benchmark import percentiles
+        buffer_ms = output_latency_ms()
+        input_ms = [s[1] for s in self.samples if s[1] is not None]
+        start_ms = [s[2] for s in self.samples]
+        total_ms = [s[1] + s[2] + buffer_ms for s in self.samples if s[1] is not None]
+        by_sound = {}
+        for name, _, _ in self.samples:
+            by_sound[name] = by_sound.get(name, 0) + 1
+        return {
+            "mixer": dict(mixer_settings, actual=pygame.mixer.get_init()),
+            "buffer_ms": round(buffer_ms, 3),
+            "sounds": by_sound,
+            "input_to_call_ms": percentiles(input_ms),
+            "call_to_start_ms": percentiles(start_ms),
+            "input_to_output_ms": percentiles(total_ms),
+        }
+
+
+# Shared bank used by the pygame backend
+sound_bank = SoundBank()
+
+
+class PygameAudio:
+    """Real backend: pygame.mixer.music for the soundtrack, `sound_bank` for effects."""
+
+    name = "pygame"
+
+    def play_soundtrack(self, volume):
+        soundtrack_path = _resolve_audio_path("soundtrack.ogg")
+
+        # Stop any currently playing music
+        pygame.mixer.music.stop()
+
+        # Load and play
+        pygame.mixer.music.load(soundtrack_path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1)  # -1 = loop indefinitely
+
+    def stop_soundtrack(self, fadeout_ms):
+        pygame.mixer.music.fadeout(fadeout_ms)
+
+    def play(self, name, volume):
+        return sound_bank.play(name, volume)
+
+
+class NullAudio:
+    """
+    Backend without sound for headless and batch runs.
+
+    Nothing is decoded or mixed; each request is recorded as
+    (time_ms, name, volume) in `played` (the soundtrack as "soundtrack").
+    Time comes from `clock.get_ticks()` if a clock is given (e.g. the
+    SimulatedClock of a headless run), otherwise ms since the backend was created.
+
+    Args:
+        clock (RealClock | SimulatedClock): Optional time source.
+        maxlen (int): Most recent requests kept in `played`.
+    """
+
+    name = "null"
+
+    def __init__(self, clock=None, maxlen=4096):
+        self.clock = clock
+        self.played = deque(maxlen=maxlen)
+        self.counts = {}                # name -> total requests
+        self.soundtrack_volume = None   # volume if the soundtrack is "playing"
+        self._start = time.perf_counter()
+
+    def _now(self):
+        if self.clock is not None:
+            return self.clock.get_ticks()
+        return (time.perf_counter() - self._start) * 1000.0
+
+    def _record(self, name, volume):
+        self.played.append((self._now(), name, volume))
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def play_soundtrack(self, volume):
+        self.soundtrack_volume = volume
+        self._record("soundtrack", volume)
+
+    def stop_soundtrack(self, fadeout_ms):
+        self.soundtrack_volume = None
+
+    def play(self, name, volume):
+        self._record(name, volume)
+        return None
+
+
+_backend = None
+
+
+def audio_available():
+    """True if there is a real audio device behind an initialized mixer."""
+    return os.environ.get("SDL_AUDIODRIVER") != "dummy" and pygame.mixer.get_init() is not None
+
+
+def select_backend(null=False, clock=None):
+    """
+    Chooses the playback backend (call after pygame.init()). Uses NullAudio
+    when `null` is True or no audio device is available; in that case the
+    mixer is shut down so it does not keep mixing silence.
+
+    Returns:
+        PygameAudio | NullAudio: The selected backend.
+    """
+    global _backend
+    if null or not audio_available():
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        _backend = NullAudio(clock)
+    else:
+        _backend = PygameAudio()
+    return _backend
+
+
+def get_backend():
+    """Current backend (selected automatically on first use)."""
+    if _backend is None:
+        select_backend()
+    return _backend
+
+# Latency instrumentation (None = off; see enable_latency_probe)
+latency_probe = None
+
+
+def enable_latency_probe():
+    """Turns on input-to-sound latency measurement. Returns the probe."""
+    global latency_probe
+    latency_probe = LatencyProbe()
+    return latency_probe
 
 
 def play_audio(name, volume=1.0):
@@ -47,30 +452,27 @@ def play_audio(name, volume=1.0):
         volume (float): Volume level (0.0 to 1.0). Default 1.0.
     
     Returns:
-        pygame.mixer.Channel: The channel playing the sound, or None if failed.
+        pygame.mixer.Channel: The channel playing the sound, or None if failed
+        (always None with the null backend).
     
     Example:
         play_audio("homens-verde")  # Plays assets/audio/homens-verde.ogg
         play_audio("me-solta", volume=0.8)
     
     Notes:
-        - Uses pygame.mixer.Sound for independent sound effect playback
+        - Reuses the decoded pygame.mixer.Sound from `sound_bank`
+          (the file is only decoded on the first play if not preloaded)
         - Does not interfere with background music
-        - Automatically finds available channel
+        - Plays on the bank's reserved channels, with voice caps
         - Sound plays once and stops (no looping)
     """
-    audio_path = _resolve_audio_path(f"{name}.ogg")
-    
-    # Check if file exists
-    if not os.path.exists(audio_path):
-        print(f"Warning: Audio file not found: {audio_path}")
-        return None
-    
+    profiler.mark("audio", sound=name)
     try:
-        # Load and play sound effect
-        sound = pygame.mixer.Sound(audio_path)
-        sound.set_volume(volume)
-        channel = sound.play()  # Play once
+        call_time = time.perf_counter()
+        with profiler.scope("audio"):
+            channel = get_backend().play(name, volume)
+        if latency_probe is not None and channel is not None:
+            latency_probe.record(name, call_time, time.perf_counter())
         return channel
     except pygame.error as e:
         print(f"Error playing audio '{name}': {e}")
@@ -84,4 +486,4 @@ def stop_soundtrack(fadeout_ms=1000):
     Args:
         fadeout_ms (int): Fade-out duration in milliseconds. Default 1000ms.
     """
-    pygame.mixer.music.fadeout(fadeout_ms)
+    get_backend().stop_soundtrack(fadeout_ms)
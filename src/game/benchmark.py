@@ -0,0 +1,213 @@
+"""
+Modo benchmark headless do loop principal (ativado com `--benchmark N` no main.py).
+
+Executa o menu, a transição menu -> jogo, N frames de gameplay e uma revanche
+em cada dificuldade, com input roteirizado (mover, descer, agarrar, subir) e
+clock sem limite de FPS. Os frames passam pelo mesmo `MainLoop.frame` do jogo
+(ver game/main_loop.py). Reporta percentis de tempo de frame por cena e por
+dificuldade.
+"""
+import json
+import math
+import time
+import pygame
+from game.model.difficulty import Difficulty
+from game.model.gamestate_enum import GameState
+from game.model.config import TARGET_FPS
+
+
+class ScriptedKeys:
+    """
+    Substituto de `pygame.key.get_pressed()` controlado pelo roteiro.
+    Suporta apenas o acesso por índice usado pelo jogo (keys[pygame.K_LEFT]).
+    """
+
+    def __init__(self):
+        self.held = set()
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class InputScript:
+    """
+    Roteiro de input cíclico para a gameplay:
+    move para um lado, desce a garra (ESPAÇO), agarra (ESPAÇO) e espera subir.
+    """
+
+    MOVE_FRAMES = 45   # frames segurando a seta antes de soltar a garra
+    DROP_FRAMES = 25   # frames descendo antes de tentar agarrar
+
+    def __init__(self):
+        self.keys = ScriptedKeys()
+        self.phase = "move"
+        self.phase_frames = 0
+        self.direction = pygame.K_RIGHT
+
+    def _key_event(self, key):
+        return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+    def next_frame(self, world):
+        """Avança o roteiro em um frame. Retorna a lista de eventos do frame."""
+        events = []
+        self.phase_frames += 1
+        self.keys.held.clear()
+
+        if self.phase == "move":
+            self.keys.held.add(self.direction)
+            if self.phase_frames >= self.MOVE_FRAMES:
+                events.append(self._key_event(pygame.K_SPACE))
+                self.phase, self.phase_frames = "drop", 0
+
+        elif self.phase == "drop":
+            if self.phase_frames >= self.DROP_FRAMES or world.state != GameState.DROP:
+                if world.state == GameState.DROP:
+                    events.append(self._key_event(pygame.K_SPACE))
+                self.phase, self.phase_frames = "lift", 0
+
+        elif self.phase == "lift":
+            # Espera a garra voltar ao topo (World volta para MOVE sozinho)
+            if world.state == GameState.MOVE:
+                self.direction = pygame.K_LEFT if self.direction == pygame.K_RIGHT else pygame.K_RIGHT
+                self.phase, self.phase_frames = "move", 0
+
+        return events
+
+
+def percentiles(samples_ms):
+    """Resumo p50/p95/p99/max (em ms) de uma lista de tempos de frame."""
+    if not samples_ms:
+        return {"frames": 0, "p50": None, "p95": None, "p99": None, "max": None, "mean": None}
+    ordered = sorted(samples_ms)
+    n = len(ordered)
+
+    def pick(p):
+        # Percentil por "nearest rank"
+        index = max(0, min(n - 1, math.ceil(p / 100.0 * n) - 1))
+        return round(ordered[index], 3)
+
+    return {
+        "frames": n,
+        "p50": pick(50),
+        "p95": pick(95),
+        "p99": pick(99),
+        "max": round(ordered[-1], 3),
+        "mean": round(sum(ordered) / n, 3),
+    }
+
+
+def _keydown(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class MainLoopBenchmark:
+    """
+    Roda o loop do main.py (`MainLoop.frame`) com eventos e teclas do roteiro
+    e clock sem limite de FPS, coletando tempos de frame por cena.
+
+    Em cada dificuldade: menu parado, JOGAR (cortina e construção do GameLoop
+    em segundo plano ou em fatias), N frames de gameplay, ESC e JOGAR de novo
+    (revanche: GameLoop do pool, via restart()) por REMATCH_FRAMES frames.
+    """
+
+    MENU_FRAMES = 120
+    REMATCH_FRAMES = 120
+    MAX_WAIT_FRAMES = 100000   # limite de espera pela entrada no jogo
+
+    SCENES = ("menu", "transition", "load", "game", "game_over", "rematch_load", "rematch_game")
+
+    def __init__(self, main_loop, frames, difficulties=None, debug=False):
+        self.loop = main_loop
+        self.frames = frames
+        self.difficulties = difficulties or Difficulty.get_available_difficulties()
+        self.debug = debug
+        self.clock = pygame.time.Clock()
+        self.tick_ms = 1000.0 / TARGET_FPS
+
+    def _frame(self, events=(), keys=None):
+        """Executa um frame do loop principal e retorna seu tempo em ms."""
+        # Intervalo do passo fixo como o clock.tick(TARGET_FPS) do jogo o daria
+        # (nunca menos de um tick), mas sem esperar: o FPS não é limitado
+        interval = max(self.clock.tick(), self.tick_ms)
+        t0 = time.perf_counter()
+        self.loop.frame(pygame.event.get() + list(events), interval, keys)
+        return (time.perf_counter() - t0) * 1000.0
+
+    def _scene(self):
+        """Cena do próximo frame, pelo estado do loop."""
+        loop = self.loop
+        if loop.current_state == GameState.MOVE:
+            return "game_over" if loop.game_loop.game_over else "game"
+        if loop.menu.is_transition_complete():
+            return "load"
+        return "transition" if loop.menu.transitioning else "menu"
+
+    def _enter_game(self, scenes, rematch=False):
+        """Seleciona JOGAR e roda frames até o GameLoop entrar em cena."""
+        menu = self.loop.menu
+        menu.selected_index = menu.options.index("JOGAR")
+        events = [_keydown(pygame.K_RETURN)]
+        for _ in range(self.MAX_WAIT_FRAMES):
+            if self.loop.current_state == GameState.MOVE:
+                return
+            scene = "rematch_load" if rematch else ("transition" if events else self._scene())
+            scenes[scene].append(self._frame(events))
+            events = ()
+        raise RuntimeError("Benchmark: o jogo não entrou em cena")
+
+    def _play(self, scenes, frames, rematch=False):
+        """Gameplay com o roteiro de input; termina com ESC (o GameLoop vai para o pool)."""
+        script = InputScript()
+        for _ in range(frames):
+            scene = "rematch_game" if rematch else self._scene()
+            scenes[scene].append(self._frame(script.next_frame(self.loop.game_loop.world), script.keys))
+        self._frame([_keydown(pygame.K_ESCAPE)])
+
+    def _run_difficulty(self, difficulty_name):
+        scenes = {name: [] for name in self.SCENES}
+
+        # Cena: MENU (parado, apenas animações), com um novo sorteio da dificuldade
+        self.loop.select_difficulty(difficulty_name)
+        for _ in range(self.MENU_FRAMES):
+            scenes["menu"].append(self._frame())
+
+        # JOGAR: cortina + construção do GameLoop (thread ou IncrementalLoader)
+        self._enter_game(scenes)
+        self._play(scenes, self.frames)
+
+        # Revanche: mesmo Difficulty, GameLoop do pool reiniciado com restart()
+        self._enter_game(scenes, rematch=True)
+        self._play(scenes, self.REMATCH_FRAMES, rematch=True)
+
+        return {name: percentiles(samples) for name, samples in scenes.items()}
+
+    def run(self):
+        """Executa todas as dificuldades e retorna o relatório como dicionário."""
+        screen = self.loop.screen
+        report = {
+            "frames_per_difficulty": self.frames,
+            "screen": list(screen.get_size()),
+            "pygame": pygame.version.ver,
+            "incremental_load": self.loop.loader is not None,
+            "difficulties": {},
+        }
+        for name in self.difficulties:
+            if self.debug:
+                print(f"Benchmark: {name}")
+            report["difficulties"][name] = self._run_difficulty(name)
+        return report
+
+
+def run_benchmark(main_loop, frames, output_path=None, debug=False):
+    """
+    Ponto de entrada usado pelo main.py (com o MainLoop do jogo).
+    Imprime o relatório JSON (ou salva em `output_path`) e o retorna.
+    """
+    report = MainLoopBenchmark(main_loop, frames, debug=debug).run()
+    text = json.dumps(report, indent=2)
+    if output_path:
+        with open(output_path, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
@@ -0,0 +1,45 @@
+"""
+Relógios injetáveis do jogo.
+
+O GameLoop e o World leem o tempo através de um relógio em vez de chamar
+`pygame.time.get_ticks()` diretamente:
+
+- RealClock: tempo real (comportamento normal do jogo);
+- SimulatedClock: tempo derivado da contagem de ticks de simulação, para
+  rodar partidas headless mais rápido que o tempo real.
+"""
+import pygame
+from game.model.config import TARGET_FPS
+
+
+class RealClock:
+    """Relógio de parede (milissegundos desde pygame.init())."""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+    def advance(self):
+        """No tempo real o relógio anda sozinho; nada a fazer por tick."""
+        pass
+
+
+class SimulatedClock:
+    """
+    Relógio simulado: cada tick de simulação vale `tick_ms` milissegundos.
+
+    Args:
+        tick_ms (float): Duração de um tick (padrão: 1/TARGET_FPS s).
+        start_ms (int): Tempo inicial.
+    """
+
+    def __init__(self, tick_ms=1000.0 / TARGET_FPS, start_ms=0):
+        self.tick_ms = tick_ms
+        self.start_ms = start_ms
+        self.ticks = 0
+
+    def get_ticks(self):
+        return int(self.start_ms + self.ticks * self.tick_ms)
+
+    def advance(self, ticks=1):
+        """Avança o relógio em `ticks` ticks de simulação."""
+        self.ticks += ticks
@@ -0,0 +1,66 @@
+"""
+Passo fixo de simulação desacoplado da renderização.
+
+A física do jogo (fricção do UFO, gravidade da garra, velocidade dos
+prêmios) é definida "por tick". Com um acumulador de tempo real, o loop
+principal executa sempre TARGET_FPS ticks por segundo, independente de
+quantos frames foram desenhados: frames pesados perdem quadros, mas o jogo
+não fica em câmera lenta.
+"""
+from game.model.config import TARGET_FPS
+
+
+class FixedTimestep:
+    """
+    Acumulador de tempo para simulação em passo fixo.
+
+    Args:
+        tick_ms (float): Duração de um tick de simulação (ms).
+        max_catchup (int): Máximo de ticks executados em um único frame.
+            Acima disso o atraso é descartado (evita a "espiral da morte").
+    """
+
+    def __init__(self, tick_ms=1000.0 / TARGET_FPS, max_catchup=5):
+        self.tick_ms = tick_ms
+        self.max_catchup = max_catchup
+        self.accumulator = 0.0
+        self.total_ticks = 0
+        self.dropped_ms = 0.0
+        self.discard_next = False
+
+    def advance(self, elapsed_ms):
+        """
+        Soma o tempo real decorrido e retorna quantos ticks devem rodar neste frame.
+        """
+        if self.discard_next:
+            # Intervalo que contém um carregamento: não vira ticks atrasados
+            self.discard_next = False
+            self.dropped_ms += elapsed_ms
+            return 0
+
+        self.accumulator += elapsed_ms
+        ticks = int(self.accumulator // self.tick_ms)
+
+        if ticks > self.max_catchup:
+            # Descarta o excesso, mantendo só a fração do tick atual
+            self.dropped_ms += (ticks - self.max_catchup) * self.tick_ms
+            ticks = self.max_catchup
+            self.accumulator %= self.tick_ms
+        else:
+            self.accumulator -= ticks * self.tick_ms
+
+        self.total_ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fração (0.0 a 1.0) entre o último tick e o próximo, para interpolar o desenho."""
+        return min(1.0, self.accumulator / self.tick_ms)
+
+    def reset(self):
+        """
+        Zera o acumulador e descarta o próximo intervalo medido.
+        Usar após carregamentos e trocas de cena.
+        """
+        self.accumulator = 0.0
+        self.discard_next = True
@@ -0,0 +1,128 @@
+"""
+Gravador de voo de frames lentos.
+
+Mantém em memória os últimos segundos de tempos por estágio e de eventos do
+jogo (ambos vindos do profiler, via `profiler.scope()` e `profiler.mark()`).
+Quando um frame passa do orçamento configurado, grava essa janela (e,
+opcionalmente, o perfil cProfile do frame culpado) em um arquivo com
+timestamp, para diagnóstico posterior.
+
+Ativado no main.py com `--flight-recorder [ORÇAMENTO_MS]` e `--flight-profile`.
+"""
+import io
+import os
+import json
+import time
+import pstats
+import cProfile
+from collections import deque
+from datetime import datetime
+
+
+def _default_dump_dir():
+    """Diretório padrão dos dumps: <raiz do projeto>/perf_dumps"""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(base_path, "..", "..", "perf_dumps"))
+
+
+class FlightRecorder:
+    """
+    Janela deslizante de frames + dump automático de estouros de orçamento.
+
+    Args:
+        profiler (FrameProfiler): Fonte dos tempos por estágio (a coleta é ligada aqui).
+        budget_ms (float): Orçamento de frame; acima disso o frame é considerado lento.
+        window_s (float): Quantos segundos de histórico manter em memória.
+        dump_dir (str): Diretório onde os dumps são gravados.
+        use_cprofile (bool): Se True, perfila cada frame e anexa o perfil do frame lento.
+        cooldown_s (float): Intervalo mínimo entre dumps (evita inundar o disco).
+    """
+
+    def __init__(self, profiler, budget_ms=1000.0 / 60, window_s=3.0, dump_dir=None,
+                 use_cprofile=False, cooldown_s=2.0, fps=60, debug=False):
+        self.profiler = profiler
+        self.budget_ms = budget_ms
+        self.window_s = window_s
+        self.dump_dir = dump_dir or _default_dump_dir()
+        self.use_cprofile = use_cprofile
+        self.cooldown_s = cooldown_s
+        self.debug = debug
+
+        self.frames = deque(maxlen=max(1, int(window_s * fps)))
+        self.frame_index = 0
+        self.last_dump = 0.0
+        self.dumps = []
+
+        self._cprofile = None
+
+        # O gravador precisa dos tempos por estágio mesmo com o HUD fechado
+        self.profiler.always_on = True
+        self.profiler.enabled = True
+
+    def begin_frame(self):
+        self.profiler.begin_frame()
+        if self.use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def end_frame(self, scene=None):
+        """
+        Fecha o frame: grava o registro na janela e faz o dump se passou do orçamento.
+        Retorna o caminho do dump gerado (ou None).
+        """
+        profile = None
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            profile, self._cprofile = self._cprofile, None
+
+        record = self.profiler.end_frame()
+        if record is None:
+            return None
+
+        self.frame_index += 1
+        entry = {
+            "frame": self.frame_index,
+            "scene": scene,
+            "total_ms": round(record["total"], 3),
+            "stages": {k: round(v, 3) for k, v in record["stages"].items()},
+            "events": record["events"],
+        }
+        self.frames.append(entry)
+
+        if entry["total_ms"] <= self.budget_ms:
+            return None
+        now = time.monotonic()
+        if now - self.last_dump < self.cooldown_s:
+            return None
+        self.last_dump = now
+        return self.dump(entry, profile)
+
+    def dump(self, slow_frame, profile=None):
+        """Grava a janela atual (e o perfil do frame lento) em JSON com timestamp."""
+        os.makedirs(self.dump_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        path = os.path.join(self.dump_dir, f"slowframe-{stamp}.json")
+
+        payload = {
+            "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+            "budget_ms": self.budget_ms,
+            "slow_frame": slow_frame,
+            "window": list(self.frames),
+        }
+        if profile is not None:
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(40)
+            payload["cprofile"] = stream.getvalue()
+
+        try:
+            with open(path, "w") as f:
+                json.dump(payload, f, indent=1)
+        except OSError as e:
+            print(f"Erro ao gravar dump de frame lento: {e}")
+            return None
+
+        self.dumps.append(path)
+        if self.debug:
+            print(f"Frame lento ({slow_frame['total_ms']:.1f} ms) gravado em {path}")
+        return path
@@ -4,9 +4,14 @@ Contém a lógica de renderização e orquestração da atualização do jogo.
 """
 import pygame
 import os
+import numpy as np
 from datetime import datetime
 from engine.raster import drawPolygon, paintPolygon, rect_to_polygon, paintTexturedEllipse, paintTexturedPolygon, draw_text_raster, draw_gradient_rect
 from game.audio_manager import play_audio
+from game.score_writer import score_writer
+from game.asset_loader import assets, GAME_TEXTURES, GAME_BACKGROUNDS, PRIZE_FRAMES
+from game.profiler import profiler
+from game.clock import RealClock
 from game.model.world import World
 from game.model.difficulty import Difficulty
 from game.model import config as const
@@ -32,11 +37,21 @@ class GameLoop:
     2. Gerenciar o Estado (Game Over, Vitória, Tempo).
     3. Gerenciar a pipeline de renderização manual (engine.raster).
     
+    Com muitos gabrielzitos (acima de SPRITE_BATCH_THRESHOLD, ex.: enxames de
+    teste de carga), os prêmios são rasterizados uma única vez em sprites e
+    desenhados em lote com `Surface.blits`.
+
     Iplementação:
     Utiliza uma engine de rasterização via software. Os arrays de pixels são manipulados diretamente para desenhar polígonos texturizados.
     """
+
+    SPRITE_BATCH_THRESHOLD = 24        # acima disso, prêmios são desenhados em lote
+    SPRITE_COLORKEY = (255, 0, 254)    # cor de fundo transparente dos sprites pré-rasterizados
+    INVENTORY_MAX_ICONS = 16           # grade 4x4 da viewport do inventário
+    PRERENDER_ROWS = 4                 # linhas de fundo por passo da carga incremental
     
-    def __init__(self, width, height, difficulty: Difficulty, debug=False):
+    def __init__(self, width, height, difficulty: Difficulty, debug=False, clock=None, headless=False,
+                 defer_textures=False):
         """
         Inicializa uma nova sessão de jogo.
         
@@ -45,10 +60,16 @@ class GameLoop:
             height (int): Altura da tela em pixels.
             difficulty (Difficulty): Instância com configurações de dificuldade.
             debug (bool): Se True, exibe informações de debug no console.
+            clock (RealClock | SimulatedClock): Fonte de tempo do timer (padrão: tempo real).
+            headless (bool): Se True, não carrega texturas nem salva highscores
+                (simulação sem renderização; `render()` não pode ser usado).
+            defer_textures (bool): Se True, as texturas ficam para o chamador
+                carregar com `load_textures_steps()` (carga incremental).
         """
         self.width = width
         self.height = height
-        self.start_time = pygame.time.get_ticks()
+        self.clock = clock or RealClock()
+        self.headless = headless
         self.duration = 60000  # 60 segundos
         
         # --- Flags de Controle de Estado ---
@@ -67,11 +88,18 @@ class GameLoop:
             print(f"Iniciando jogo com: {self.difficulty.name}")
         
         # Instancia o 'Modelo' do jogo (Física e Estado)
-        self.world = World(width, height, self.difficulty, debug=self.debug)
+        self.world = World(width, height, self.difficulty, debug=self.debug, clock=self.clock)
 
         # Carrega texturas e converte para MATRIZES (Otimização de Performance)
-        self.load_textures()
-        
+        # Sprites dos prêmios para o desenho em lote (enxames), criados sob demanda
+        self.sprites_walk = None
+
+        if headless or defer_textures:
+            self.bg_cache_normal = self.bg_cache_win = self.bg_cache_lose = None
+            self.bg_cache = None
+        else:
+            self.load_textures()
+
         # Flags de Debug Visual
         self.show_hitbox = True
 
@@ -82,6 +110,45 @@ class GameLoop:
             self.inventory_window,
             self.inventory_viewport
         )
+
+        # Estado inicial da partida (RESTART_GAME restaura daqui)
+        self.initial_snapshot = self.world.snapshot()
+
+        # O cronômetro começa depois do carregamento das texturas
+        self.start_time = self.clock.get_ticks()
+
+    def restart(self):
+        """
+        Reinicia a partida sem recriar o GameLoop: restaura o snapshot inicial
+        do mundo (no lugar) e sorteia novas posições para os gabrielzitos.
+        Texturas e caches de fundo são reaproveitados.
+        """
+        self.world.restore(self.initial_snapshot)
+        self.world.reroll_prizes()
+        self.game_over = False
+        self.victory = False
+        self.score_saved = False
+        self.final_time = None
+        self.bg_cache = self.bg_cache_normal
+        self.start_time = self.clock.get_ticks()
+
+    def start_timer(self):
+        """Zera o cronômetro (a cena pode ter sido construída antes de entrar em jogo)."""
+        self.start_time = self.clock.get_ticks()
+
+    def restore_snapshot(self, data):
+        """
+        Volta a partida para um snapshot de `World.snapshot()` (rewind/seek).
+        O fim de jogo é recalculado a partir do mundo e do relógio restaurados.
+        """
+        self.world.restore(data)
+        self.final_time = None
+        self.victory = self.world.prizes.all_captured()
+        self.game_over = self.victory or self.check_defeat()
+        if not self.game_over:
+            self.bg_cache = self.bg_cache_normal
+        else:
+            self.bg_cache = self.bg_cache_win if self.victory else self.bg_cache_lose
         
     def handle_input(self, event):
         """
@@ -116,15 +183,17 @@ class GameLoop:
         """
         if not self.game_over:
             # Atualiza física
-            self.world.update(keys)
+            with profiler.scope("world_update"):
+                self.world.update(keys)
             
             # Vitória se todos os grabrielzitos foram capturados
-            all_captured = all(prize.captured for prize in self.world.prizes)
+            all_captured = self.world.prizes.all_captured()
             
             if all_captured:
                 self.game_over = True
                 self.victory = True
                 self.bg_cache = self.bg_cache_win
+                profiler.mark("victory")
                 self.save_high_score()
                 play_audio("ufo")
                 
@@ -134,147 +203,250 @@ class GameLoop:
                 self.game_over = True
                 self.victory = False
                 self.bg_cache = self.bg_cache_lose
+                profiler.mark("game_over")
                 play_audio("vai-comendo")
-    
+
+            # O mundo para de avançar: sem tick anterior, a tela final fica
+            # parada em vez de interpolar entre os dois últimos ticks
+            if self.game_over:
+                self.world.previous_positions = None
+
     def save_high_score(self):
         """
-        Salva a pontuação em arquivo se o jogador vencer.
+        Salva a pontuação se o jogador vencer.
         Formato: DIFICULDADE|MILISEGUNDOS|TIMESTAMP
+
+        A linha só é enfileirada: a escrita em highscores.txt acontece na
+        thread do `score_writer` (ver game/score_writer.py), fora do frame.
         """
-        if self.score_saved: return
+        if self.score_saved or self.headless: return
         
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = self.clock.get_ticks() - self.start_time
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         entry = f"{self.difficulty.name}|{elapsed}|{timestamp}\n"
         
-        try:
-            # Salva em highscores.txt na raiz do projeto
-            base_path = os.path.dirname(os.path.abspath(__file__))
-            score_path = os.path.join(base_path, "..", "..", "highscores.txt")
-            
-            with open(score_path, "a") as f:
-                f.write(entry)
-                
-            self.score_saved = True
-            if self.debug: print(f"Score salvo: {entry.strip()}")
-        except Exception as e:
-            print(f"Erro ao salvar score: {e}")
+        score_writer.submit(entry)
+        self.score_saved = True
+        if self.debug: print(f"Score enfileirado: {entry.strip()}")
 
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         """
         Gerencia o pipeline gráfico.
         Utiliza pygame.PixelArray para acesso direto ao buffer de memória.
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            alpha (float): Fração entre o tick anterior e o atual (passo fixo);
+                as entidades são desenhadas interpoladas nessa posição.
         """
-        
+        with self.world.interpolated(alpha):
+            self._render_frame(screen)
+
+    def _render_frame(self, screen):
+        """Desenha um frame com as posições atuais do mundo."""
         # Lock da superfície para acesso direto à memória
+        batch_prizes = len(self.world.prizes) > self.SPRITE_BATCH_THRESHOLD
+
         with pygame.PixelArray(screen) as px_array:
             
             # OTIMIZAÇÃO: Cópia de Memória do Background (Cache)
             # Copia os pixels já processados do cache para a tela atual.
-            with pygame.PixelArray(self.bg_cache) as bg_array:
-                px_array[:] = bg_array[:]
+            with profiler.scope("background"):
+                with pygame.PixelArray(self.bg_cache) as bg_array:
+                    px_array[:] = bg_array[:]
 
             # Renderiza Elementos do Mundo
-            self.render_cable(px_array)
+            with profiler.scope("cable"):
+                self.render_cable(px_array)
 
             # UFO (Corpo + Borda) - ELIPSE
-            ufo_hitbox = self.world.ufo.get_ellipse_hitbox()
-            paintTexturedEllipse(
-                px_array, self.width, self.height, 
-                ufo_hitbox['center'], ufo_hitbox['rx'], ufo_hitbox['ry'], 
-                self.ufo_matrix, self.ufo_w, self.ufo_h
-            )
-
-            # Garra (Geometria muda baseada no estado aberto/fechado)
-            claw_rect = self.world.claw.get_rect()
-            cx, cy, cw, ch = claw_rect
-
-            if self.world.claw.is_closed:
-                # Vértices [x, y, u, v]
-                vertices_claw = [
-                    (cx,      cy,      0,           0),
-                    (cx + cw, cy,      self.claw_w, 0),
-                    (cx + cw, cy + ch, self.claw_w, self.claw_h),
-                    (cx,      cy + ch, 0,           self.claw_h)
-                ]
-                paintTexturedPolygon(
-                    px_array, self.width, self.height, 
-                    vertices_claw,
-                    self.claw_matrix, self.claw_w, self.claw_h, 'standard'
-                )
-            else:
-                vertices_claw_open = [
-                    (cx,      cy,      0,               0),
-                    (cx + cw, cy,      self.claw_open_w, 0),
-                    (cx + cw, cy + ch, self.claw_open_w, self.claw_open_h),
-                    (cx,      cy + ch, 0,               self.claw_open_h)
-                ]
-                paintTexturedPolygon(
+            with profiler.scope("ufo"):
+                ufo_hitbox = self.world.ufo.get_ellipse_hitbox()
+                paintTexturedEllipse(
                     px_array, self.width, self.height, 
-                    vertices_claw_open,
-                    self.claw_open_matrix, self.claw_open_w, self.claw_open_h, 'standard'
+                    ufo_hitbox['center'], ufo_hitbox['rx'], ufo_hitbox['ry'], 
+                    self.ufo_matrix, self.ufo_w, self.ufo_h
                 )
 
+            with profiler.scope("claw"):
+                self.render_claw(px_array)
+
             # 3. Renderiza Prêmios (Gabrielzitos)
-            for prize in self.world.prizes:
-                if not prize.captured:
-                    half = prize.size // 2
-                    p_x = prize.x
-                    p_y = prize.y
-                    
-                    # LÓGICA DE FEEDBACK VISUAL:
-
-                    if prize.being_held:
-                        # Se está sendo segurado, troca para "held"
-                        current_matrix = self.held_matrix
-                        current_w = self.held_w
-                        current_h = self.held_h
-
-                    # Se perdeu (Game Over e !Victory), troca a textura para mocking.
-                    elif self.game_over and not self.victory:
-                        current_matrix = self.mock_matrix
-                        current_w = self.mock_w
-                        current_h = self.mock_h
-                    else:
-                        # Animação normal
-                        frame_idx = int(prize.frame_index)
-                        frame_idx = frame_idx % len(self.prize_assets)
-                        
-                        current_asset = self.prize_assets[frame_idx]
-                        current_matrix = current_asset['matrix']
-                        current_w = current_asset['w']
-                        current_h = current_asset['h']
-
-                    # Determina coordenadas UV (Inverte horizontalmente com a direção)
-                    if prize.direction == 1:
-                        u_left = 0
-                        u_right = current_w
-                    else:
-                        u_left = current_w
-                        u_right = 0
-
-                    vertices_prize = [
-                        (p_x - half, p_y - half, u_left,  0),            
-                        (p_x + half, p_y - half, u_right, 0),            
-                        (p_x + half, p_y + half, u_right, current_h), 
-                        (p_x - half, p_y + half, u_left,  current_h)  
-                    ]
-                    paintTexturedPolygon(
-                        px_array, self.width, self.height, 
-                        vertices_prize, 
-                        current_matrix, current_w, current_h, 
-                        'standard'
-                    )
-
-            self.render_inventory(px_array)
+            if not batch_prizes:
+                with profiler.scope("prizes"):
+                    self.render_prizes(px_array)
+
+                with profiler.scope("inventory"):
+                    self.render_inventory(px_array)
+
+        if batch_prizes:
+            # Enxame: blit em lote (precisa da superfície destravada)
+            with profiler.scope("prizes"):
+                self.render_prize_sprites(screen)
+            with profiler.scope("inventory"):
+                with pygame.PixelArray(screen) as px_array:
+                    self.render_inventory(px_array)
 
         # 4. Renderiza UI (Timer)
         # Feito fora do PixelArray principal para usar primitivas vetorizadas do timer
-        self.render_timer(screen)
+        with profiler.scope("timer"):
+            self.render_timer(screen)
         
         # 5. Renderiza Tela de Fim de Jogo (se aplicável)
         if self.game_over:
-            self.render_game_over(screen)
+            with profiler.scope("game_over"):
+                self.render_game_over(screen)
+
+    def render_claw(self, px_array):
+        """Renderiza a garra (geometria muda baseada no estado aberto/fechado)."""
+        claw_rect = self.world.claw.get_rect()
+        cx, cy, cw, ch = claw_rect
+
+        if self.world.claw.is_closed:
+            # Vértices [x, y, u, v]
+            vertices_claw = [
+                (cx,      cy,      0,           0),
+                (cx + cw, cy,      self.claw_w, 0),
+                (cx + cw, cy + ch, self.claw_w, self.claw_h),
+                (cx,      cy + ch, 0,           self.claw_h)
+            ]
+            paintTexturedPolygon(
+                px_array, self.width, self.height, 
+                vertices_claw,
+                self.claw_matrix, self.claw_w, self.claw_h, 'standard'
+            )
+        else:
+            vertices_claw_open = [
+                (cx,      cy,      0,               0),
+                (cx + cw, cy,      self.claw_open_w, 0),
+                (cx + cw, cy + ch, self.claw_open_w, self.claw_open_h),
+                (cx,      cy + ch, 0,               self.claw_open_h)
+            ]
+            paintTexturedPolygon(
+                px_array, self.width, self.height, 
+                vertices_claw_open,
+                self.claw_open_matrix, self.claw_open_w, self.claw_open_h, 'standard'
+            )
+
+    def render_prizes(self, px_array):
+        """Renderiza os prêmios (Gabrielzitos) que ainda não foram capturados."""
+        half = self.world.prizes.size // 2
+        mocking = self.game_over and not self.victory
+        for prize in self.world.prizes:
+            if not prize.captured:
+                p_x = prize.x
+                p_y = prize.y
+                
+                # LÓGICA DE FEEDBACK VISUAL:
+
+                if prize.being_held:
+                    # Se está sendo segurado, troca para "held"
+                    current_matrix = self.held_matrix
+                    current_w = self.held_w
+                    current_h = self.held_h
+
+                # Se perdeu (Game Over e !Victory), troca a textura para mocking.
+                elif mocking:
+                    current_matrix = self.mock_matrix
+                    current_w = self.mock_w
+                    current_h = self.mock_h
+                else:
+                    # Animação normal
+                    frame_idx = int(prize.frame_index)
+                    frame_idx = frame_idx % len(self.prize_assets)
+                    
+                    current_asset = self.prize_assets[frame_idx]
+                    current_matrix = current_asset['matrix']
+                    current_w = current_asset['w']
+                    current_h = current_asset['h']
+
+                # Determina coordenadas UV (Inverte horizontalmente com a direção)
+                if prize.direction == 1:
+                    u_left = 0
+                    u_right = current_w
+                else:
+                    u_left = current_w
+                    u_right = 0
+
+                vertices_prize = [
+                    (p_x - half, p_y - half, u_left,  0),            
+                    (p_x + half, p_y - half, u_right, 0),            
+                    (p_x + half, p_y + half, u_right, current_h), 
+                    (p_x - half, p_y + half, u_left,  current_h)  
+                ]
+                paintTexturedPolygon(
+                    px_array, self.width, self.height, 
+                    vertices_prize, 
+                    current_matrix, current_w, current_h, 
+                    'standard'
+                )
+
+    def _bake_sprite(self, matrix, w, h, flipped):
+        """
+        Rasteriza uma textura uma única vez, no tamanho do prêmio, em uma
+        Surface com colorkey (mesmo resultado de paintTexturedPolygon na tela).
+        """
+        size = self.world.prizes.size
+        sprite = pygame.Surface((size, size))
+        sprite.fill(self.SPRITE_COLORKEY)
+        u_left, u_right = (w, 0) if flipped else (0, w)
+        with pygame.PixelArray(sprite) as sprite_px:
+            paintTexturedPolygon(
+                sprite_px, size, size,
+                [(0, 0, u_left, 0), (size, 0, u_right, 0), (size, size, u_right, h), (0, size, u_left, h)],
+                matrix, w, h, 'standard'
+            )
+        sprite.set_colorkey(self.SPRITE_COLORKEY)
+        return sprite
+
+    def _build_prize_sprites(self):
+        """Sprites [frame][virado] da animação, segurado e mocking (criados sob demanda)."""
+        for _ in self._build_prize_sprites_steps():
+            pass
+
+    def _build_prize_sprites_steps(self):
+        """`_build_prize_sprites` com um `yield` por sprite rasterizado."""
+        textures = [(a['matrix'], a['w'], a['h']) for a in self.prize_assets]
+        textures += [(self.held_matrix, self.held_w, self.held_h), (self.mock_matrix, self.mock_w, self.mock_h)]
+        baked = []
+        for matrix, w, h in textures:
+            pair = []
+            for flipped in (False, True):
+                pair.append(self._bake_sprite(matrix, w, h, flipped))
+                yield
+            baked.append(pair)
+        self.sprites_walk = baked[:-2]
+        self.sprites_held, self.sprites_mock = baked[-2:]
+
+    def render_prize_sprites(self, screen):
+        """
+        Caminho de enxame de render_prizes: seleção de sprite vetorizada e
+        um único `screen.blits` para todos os prêmios visíveis.
+        """
+        if self.sprites_walk is None:
+            self._build_prize_sprites()
+        prizes = self.world.prizes
+        visible = np.flatnonzero(~prizes.captured)
+        if not len(visible):
+            return
+
+        half = prizes.size // 2
+        xs = (prizes.x[visible] - half).astype(np.int64).tolist()
+        ys = (prizes.y[visible] - half).astype(np.int64).tolist()
+        flipped = (prizes.direction[visible] != 1).tolist()
+        held = prizes.being_held[visible].tolist()
+        frames = (prizes.frame_index[visible].astype(np.int64) % len(self.sprites_walk)).tolist()
+
+        walk, sprites_held = self.sprites_walk, self.sprites_held
+        if self.game_over and not self.victory:
+            # Todos zombam: a animação é trocada pelo sprite de mocking
+            walk = [self.sprites_mock] * len(walk)
+
+        screen.blits(
+            [((sprites_held if h else walk[f])[d], (x, y))
+             for x, y, d, h, f in zip(xs, ys, flipped, held, frames)],
+            doreturn=False,
+        )
 
     def render_cable(self, px_array):
         """
@@ -302,84 +474,104 @@ class GameLoop:
 
     def load_textures(self):
         """
-        Carrega imagens do disco e converte para matrizes numéricas.
-        Gera cache do background para otimização.
+        Carrega as texturas (decodificadas em paralelo pelo registro de
+        assets, já no formato matriz) e gera o cache dos backgrounds.
+        """
+        assets.load(GAME_TEXTURES)
+
+        # Pré-renderiza os 3 Backgrounds
+        with assets.measure("prerender_backgrounds"):
+            self.bg_cache_normal = self._prerender_background("pelourinho.png")
+            self.bg_cache_win = self._prerender_background("pelourinho-ufo.png")
+            self.bg_cache_lose = self._prerender_background("pelourinho-mocking-lens.png")
+        self._assign_textures()
+
+    def load_textures_steps(self):
+        """
+        Versão incremental de `load_textures` (sem thread): gerador que dá
+        `yield` com a fração concluída depois de cada passo pequeno (decodificar
+        um PNG, converter algumas colunas, pré-renderizar PRERENDER_ROWS linhas
+        de um fundo, rasterizar um sprite do enxame).
         """
-        # Carrega e pré-renderiza os 3 Backgrounds
-        self.bg_cache_normal = self._prerender_background("pelourinho.png")
-        self.bg_cache_win = self._prerender_background("pelourinho-ufo.png")
-        self.bg_cache_lose = self._prerender_background("pelourinho-mocking-lens.png")
+        bands = -(-self.height // self.PRERENDER_ROWS)
+        sprites = 2 * (len(PRIZE_FRAMES) + 2) if len(self.world.prizes) > self.SPRITE_BATCH_THRESHOLD else 0
+        total = assets.plan_steps(GAME_TEXTURES) + len(GAME_BACKGROUNDS) * bands + sprites
+        done = 0
+        for _ in assets.load_steps(GAME_TEXTURES):
+            done += 1
+            yield done / total
+
+        caches = []
+        for filename in GAME_BACKGROUNDS:
+            steps = self._prerender_background_steps(filename)
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as stop:
+                    caches.append(stop.value)
+                    break
+                done += 1
+                yield done / total
+        self.bg_cache_normal, self.bg_cache_win, self.bg_cache_lose = caches
+        self._assign_textures()
+
+        # Enxame: os sprites do desenho em lote também entram na carga
+        if sprites:
+            for _ in self._build_prize_sprites_steps():
+                done += 1
+                yield done / total
+
+    def _assign_textures(self):
+        """Pega do registro as texturas de sprites e UI (fundos já pré-renderizados)."""
+        # As matrizes dos fundos não são mais usadas depois do cache
+        assets.release(GAME_BACKGROUNDS)
 
         # Define o background inicial
         self.bg_cache = self.bg_cache_normal
 
-        # Carrega sprites da animação de movimento
+        # Sprites da animação de movimento
         self.prize_assets = []
         self.prize_w, self.prize_h = 0, 0
-        for i in range(1, 13):
-            fname = f"gabrielzito/movement/step{i}.png"
-            surf = pygame.image.load(_resolve_asset_path(fname))
-            
-            matrix, w, h = self.surface_to_matrix(surf)
+        for fname in PRIZE_FRAMES:
+            matrix, w, h = assets.texture(fname)
             self.prize_assets.append({
                 'matrix': matrix,
                 'w': w,
                 'h': h
             })
 
-        # Carrega sprite de mocking            
-        mock_surf = pygame.image.load(_resolve_asset_path("gabrielzito/mocking/gabriel-mocking4.png"))
-        self.mock_matrix, self.mock_w, self.mock_h = self.surface_to_matrix(mock_surf)
+        # Sprite de mocking e de "Sendo Segurado"
+        self.mock_matrix, self.mock_w, self.mock_h = assets.texture("gabrielzito/mocking/gabriel-mocking4.png")
+        self.held_matrix, self.held_w, self.held_h = assets.texture("gabrielzito/caught/gabriel-caught3.png")
+
+        # Outras texturas (UFO, Garra, Cabo)
+        self.ufo_matrix, self.ufo_w, self.ufo_h = assets.texture("ufo.png")
+        self.cable_matrix, self.cable_w, self.cable_h = assets.texture("cable.png")
+        self.claw_matrix, self.claw_w, self.claw_h = assets.texture("claw.png")
+        self.claw_open_matrix, self.claw_open_w, self.claw_open_h = assets.texture("claw_open.png")
 
-        # Carrega Sprite de "Sendo Segurado"
-        held_surf = pygame.image.load(_resolve_asset_path("gabrielzito/caught/gabriel-caught3.png"))
-        self.held_matrix, self.held_w, self.held_h = self.surface_to_matrix(held_surf)
-        
-        # Carrega outras texturas (UFO, Garra, Cabo)
-        ufo_surf = pygame.image.load(_resolve_asset_path("ufo.png"))
-        cable_surf = pygame.image.load(_resolve_asset_path("cable.png"))
-        claw_surf = pygame.image.load(_resolve_asset_path("claw.png"))
-        claw_open_surf = pygame.image.load(_resolve_asset_path("claw_open.png"))
-
-        self.ufo_matrix, self.ufo_w, self.ufo_h = self.surface_to_matrix(ufo_surf)
-        self.cable_matrix, self.cable_w, self.cable_h = self.surface_to_matrix(cable_surf)
-        self.claw_matrix, self.claw_w, self.claw_h = self.surface_to_matrix(claw_surf)
-        self.claw_open_matrix, self.claw_open_w, self.claw_open_h = self.surface_to_matrix(claw_open_surf)
-
-    def surface_to_matrix(self, surface):
-        """Converte Surface Pygame para lista 2D de cores [x][y]."""
-        w = surface.get_width()
-        h = surface.get_height()
-        matrix = []
-        for x in range(w):
-            col = []
-            for y in range(h):
-                col.append(surface.get_at((x, y)))
-            matrix.append(col)
-        return matrix, w, h
-    
     def render_inventory(self, px_array):
         """
         Renderiza os prêmios capturados dentro da viewport do inventário.
         Utiliza transformação de coordenadas (World -> Viewport).
         """
-        captured = [p for p in self.world.prizes if p.captured]
         if not self.prize_assets: return
+        # Só cabe uma grade 4x4 de ícones na viewport
+        captured = min(self.world.prizes.captured_count(), self.INVENTORY_MAX_ICONS)
+        half = self.world.prizes.size // 2
 
         icon_asset = self.prize_assets[0]
         icon_matrix = icon_asset['matrix']
         icon_w = icon_asset['w']
         icon_h = icon_asset['h']
 
-        for i, prize in enumerate(captured):
+        for i in range(captured):
             # Posição lógica em grade
             col = i % 4
             row = i // 4
             x = 15 + col * 25
             y = 15 + row * 25
 
-            half = prize.size // 2
-
             vertices = [
                 (x - half, y - half, 0, 0),
                 (x + half, y - half, icon_w, 0),
@@ -403,7 +595,7 @@ class GameLoop:
 
     def check_defeat(self):
         """Verifica se o tempo do jogo acabou."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed = current_time - self.start_time
         if elapsed >= self.duration:
             return True
@@ -416,12 +608,12 @@ class GameLoop:
             
         if self.game_over and self.final_time is None:
             # Congela o tempo quando o jogo acaba
-            self.final_time = pygame.time.get_ticks()
+            self.final_time = self.clock.get_ticks()
         
         if self.game_over and self.final_time is not None:
             elapsed = self.final_time - self.start_time
         else:
-            elapsed = pygame.time.get_ticks() - self.start_time
+            elapsed = self.clock.get_ticks() - self.start_time
             
         remaining = max(0, self.duration - elapsed)
 
@@ -653,26 +845,39 @@ class GameLoop:
 
     def _prerender_background(self, filename):
         """
-        Helper para carregar imagem e gerar superfície de cache já rasterizada.
+        Helper para gerar superfície de cache já rasterizada a partir da textura do fundo.
+        """
+        steps = self._prerender_background_steps(filename)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def _prerender_background_steps(self, filename):
+        """
+        `_prerender_background` em faixas de PRERENDER_ROWS linhas, com um
+        `yield` por faixa; o cache é o valor de retorno do gerador.
         """
         try:
-            surf = pygame.image.load(_resolve_asset_path(filename))
-        except FileNotFoundError:
+            matrix, w, h = assets.texture(filename)
+        except KeyError:
             if self.debug: print(f"AVISO: Background {filename} não encontrado.")
             return None
 
-        matrix, w, h = self.surface_to_matrix(surf)
-        
         cache = pygame.Surface((self.width, self.height))
-        with pygame.PixelArray(cache) as px_array:
-            vertices = [
-                (0, 0, 0, 0),
-                (self.width, 0, w, 0),
-                (self.width, self.height, w, h),
-                (0, self.height, 0, h)
-            ]
-            paintTexturedPolygon(
-                px_array, self.width, self.height,
-                vertices, matrix, w, h, 'standard'
-            )
+        vertices = [
+            (0, 0, 0, 0),
+            (self.width, 0, w, 0),
+            (self.width, self.height, w, h),
+            (0, self.height, 0, h)
+        ]
+        for y in range(0, self.height, self.PRERENDER_ROWS):
+            with pygame.PixelArray(cache) as px_array:
+                paintTexturedPolygon(
+                    px_array, self.width, self.height,
+                    vertices, matrix, w, h, 'standard',
+                    rows=(y, y + self.PRERENDER_ROWS)
+                )
+            yield
         return cache
\ No newline at end of file
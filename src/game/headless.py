@@ -0,0 +1,163 @@
+"""
+Simulação headless de partidas completas, mais rápida que o tempo real.
+
+O GameLoop roda sem texturas nem renderização, com um SimulatedClock: o
+cronômetro de 60 s da partida avança pela contagem de ticks, não pelo relógio
+de parede. Usado para balanceamento de dificuldade, replays e testes de
+regressão.
+
+Uso (a partir de src/):
+    python -m game.headless --rounds 500 --difficulty HARD|ALL [--script aim|loop] [--json]
+"""
+import os
+import sys
+import json
+import time
+import pygame
+from game.clock import SimulatedClock
+from game.game_loop import GameLoop
+from game.benchmark import InputScript, ScriptedKeys
+from engine.collision import point_in_box
+from game.model.difficulty import Difficulty
+from game.model.gamestate_enum import GameState
+from game.model.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class AimingScript:
+    """
+    Jogador automático simples para balanceamento: mira na posição prevista do
+    gabrielzito mais próximo, solta a garra quando alinhado e agarra quando
+    algum prêmio entra na hitbox da garra.
+    """
+
+    LEAD_TICKS = 55   # tempo aproximado de descida da garra até os prêmios
+    ALIGN_PX = 8      # tolerância de alinhamento para soltar a garra
+
+    def __init__(self):
+        self.keys = ScriptedKeys()
+
+    def _key_event(self, key):
+        return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+    def next_frame(self, world):
+        """Decide o input do próximo tick. Retorna a lista de eventos do tick."""
+        self.keys.held.clear()
+        free = [p for p in world.prizes if not p.captured and not p.being_held]
+        if not free:
+            return []
+
+        if world.state == GameState.MOVE:
+            # Posição prevista (ignora quicadas nas bordas)
+            targets = [p.x + p.speed * p.direction * self.LEAD_TICKS for p in free]
+            target = min(targets, key=lambda x: abs(x - world.ufo.x))
+            dx = target - world.ufo.x
+            if abs(dx) <= self.ALIGN_PX and abs(world.ufo.velocity_x) < 1:
+                return [self._key_event(pygame.K_SPACE)]
+            self.keys.held.add(pygame.K_RIGHT if dx > 0 else pygame.K_LEFT)
+
+        elif world.state == GameState.DROP:
+            box = world.claw.get_grab_hitbox()
+            if any(point_in_box(p.x, p.y, box) for p in free):
+                return [self._key_event(pygame.K_SPACE)]
+
+        return []
+
+
+def run_round(difficulty_name="NORMAL", script=None, max_ticks=None, debug=False):
+    """
+    Joga uma partida headless até o fim (vitória ou tempo esgotado).
+
+    Args:
+        difficulty_name (str): "EASY", "NORMAL" ou "HARD".
+        script: Roteiro de input com `keys` e `next_frame(world)` (padrão: AimingScript).
+        max_ticks (int): Limite de segurança de ticks (padrão: duração da partida + 1 s).
+
+    Returns:
+        dict: {'difficulty', 'victory', 'ticks', 'elapsed_ms', 'captured', 'prizes'}
+    """
+    clock = SimulatedClock()
+    game_loop = GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, Difficulty(difficulty_name),
+                         debug=debug, clock=clock, headless=True)
+    script = script or AimingScript()
+    if max_ticks is None:
+        max_ticks = int((game_loop.duration + 1000) / clock.tick_ms)
+
+    while not game_loop.game_over and clock.ticks < max_ticks:
+        for event in script.next_frame(game_loop.world):
+            game_loop.handle_input(event)
+        game_loop.update(script.keys)
+
+    prizes = game_loop.world.prizes
+    return {
+        "difficulty": difficulty_name,
+        "victory": game_loop.victory,
+        "ticks": clock.ticks,
+        "elapsed_ms": clock.get_ticks() - game_loop.start_time,
+        "captured": sum(1 for prize in prizes if prize.captured),
+        "prizes": len(prizes),
+    }
+
+
+SCRIPTS = {"aim": AimingScript, "loop": InputScript}
+
+
+def run_rounds(rounds, difficulty_name="NORMAL", script_name="aim", debug=False):
+    """Joga `rounds` partidas e retorna o resumo (taxa de vitória, partidas/min)."""
+    t0 = time.perf_counter()
+    results = [run_round(difficulty_name, SCRIPTS[script_name](), debug=debug) for _ in range(rounds)]
+    wall_s = time.perf_counter() - t0
+
+    wins = [r for r in results if r["victory"]]
+    return {
+        "difficulty": difficulty_name,
+        "script": script_name,
+        "rounds": rounds,
+        "wins": len(wins),
+        "win_rate": round(len(wins) / rounds, 4) if rounds else None,
+        "mean_win_time_ms": round(sum(r["elapsed_ms"] for r in wins) / len(wins), 1) if wins else None,
+        "mean_captured": round(sum(r["captured"] for r in results) / rounds, 3) if rounds else None,
+        "simulated_s": round(sum(r["elapsed_ms"] for r in results) / 1000.0, 1),
+        "wall_s": round(wall_s, 3),
+        "rounds_per_min": round(rounds / wall_s * 60.0, 1) if wall_s > 0 else None,
+    }
+
+
+def _arg_value(argv, flag, default):
+    if flag in argv:
+        i = argv.index(flag)
+        if i + 1 < len(argv):
+            return argv[i + 1]
+    return default
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    rounds = int(_arg_value(argv, "--rounds", 100))
+    difficulty_names = [_arg_value(argv, "--difficulty", "NORMAL")]
+    if difficulty_names[0] == "ALL":
+        difficulty_names = Difficulty.get_available_difficulties()
+    script_name = _arg_value(argv, "--script", "aim")
+    if script_name not in SCRIPTS:
+        print(f"Roteiro inválido: {script_name} (use {' ou '.join(SCRIPTS)})")
+        return 2
+
+    # Sem janela nem som: só a simulação
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    reports = [run_rounds(rounds, name, script_name, debug="--debug" in argv) for name in difficulty_names]
+    pygame.quit()
+
+    if "--json" in argv:
+        print(json.dumps(reports, indent=2))
+    else:
+        for r in reports:
+            print(f"{r['difficulty']:>7}: {r['wins']}/{r['rounds']} vitórias "
+                  f"({r['win_rate'] * 100:.1f}%), {r['simulated_s']:.0f} s simulados "
+                  f"em {r['wall_s']:.2f} s ({r['rounds_per_min']:.0f} partidas/min)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Leitura em streaming de arquivos de highscores grandes (DIFICULDADE|MILISEGUNDOS|TIMESTAMP).
+
+Em vez de guardar todos os tempos em listas e ordenar, o arquivo é lido em
+blocos grandes de bytes (só linhas completas; o resto do bloco fica para o
+próximo) e cada dificuldade mantém um heap limitado aos k melhores tempos:
+memória O(k) por dificuldade e uma comparação por linha no caso comum.
+Linhas malformadas são descartadas com testes baratos de bytes, sem exceções.
+
+`TopKReader` guarda o offset em bytes até onde leu; `save()`/`load()`
+persistem esse estado para retomar depois e ler só as linhas anexadas.
+
+Uso:
+    reader = TopKReader(k=3)
+    reader.feed(SCORE_PATH)
+    reader.top("HARD")  # [ms, ms, ms]
+"""
+import os
+import json
+import heapq
+
+CHUNK_SIZE = 1 << 18   # 256 KiB por leitura
+
+# Bytes do início do arquivo usados para detectar que ele foi substituído
+HEAD_BYTES = 64
+
+
+def iter_chunks(f, offset=0, chunk_size=CHUNK_SIZE):
+    """
+    Lê o arquivo binário `f` a partir de `offset` em blocos de ~`chunk_size`.
+    Gera (lista de linhas completas em bytes, offset logo após a última).
+    Uma última linha sem quebra de linha (escrita em andamento) não é gerada.
+    """
+    f.seek(offset)
+    pending = b""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            return
+        block = pending + block
+        end = block.rfind(b"\n") + 1
+        if not end:
+            pending = block
+            continue
+        pending = block[end:]
+        offset += end
+        yield block[:end].split(b"\n")[:-1], offset
+
+
+def parse_records(lines):
+    """
+    Gera (dificuldade, ms, timestamp) das linhas em bytes, pulando as
+    malformadas (sem dificuldade ou com tempo não numérico).
+    """
+    for line in lines:
+        difficulty, _, rest = line.partition(b"|")
+        time_ms, _, timestamp = rest.partition(b"|")
+        if not difficulty or not time_ms.isdigit():
+            continue
+        yield difficulty.decode("utf-8", "replace"), int(time_ms), timestamp.strip().decode("utf-8", "replace")
+
+
+class TopKReader:
+    """
+    Top-k (menores tempos) por dificuldade, lido em streaming e retomável.
+
+    Args:
+        k (int): Quantos tempos manter por dificuldade.
+        chunk_size (int): Bytes por leitura.
+    """
+
+    def __init__(self, k=3, chunk_size=CHUNK_SIZE):
+        self.k = k
+        self.chunk_size = chunk_size
+        self.heaps = {}       # dificuldade (bytes) -> heap de -ms (raiz = pior dos k)
+        self.cutoff = {}      # dificuldade (bytes) -> pior tempo do top-k cheio, em dígitos
+        self.offset = 0
+        self.head = b""
+        self.lines = 0
+        self.malformed = 0
+
+    def reset(self):
+        self.heaps.clear()
+        self.cutoff.clear()
+        self.offset = 0
+        self.head = b""
+        self.lines = 0
+        self.malformed = 0
+
+    def feed(self, path):
+        """
+        Lê de `path` as linhas a partir do offset atual. Se o arquivo foi
+        truncado ou substituído, recomeça do zero. Retorna as linhas lidas.
+        """
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(HEAD_BYTES)
+            if size < self.offset or head[:len(self.head)] != self.head:
+                self.reset()
+            self.head = head
+            before = self.lines
+            for lines, offset in iter_chunks(f, self.offset, self.chunk_size):
+                self._consume(lines)
+                self.offset = offset
+        return self.lines - before
+
+    def _consume(self, lines):
+        heaps, cutoff, k = self.heaps, self.cutoff, self.k
+        push, replace = heapq.heappush, heapq.heapreplace
+        malformed = 0
+        for line in lines:
+            difficulty, _, rest = line.partition(b"|")
+            time_ms = rest.partition(b"|")[0]
+            if not difficulty or not time_ms.isdigit():
+                malformed += 1
+                continue
+            # Caso comum: não entra no top-k. Compara os dígitos em bytes
+            # (mais dígitos = maior, sem zeros à esquerda) e evita o int()
+            worst = cutoff.get(difficulty)
+            if worst is not None and time_ms[:1] != b"0" and (
+                    len(time_ms) > len(worst) or (len(time_ms) == len(worst) and time_ms >= worst)):
+                continue
+            value = -int(time_ms)
+            heap = heaps.get(difficulty)
+            if heap is None:
+                heap = heaps[difficulty] = [value]
+            elif len(heap) < k:
+                push(heap, value)
+            elif value > heap[0]:
+                replace(heap, value)
+            else:
+                continue
+            if len(heap) == k:
+                cutoff[difficulty] = str(-heap[0]).encode("ascii")
+        self.lines += len(lines)
+        self.malformed += malformed
+
+    def top(self, difficulty):
+        """Os k menores tempos (ms) de `difficulty`, em ordem crescente."""
+        return sorted(-v for v in self.heaps.get(difficulty.encode("utf-8"), ()))
+
+    def top_all(self):
+        return {name.decode("utf-8", "replace"): sorted(-v for v in heap) for name, heap in self.heaps.items()}
+
+    def save(self, path):
+        """Grava o estado (offset, início do arquivo e top-k) em JSON."""
+        state = {
+            "k": self.k, "offset": self.offset, "head": self.head.hex(),
+            "lines": self.lines, "malformed": self.malformed, "top": self.top_all(),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, chunk_size=CHUNK_SIZE):
+        """Recria um leitor a partir de `save()` (leitor vazio se o arquivo não existir)."""
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return cls(chunk_size=chunk_size)
+        reader = cls(state["k"], chunk_size)
+        reader.offset = state["offset"]
+        reader.head = bytes.fromhex(state["head"])
+        reader.lines = state["lines"]
+        reader.malformed = state["malformed"]
+        reader.heaps = {name.encode("utf-8"): [-t for t in times] for name, times in state["top"].items()}
+        for name, heap in reader.heaps.items():
+            heapq.heapify(heap)
+            if len(heap) == reader.k:
+                reader.cutoff[name] = str(-heap[0]).encode("ascii")
+        return reader
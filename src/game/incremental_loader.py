@@ -0,0 +1,144 @@
+"""
+Carga cooperativa em fatias de tempo (sem thread de carga).
+
+Para plataformas que não podem gastar uma thread com a carga: o trabalho é
+dividido em passos pequenos e retomáveis (geradores) e o main.py roda
+`step()` no tempo que sobra de cada frame, limitado a um orçamento em ms,
+enquanto o menu continua animando. Um passo não é interrompido: a fatia para
+antes do próximo passo se o custo esperado dele (o do último passo do mesmo
+job) não couber no que resta do orçamento.
+
+Protocolo de um job: um gerador que dá `yield` após cada passo, opcionalmente
+com a fração concluída (0..1) para a barra de progresso, e que retorna
+(`return`) o resultado. Ex.: GameLoop.load_textures_steps().
+
+Uso:
+    loader = IncrementalLoader(budget_ms=4.0)
+    job = loader.add(gerador)
+    ...
+    loader.step(orçamento_ms)    # a cada frame
+    job.done.is_set(), job.result(), loader.progress
+"""
+import time
+import threading
+from game.asset_loader import gc_paused
+
+
+class LoadJob:
+    """
+    Um gerador de passos dentro do IncrementalLoader. Mesma interface de
+    `SceneBuild` (done, result(), build_ms) para o SceneManager.
+    """
+
+    def __init__(self, key, steps):
+        self.key = key
+        self.steps = steps
+        self.progress = 0.0
+        self.scene = None
+        self.error = None
+        self.build_ms = None
+        self.last_step_ms = 0.0     # custo esperado do próximo passo
+        self.done = threading.Event()
+        self._start = time.perf_counter()
+
+    def advance(self):
+        """Roda um passo. Retorna False quando o job terminou."""
+        if self.done.is_set():
+            return False
+        try:
+            fraction = next(self.steps)
+        except StopIteration as stop:
+            self._finish(scene=stop.value)
+            return False
+        except Exception as e:  # relançada em result()
+            self._finish(error=e)
+            return False
+        if fraction is not None:
+            self.progress = min(1.0, fraction)
+        return True
+
+    def _finish(self, scene=None, error=None):
+        self.scene, self.error = scene, error
+        self.progress = 1.0
+        self.build_ms = (time.perf_counter() - self._start) * 1000.0
+        self.done.set()
+
+    def result(self, timeout=None):
+        """Resultado do job; se ainda não terminou, roda o resto agora (`timeout` não se aplica)."""
+        while not self.done.is_set() and self.advance():
+            pass
+        if self.error is not None:
+            raise self.error
+        return self.scene
+
+
+class IncrementalLoader:
+    """
+    Fila de jobs executados em fatias de tempo.
+
+    Args:
+        budget_ms (float): Orçamento padrão de cada `step()`.
+    """
+
+    def __init__(self, budget_ms=4.0):
+        self.budget_ms = budget_ms
+        self.jobs = []
+        self.steps = 0              # passos executados
+        self.slices = 0             # chamadas de step() com trabalho
+        self.max_step_ms = 0.0      # passo mais longo (passos não se dividem)
+        self.max_slice_ms = 0.0     # fatia mais longa (passa do orçamento só com um passo isolado)
+
+    @property
+    def idle(self):
+        return not self.jobs
+
+    @property
+    def progress(self):
+        """Progresso médio dos jobs pendentes (1.0 sem jobs)."""
+        if not self.jobs:
+            return 1.0
+        return sum(job.progress for job in self.jobs) / len(self.jobs)
+
+    def add(self, steps, key=None):
+        """Enfileira um gerador de passos. Retorna o LoadJob."""
+        job = LoadJob(key, steps)
+        self.jobs.append(job)
+        return job
+
+    def step(self, budget_ms=None):
+        """
+        Roda passos enquanto o próximo couber no orçamento (pelo menos um
+        passo, para a carga andar mesmo em frames sem folga). Retorna True se
+        ainda há trabalho.
+        """
+        if not self.jobs:
+            return False
+        budget_ms = self.budget_ms if budget_ms is None else budget_ms
+        start = time.perf_counter()
+        deadline = start + max(0.0, budget_ms) / 1000.0
+        # Sem coletor de ciclos dentro da fatia (a conversão cria milhões de tuplas)
+        with gc_paused():
+            ran = False
+            while self.jobs:
+                job = self.jobs[0]
+                step_start = time.perf_counter()
+                if ran and step_start + job.last_step_ms / 1000.0 > deadline:
+                    break
+                if not job.advance():
+                    self.jobs.pop(0)
+                job.last_step_ms = (time.perf_counter() - step_start) * 1000.0
+                self.steps += 1
+                self.max_step_ms = max(self.max_step_ms, job.last_step_ms)
+                ran = True
+        self.slices += 1
+        self.max_slice_ms = max(self.max_slice_ms, (time.perf_counter() - start) * 1000.0)
+        return bool(self.jobs)
+
+    def finish(self):
+        """Roda todos os jobs até o fim (sem orçamento)."""
+        while self.step(float("inf")):
+            pass
+
+    def stats(self):
+        return {"steps": self.steps, "slices": self.slices, "pending": len(self.jobs),
+                "max_step_ms": round(self.max_step_ms, 2), "max_slice_ms": round(self.max_slice_ms, 2)}
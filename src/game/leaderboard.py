@@ -0,0 +1,190 @@
+"""
+Leaderboard indexado (SQLite) a partir do highscores.txt.
+
+O arquivo texto (DIFICULDADE|MILISEGUNDOS|TIMESTAMP, escrito pelo
+`score_writer`) continua sendo a fonte; o banco é um índice dele:
+
+- a primeira sincronização importa o arquivo legado inteiro, uma única vez;
+- as seguintes leem só os bytes anexados desde o último offset salvo
+  (arquivo substituído ou truncado é reimportado do zero);
+- top-k, percentis e histórico diário são consultas no índice
+  (dificuldade, tempo), sem varrer nem ordenar a lista toda.
+
+Uso (a partir de src/):
+    python -m game.leaderboard [--difficulty HARD] [--top 10] [--days 14] [--json]
+"""
+import os
+import sys
+import json
+import sqlite3
+from game.score_writer import SCORE_PATH
+from game.highscore_reader import HEAD_BYTES, iter_chunks, parse_records
+
+DB_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                        "..", "..", "leaderboard.sqlite3"))
+
+# Dificuldades exibidas no menu
+MENU_DIFFICULTIES = ("HARD", "NORMAL", "EASY")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    difficulty TEXT NOT NULL,
+    time_ms INTEGER NOT NULL,
+    played_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_rank ON scores (difficulty, time_ms);
+CREATE INDEX IF NOT EXISTS scores_day ON scores (difficulty, played_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    source TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    head BLOB NOT NULL
+);
+"""
+
+
+class Leaderboard:
+    """
+    Índice SQLite dos highscores.
+
+    Args:
+        path (str): Arquivo do banco (":memory:" para testes).
+        source (str): highscores.txt de onde os scores são importados.
+    """
+
+    def __init__(self, path=DB_PATH, source=SCORE_PATH):
+        self.path = path
+        self.source = source
+        self.conn = sqlite3.connect(path)
+        # Índice derivado (reconstruível do arquivo texto): WAL sem fsync a
+        # cada commit, para um sync no menu não travar em cartões SD lentos
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _sync_state(self):
+        row = self.conn.execute("SELECT offset, head FROM sync_state WHERE source = ?",
+                                (self.source,)).fetchone()
+        return row if row else (0, b"")
+
+    def sync(self):
+        """
+        Importa as linhas novas do arquivo fonte. Só linhas completas (com
+        quebra de linha) são lidas; uma escrita em andamento fica para o
+        próximo sync. Sem nada novo, não escreve no banco (nem abre
+        transação). Retorna o número de scores importados.
+        """
+        saved_offset, head = self._sync_state()
+        offset = saved_offset
+        try:
+            f = open(self.source, "rb")
+        except FileNotFoundError:
+            return 0
+        imported = 0
+        with f, self.conn:
+            size = os.fstat(f.fileno()).st_size
+            current_head = f.read(HEAD_BYTES)
+            # Arquivo trocado ou truncado: reimporta tudo
+            if size < offset or current_head[:len(head)] != head:
+                offset = 0
+                self.conn.execute("DELETE FROM scores")
+            # Blocos de tamanho fixo: memória limitada mesmo num legado enorme
+            for lines, offset in iter_chunks(f, offset):
+                cursor = self.conn.executemany(
+                    "INSERT INTO scores (difficulty, time_ms, played_at) VALUES (?, ?, ?)", parse_records(lines))
+                imported += cursor.rowcount
+            if offset != saved_offset or current_head != head:
+                self._save_state(offset, current_head)
+        return imported
+
+    def _save_state(self, offset, head):
+        self.conn.execute("INSERT OR REPLACE INTO sync_state (source, offset, head) VALUES (?, ?, ?)",
+                          (self.source, offset, head))
+
+    def count(self, difficulty):
+        return self.conn.execute("SELECT COUNT(*) FROM scores WHERE difficulty = ?",
+                                 (difficulty,)).fetchone()[0]
+
+    def top(self, difficulty, k=3):
+        """Os `k` menores tempos (ms) da dificuldade."""
+        rows = self.conn.execute(
+            "SELECT time_ms FROM scores WHERE difficulty = ? ORDER BY time_ms LIMIT ?", (difficulty, k))
+        return [r[0] for r in rows]
+
+    def top_all(self, k=3, difficulties=MENU_DIFFICULTIES):
+        """{dificuldade: top k} para o menu."""
+        return {name: self.top(name, k) for name in difficulties}
+
+    def percentiles(self, difficulty, ps=(50, 90, 99)):
+        """Percentis (nearest rank) dos tempos da dificuldade, via o índice."""
+        n = self.count(difficulty)
+        result = {}
+        for p in ps:
+            if not n:
+                result[f"p{p}"] = None
+                continue
+            rank = max(0, min(n - 1, -(-p * n // 100) - 1))
+            result[f"p{p}"] = self.conn.execute(
+                "SELECT time_ms FROM scores WHERE difficulty = ? ORDER BY time_ms LIMIT 1 OFFSET ?",
+                (difficulty, rank)).fetchone()[0]
+        return result
+
+    def daily(self, difficulty, days=30):
+        """Histórico por dia (mais recente primeiro): (dia, vitórias, melhor ms, média ms)."""
+        rows = self.conn.execute(
+            "SELECT substr(played_at, 1, 10) AS day, COUNT(*), MIN(time_ms), AVG(time_ms) "
+            "FROM scores WHERE difficulty = ? GROUP BY day ORDER BY day DESC LIMIT ?",
+            (difficulty, days))
+        return [(day, count, best, round(mean, 1)) for day, count, best, mean in rows]
+
+    def summary(self, difficulty, k=10, days=14):
+        return {
+            "difficulty": difficulty,
+            "count": self.count(difficulty),
+            "top": self.top(difficulty, k),
+            "percentiles": self.percentiles(difficulty),
+            "daily": self.daily(difficulty, days),
+        }
+
+
+_shared = None
+
+
+def get_leaderboard():
+    """Leaderboard compartilhado (aberto no primeiro uso)."""
+    global _shared
+    if _shared is None:
+        _shared = Leaderboard()
+    return _shared
+
+
+def _arg(argv, flag, default):
+    return argv[argv.index(flag) + 1] if flag in argv and argv.index(flag) + 1 < len(argv) else default
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    board = get_leaderboard()
+    imported = board.sync()
+    difficulty = _arg(argv, "--difficulty", None)
+    names = [difficulty.upper()] if difficulty else list(MENU_DIFFICULTIES)
+    summaries = [board.summary(name, int(_arg(argv, "--top", 10)), int(_arg(argv, "--days", 14)))
+                 for name in names]
+
+    if "--json" in argv:
+        print(json.dumps({"imported": imported, "difficulties": summaries}, indent=2))
+        return 0
+    print(f"{imported} scores novos importados de {board.source}")
+    for s in summaries:
+        print(f"\n{s['difficulty']}: {s['count']} vitórias, percentis (ms) {s['percentiles']}")
+        print("  top: " + ", ".join(str(t) for t in s["top"]))
+        for day, count, best, mean in s["daily"]:
+            print(f"  {day}: {count:>5} vitórias, melhor {best} ms, média {mean} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
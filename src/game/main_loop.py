@@ -0,0 +1,234 @@
+"""
+Corpo do loop principal: um frame de eventos, atualização em passo fixo,
+troca de cenas, renderização e carga incremental.
+
+Compartilhado pelo main.py (eventos do pygame, clock limitado a TARGET_FPS) e
+pelo modo benchmark (eventos e teclas roteirizados, clock sem limite), para o
+benchmark medir o mesmo loop que roda no jogo: catch-up do FixedTimestep,
+render interpolado, construção do GameLoop em segundo plano pelo
+SceneManager, reaproveitamento do pool com restart() e fatias do
+IncrementalLoader.
+
+Uso:
+    main_loop = MainLoop(screen, clock, "NORMAL")
+    while main_loop.running:
+        main_loop.frame(pygame.event.get(), clock.tick(TARGET_FPS))
+"""
+import time
+import pygame
+from game.menu import Menu
+from game.game_loop import GameLoop
+from game.model.gamestate_enum import GameState
+from game.model.difficulty import Difficulty
+from game.model.config import SCREEN_WIDTH, SCREEN_HEIGHT, TARGET_FPS
+from game.profiler import profiler
+from game.fixed_timestep import FixedTimestep
+from game.scene_manager import SceneManager
+
+# Nomes dos estados (para métricas e logs)
+STATE_NAMES = {value: name for name, value in vars(GameState).items() if not name.startswith("_")}
+
+
+class MainLoop:
+    """
+    Estado do loop principal (pilha de cenas, dificuldade, passo fixo) e um
+    frame dele em `frame()`.
+
+    Args:
+        screen (pygame.Surface): Tela.
+        clock (pygame.time.Clock): Clock do main.py (o HUD do profiler mostra o FPS dele).
+        start_difficulty (str): Dificuldade inicial do menu.
+        loader (IncrementalLoader): Carga em fatias de tempo (None = thread de carga).
+        replay_recorder (ReplayRecorder): Gravação das partidas (opcional).
+        flight_recorder (FlightRecorder): Gravador de frames lentos (opcional).
+        frame_metrics (FrameMetrics): Métricas exportadas (opcional).
+        latency_probe: Medição de latência input -> som (opcional).
+        debug (bool): Se True, imprime trocas de cena e construções.
+    """
+
+    def __init__(self, screen, clock, start_difficulty="NORMAL", loader=None, replay_recorder=None,
+                 flight_recorder=None, frame_metrics=None, latency_probe=None, debug=False):
+        self.screen = screen
+        self.clock = clock
+        self.loader = loader
+        self.replay_recorder = replay_recorder
+        self.flight_recorder = flight_recorder
+        self.frame_metrics = frame_metrics
+        self.latency_probe = latency_probe
+        self.debug = debug
+
+        # Simulação em passo fixo (TARGET_FPS ticks por segundo de tempo real)
+        self.timestep = FixedTimestep()
+
+        # Sistema de dificuldade (instância atual)
+        self.current_difficulty = Difficulty(start_difficulty)
+
+        # Pilha de cenas (o menu fica vivo embaixo do jogo) e pool com o
+        # último GameLoop, reaproveitado se a dificuldade não mudar
+        self.scenes = SceneManager(debug=debug)
+        self.menu = self.scenes.push(GameState.MENU, Menu(SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.menu.set_current_difficulty(start_difficulty)
+        self.current_state = self.scenes.current_key
+        self.game_loop = None
+        self.running = True
+
+    def new_game_loop(self, difficulty, defer_textures=False):
+        """
+        Cria o GameLoop da partida (semeado e com relógio simulado ao gravar).
+        Roda na thread de carga do SceneManager, enquanto o menu anima a cortina.
+        """
+        if self.replay_recorder is None:
+            return GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, difficulty, debug=self.debug, defer_textures=defer_textures)
+        from game.clock import SimulatedClock
+        self.replay_recorder.begin_session(difficulty)
+        return GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, difficulty, debug=self.debug, clock=SimulatedClock(),
+                        defer_textures=defer_textures)
+
+    def new_game_loop_steps(self, difficulty):
+        """`new_game_loop` em passos para o IncrementalLoader (retorna o GameLoop)."""
+        game_loop = self.new_game_loop(difficulty, defer_textures=True)
+        yield 0.0
+        yield from game_loop.load_textures_steps()
+        return game_loop
+
+    def select_difficulty(self, name):
+        """Sorteia um novo Difficulty `name` (velocidades e número de gabrielzitos)."""
+        self.current_difficulty = Difficulty(name)
+        self.menu.set_current_difficulty(name)
+
+    def frame(self, events, frame_interval, keys=None):
+        """
+        Um frame do loop principal.
+
+        Args:
+            events (list): Eventos do frame (pygame.event.get() ou roteiro).
+            frame_interval (float): Tempo real desde o frame anterior (ms), em ticks de passo fixo.
+            keys: Teclas seguradas (padrão: pygame.key.get_pressed()).
+        """
+        frame_start = time.perf_counter()
+        scenes, menu, replay_recorder, loader = self.scenes, self.menu, self.replay_recorder, self.loader
+        if self.flight_recorder:
+            self.flight_recorder.begin_frame()
+        else:
+            profiler.begin_frame()
+
+        # Processamento de eventos
+        with profiler.scope("events"):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+
+                if self.latency_probe and event.type == pygame.KEYDOWN:
+                    self.latency_probe.input_event()
+
+                # F3: liga/desliga o HUD do profiler de frame
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle_hud()
+                    continue
+
+                # Estado: MENU
+                if self.current_state == GameState.MENU:
+                    action = menu.handle_input(event)
+
+                    # Atualizar dificuldade se mudou
+                    if action == "DIFFICULTY_CHANGED":
+                        self.select_difficulty(menu.get_selected_difficulty())
+
+                    # JOGAR: o GameLoop é construído em segundo plano durante a cortina
+                    elif action == "PLAY":
+                        # Só reaproveita o GameLoop construído com esta mesma instância:
+                        # sair do submenu sorteia um novo Difficulty (velocidades e
+                        # número de gabrielzitos), mesmo que o nome não mude
+                        pooled = scenes.pool.get(GameState.MOVE)
+                        if pooled and pooled.difficulty is not self.current_difficulty:
+                            scenes.discard(GameState.MOVE)
+                        if loader:
+                            scenes.preload(GameState.MOVE,
+                                           lambda d=self.current_difficulty: self.new_game_loop_steps(d), loader)
+                        else:
+                            scenes.preload(GameState.MOVE, lambda d=self.current_difficulty: self.new_game_loop(d))
+                        menu.loading = True
+
+                # Estado: JOGANDO
+                elif self.current_state == GameState.MOVE:
+                    if replay_recorder and event.type == pygame.KEYDOWN:
+                        replay_recorder.key_event(event.key)
+                    action = self.game_loop.handle_input(event)
+
+                    if action == "BACK_TO_MENU":
+                        # O GameLoop vai para o pool e o menu (vivo na pilha) reaparece
+                        scenes.pop()
+                        self.current_state = scenes.current_key
+                        menu.reset(self.current_difficulty.name)
+                        self.game_loop = None
+                        if replay_recorder:
+                            replay_recorder.end_session()
+
+                    elif action == "RESTART_GAME":
+                        # Reinício instantâneo: restaura o snapshot inicial, sem recarregar texturas
+                        if replay_recorder:
+                            replay_recorder.begin_session(self.game_loop.difficulty)
+                        self.game_loop.restart()
+
+        # Atualização (passo fixo: o número de ticks depende do tempo real decorrido)
+        ticks = self.timestep.advance(frame_interval)
+        if self.current_state == GameState.MENU:
+            with profiler.scope("menu_update"):
+                for _ in range(ticks):
+                    menu.update()
+
+            # Troca de cena quando a cortina fechou e o GameLoop está pronto;
+            # até lá o menu continua animando (cortina com "CARREGANDO...")
+            if menu.is_transition_complete() and scenes.ready(GameState.MOVE):
+                reused = GameState.MOVE in scenes.pool
+                self.game_loop = scenes.push(GameState.MOVE, scenes.take(GameState.MOVE))
+                if reused:
+                    # Mesmo caminho do RESTART_GAME: novo sorteio, texturas reaproveitadas
+                    if replay_recorder:
+                        replay_recorder.begin_session(self.game_loop.difficulty)
+                    self.game_loop.restart()
+                else:
+                    self.game_loop.start_timer()
+                self.current_state = scenes.current_key
+                self.timestep.reset()  # o tempo de carga não vira ticks atrasados
+
+        elif self.current_state == GameState.MOVE:
+            keys = pygame.key.get_pressed() if keys is None else keys
+            for _ in range(ticks):
+                self.game_loop.update(keys)
+                if replay_recorder:
+                    replay_recorder.tick(keys, self.game_loop.world)
+
+        # Renderização
+        if self.current_state == GameState.MENU:
+            with profiler.scope("menu_render"):
+                menu.render(self.screen)
+
+        elif self.current_state == GameState.MOVE:
+            self.game_loop.render(self.screen, self.timestep.alpha)
+
+        #from game.fps import show_fps
+        # show_fps(screen, clock)
+        if profiler.hud_visible:
+            profiler.render_hud(self.screen, self.clock)
+        pygame.display.flip()
+
+        # Carga incremental: usa a folga do frame, limitada ao orçamento; sem folga,
+        # só o passo mínimo (o loader sempre roda pelo menos um)
+        if loader and not loader.idle:
+            spare_ms = 1000.0 / TARGET_FPS - (time.perf_counter() - frame_start) * 1000.0
+            with profiler.scope("loader"):
+                loader.step(min(loader.budget_ms, max(spare_ms, 0.0)))
+            menu.loading_progress = loader.progress
+        if self.flight_recorder:
+            self.flight_recorder.end_frame(scene="MENU" if self.current_state == GameState.MENU else "JOGO")
+        else:
+            profiler.end_frame()
+
+        if self.frame_metrics:
+            self.frame_metrics.record_frame(
+                (time.perf_counter() - frame_start) * 1000.0,
+                frame_interval,
+                STATE_NAMES.get(self.current_state, str(self.current_state)),
+                len(self.game_loop.world.prizes) if self.game_loop else 0,
+            )
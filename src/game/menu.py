@@ -6,11 +6,16 @@ import sys
 import pygame
 import math
 import os
+import sqlite3
 from engine.raster import drawPolygon, draw_circle, flood_fill_iterativo, paintTexturedPolygon, draw_text_raster, draw_gradient_rect, paint_ellipse
 from engine.transformations import rotation, scale, multiply_matrices, apply_matrix_to_point
 from game.menu_scene import ClawMachineScene
 from game.model.config import *
+from game.model.difficulty import Difficulty
 from game.audio_manager import play_audio
+from game.score_writer import score_writer
+from game.leaderboard import get_leaderboard, MENU_DIFFICULTIES
+from game.asset_loader import assets, MENU_TEXTURES
 
 
 def _resolve_asset_path(filename):
@@ -107,17 +112,9 @@ class TexturedBox:
         self.max_scale = SCALE_MAX
     
     def _load_texture(self, path):
-        """Carrega PNG e converte para matriz de textura"""
+        """Matriz de textura do PNG (do registro de assets, decodificado em paralelo)"""
         try:
-            surf = pygame.image.load(path)
-            w, h = surf.get_width(), surf.get_height()
-            matrix = []
-            for x in range(w):
-                col = []
-                for y in range(h):
-                    col.append(surf.get_at((x, y)))
-                matrix.append(col)
-            return matrix, w, h
+            return assets.texture(path)
         except Exception as e:
             # Retorna uma matriz 1x1 transparente como fallback
             return [[(0, 0, 0, 0)]], 1, 1
@@ -198,17 +195,9 @@ class TexturedEllipse:
         self.max_scale = SCALE_MAX
     
     def _load_texture(self, path):
-        """Carrega PNG e converte para matriz de textura"""
+        """Matriz de textura do PNG (do registro de assets, decodificado em paralelo)"""
         try:
-            surf = pygame.image.load(path)
-            w, h = surf.get_width(), surf.get_height()
-            matrix = []
-            for x in range(w):
-                col = []
-                for y in range(h):
-                    col.append(surf.get_at((x, y)))
-                matrix.append(col)
-            return matrix, w, h
+            return assets.texture(path)
         except Exception as e:
             # Retorna uma matriz 1x1 transparente como fallback
             print(f"Error loading texture '{path}': {e}")
@@ -266,7 +255,7 @@ class DifficultySelector:
     def __init__(self, x, y, current_difficulty="NORMAL"):
         self.x = x
         self.y = y
-        self.difficulties = ["EASY", "NORMAL", "HARD"]
+        self.difficulties = Difficulty.get_available_difficulties()
         # Iniciar com a dificuldade atual
         try:
             self.selected_index = self.difficulties.index(current_difficulty)
@@ -356,7 +345,8 @@ class Menu:
         # Carrega os highscores
         self.highscores = self._load_highscores()
         
-        # Elementos texturizados nos cantos
+        # Elementos texturizados nos cantos (texturas decodificadas em paralelo)
+        assets.load(MENU_TEXTURES)
         margin = ROTATING_BOX_MARGIN
         self.corner_elements = [
             TexturedBox(margin, margin, _resolve_asset_path("gabrielzito/mocking/gabriel-mocking4.png")),                    # Superior esquerdo
@@ -373,6 +363,23 @@ class Menu:
         self.transitioning = False
         self.transition_speed = TRANSITION_SPEED
         self.transition_complete = False
+
+        # Próxima cena ainda carregando (a cortina fechada mostra "CARREGANDO...")
+        self.loading = False
+        self.loading_progress = None   # 0..1 na carga incremental (barra de progresso)
+
+    def reset(self, difficulty):
+        """
+        Prepara o menu para reaparecer (ele fica vivo na pilha de cenas durante
+        a partida): desfaz a transição e recarrega os highscores.
+        """
+        self.transition_alpha = 0
+        self.transitioning = False
+        self.transition_complete = False
+        self.loading = False
+        self.loading_progress = None
+        self.set_current_difficulty(difficulty)
+        self.highscores = self._load_highscores()
         
     def handle_input(self, event):
         """Processa input do teclado"""
@@ -482,6 +489,12 @@ class Menu:
     
     def render(self, screen):
         """Renderiza o menu completo"""
+        # Cortina fechada (esperando a carga): o menu está todo coberto
+        if self.transition_complete:
+            with pygame.PixelArray(screen) as px_array:
+                self._render_transition(px_array)
+            return
+
         # Renderizar cenário de fundo
         self.scene.render(screen)
         
@@ -642,6 +655,24 @@ class Menu:
         if curtain_height > 0:
                 screen[0:self.width, 0:curtain_height] = COLOR_TRANSITION
 
+        if self.transition_complete and self.loading:
+            text = "CARREGANDO..."
+            w, h = self.font.size(text)
+            draw_text_raster(screen, self.font, text, (self.width - w) // 2, (self.height - h) // 2, self.text_color)
+            if self.loading_progress is not None:
+                self._render_progress_bar(screen, (self.height + h) // 2 + 20)
+
+    def _render_progress_bar(self, screen, y, bar_w=300, bar_h=14):
+        """Barra de progresso da carga incremental (borda + preenchimento)"""
+        x = (self.width - bar_w) // 2
+        fill = int((bar_w - 4) * min(1.0, self.loading_progress))
+        screen[x:x + bar_w, y] = self.text_color
+        screen[x:x + bar_w, y + bar_h - 1] = self.text_color
+        screen[x, y:y + bar_h] = self.text_color
+        screen[x + bar_w - 1, y:y + bar_h] = self.text_color
+        if fill > 0:
+            screen[x + 2:x + 2 + fill, y + 2:y + bar_h - 2] = self.selected_color
+
     def _format_time(self, ms):
         """Converte milissegundos para mm:ss"""
         seconds = ms // 1000
@@ -651,37 +682,19 @@ class Menu:
     
     def _load_highscores(self):
         """
-        Lê o arquivo de scores, filtra por dificuldade e retorna os Top 3.
-        Retorna: Dicionário {'HARD': [t1, t2, t3], 'NORMAL': [t1, t2, t3]}
+        Top 3 de cada dificuldade do menu, do leaderboard indexado
+        (game/leaderboard.py): só as linhas novas do arquivo são importadas.
+        Retorna: Dicionário {'HARD': [t1, t2, t3], 'NORMAL': [...], 'EASY': [...]}
         """
-        scores = {'NORMAL': [], 'HARD': []}
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        score_path = os.path.join(base_path, "..", "..", "highscores.txt")
-
-        if not os.path.exists(score_path):
-            return scores
-
+        # Scores ainda na fila de gravação entram no arquivo antes da leitura
+        score_writer.flush()
         try:
-            with open(score_path, "r") as f:
-                for line in f:
-                    parts = line.strip().split('|')
-                    if len(parts) >= 2:
-                        diff = parts[0]
-                        try:
-                            time_ms = int(parts[1])
-                            if diff in scores:
-                                scores[diff].append(time_ms)
-                        except ValueError:
-                            continue
-            
-            # Ordena (menor tempo é melhor) e pega os top 3
-            scores['NORMAL'] = sorted(scores['NORMAL'])[:3]
-            scores['HARD'] = sorted(scores['HARD'])[:3]
-            
-        except Exception as e:
+            board = get_leaderboard()
+            board.sync()
+            return board.top_all(3, MENU_DIFFICULTIES)
+        except (sqlite3.Error, OSError) as e:
             print(f"Erro ao ler highscores: {e}")
-            
-        return scores
+            return {name: [] for name in MENU_DIFFICULTIES}
     
     def _render_best_times(self, pixel_array):
         """
@@ -713,30 +726,18 @@ class Menu:
         draw_text_raster(pixel_array, self.small_font, "BEST TIMES!", start_x, start_y, COLOR_HIGHSCORE)
         start_y += line_height + 10 # Espaço extra após o título
 
-        # Seção HARD
-        draw_text_raster(pixel_array, self.small_font, "--- HARD ---", start_x, start_y, COLOR_HIGHSCORE)
-        start_y += line_height
-        
-        if not self.highscores['HARD']:
-            draw_text_raster(pixel_array, self.small_font, "---", start_x, start_y, COLOR_TEXT)
+        # Uma seção por dificuldade
+        for name in MENU_DIFFICULTIES:
+            draw_text_raster(pixel_array, self.small_font, f" {name} ".center(12, "-"), start_x, start_y, COLOR_HIGHSCORE)
             start_y += line_height
-        else:
-            for i, time_ms in enumerate(self.highscores['HARD']):
-                time_str = f"{i+1}. {self._format_time(time_ms)}"
-                draw_text_raster(pixel_array, self.small_font, time_str, start_x, start_y, COLOR_TEXT)
-                start_y += line_height
 
-        start_y += 10 # Espaço entre categorias
+            if not self.highscores[name]:
+                draw_text_raster(pixel_array, self.small_font, "---", start_x, start_y, COLOR_TEXT)
+                start_y += line_height
+            else:
+                for i, time_ms in enumerate(self.highscores[name]):
+                    time_str = f"{i+1}. {self._format_time(time_ms)}"
+                    draw_text_raster(pixel_array, self.small_font, time_str, start_x, start_y, COLOR_TEXT)
+                    start_y += line_height
 
-        # Seção NORMAL
-        draw_text_raster(pixel_array, self.small_font, "-- NORMAL --", start_x, start_y, COLOR_HIGHSCORE)
-        start_y += line_height
-        
-        if not self.highscores['NORMAL']:
-            draw_text_raster(pixel_array, self.small_font, "---", start_x, start_y, COLOR_TEXT)
-            start_y += line_height
-        else:
-            for i, time_ms in enumerate(self.highscores['NORMAL']):
-                time_str = f"{i+1}. {self._format_time(time_ms)}"
-                draw_text_raster(pixel_array, self.small_font, time_str, start_x, start_y, COLOR_TEXT)
-                start_y += line_height
\ No newline at end of file
+            start_y += 10 # Espaço entre categorias
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Exportador de métricas de desempenho para monitoramento da frota.
+
+A coleta (`FrameMetrics`) roda no loop principal e só faz `deque.append` e
+atribuições simples, sem locks. Uma thread em segundo plano
+(`MetricsExporter`) drena esses buffers periodicamente e publica as métricas:
+
+- arquivo no formato texto do Prometheus (substituído atomicamente);
+- arquivo JSON lines com rotação por tamanho;
+- endpoint HTTP em localhost (GET /metrics).
+
+Ativado no main.py com `--metrics-file ARQ [--metrics-format prom|jsonl]`
+e/ou `--metrics-port PORTA`.
+"""
+import gc
+import os
+import json
+import time
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Limites superiores (ms) dos buckets do histograma de tempo de frame
+FRAME_BUCKETS_MS = (4.0, 8.0, 16.7, 25.0, 33.3, 50.0, 100.0, 250.0, float("inf"))
+
+
+class FrameMetrics:
+    """
+    Lado da coleta, chamado pelo loop principal.
+    Tudo que é compartilhado com a thread exportadora é `deque` (append/popleft
+    atômicos) ou atribuição de valor simples.
+    """
+
+    def __init__(self, budget_ms=1000.0 / 60, maxlen=8192):
+        self.budget_ms = budget_ms
+        self.frames = deque(maxlen=maxlen)      # (trabalho_ms, intervalo_ms)
+        self.gc_pauses = deque(maxlen=maxlen)   # (geração, ms)
+        self.scene = "MENU"
+        self.prize_count = 0
+        self.cache_providers = {}               # nome -> callable() -> (hits, misses)
+        self._gc_start = None
+        gc.callbacks.append(self._on_gc)
+
+    def record_frame(self, work_ms, interval_ms, scene, prize_count):
+        """Registra um frame: tempo de trabalho, intervalo entre frames, cena e prêmios."""
+        self.frames.append((work_ms, interval_ms))
+        self.scene = scene
+        self.prize_count = prize_count
+
+    def register_cache(self, name, provider):
+        """Registra um cache cujo `provider()` retorna (hits, misses)."""
+        self.cache_providers[name] = provider
+
+    def _on_gc(self, phase, info):
+        # Callback do coletor de lixo: mede a pausa entre "start" e "stop"
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self.gc_pauses.append((info.get("generation", 0), (time.perf_counter() - self._gc_start) * 1000.0))
+            self._gc_start = None
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+
+def _memory_bytes():
+    """Retorna (rss_atual, rss_pico) em bytes, quando disponível."""
+    rss = None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    peak = None
+    if resource is not None:
+        # ru_maxrss vem em KB no Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return rss, peak
+
+
+class MetricsExporter:
+    """
+    Thread de publicação. Mantém os agregados (histograma, contadores) e os
+    grava a cada `interval_s` segundos, sem nunca rodar no loop principal.
+
+    Args:
+        metrics (FrameMetrics): Buffers preenchidos pelo loop principal.
+        path (str): Arquivo de saída (opcional).
+        fmt (str): "prom" (texto do Prometheus) ou "jsonl".
+        port (int): Porta do endpoint HTTP em 127.0.0.1 (opcional).
+        interval_s (float): Período de publicação.
+        max_bytes (int): Tamanho máximo do arquivo jsonl antes de rotacionar.
+        backups (int): Quantos arquivos rotacionados manter (.1, .2, ...).
+    """
+
+    def __init__(self, metrics, path=None, fmt="prom", port=None, interval_s=5.0,
+                 max_bytes=5 * 1024 * 1024, backups=3):
+        if fmt not in ("prom", "jsonl"):
+            raise ValueError(f"Formato de métricas inválido: {fmt}")
+        self.metrics = metrics
+        self.path = path
+        self.fmt = fmt
+        self.port = port
+        self.interval_s = interval_s
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        # Agregados (só a thread exportadora escreve aqui)
+        self.bucket_counts = [0] * len(FRAME_BUCKETS_MS)
+        self.frame_count = 0
+        self.frame_sum_ms = 0.0
+        self.dropped_frames = 0
+        self.gc_count = 0
+        self.gc_sum_ms = 0.0
+        self.gc_max_ms = 0.0
+
+        self.latest_text = ""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._server = None
+
+    def start(self):
+        if self.port:
+            self._start_http()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Para a thread e faz uma última publicação."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.interval_s + 1)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.metrics.close()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.flush()
+        self.flush()
+
+    def _drain(self):
+        """Esvazia os buffers da coleta e atualiza os agregados."""
+        frames = self.metrics.frames
+        drop_limit = self.metrics.budget_ms * 1.5
+        while frames:
+            try:
+                work_ms, interval_ms = frames.popleft()
+            except IndexError:
+                break
+            self.frame_count += 1
+            self.frame_sum_ms += work_ms
+            for i, bound in enumerate(FRAME_BUCKETS_MS):
+                if work_ms <= bound:
+                    self.bucket_counts[i] += 1
+                    break
+            if interval_ms > drop_limit:
+                self.dropped_frames += 1
+
+        pauses = self.metrics.gc_pauses
+        while pauses:
+            try:
+                _, ms = pauses.popleft()
+            except IndexError:
+                break
+            self.gc_count += 1
+            self.gc_sum_ms += ms
+            self.gc_max_ms = max(self.gc_max_ms, ms)
+
+    def snapshot(self):
+        """Dicionário com o estado atual de todas as métricas."""
+        self._drain()
+        rss, peak = _memory_bytes()
+        caches = {}
+        for name, provider in list(self.metrics.cache_providers.items()):
+            try:
+                hits, misses = provider()
+            except Exception:
+                continue
+            total = hits + misses
+            caches[name] = {"hits": hits, "misses": misses,
+                            "hit_rate": (hits / total) if total else None}
+        return {
+            "timestamp": time.time(),
+            "scene": self.metrics.scene,
+            "prize_count": self.metrics.prize_count,
+            "frames": self.frame_count,
+            "frame_time_sum_ms": round(self.frame_sum_ms, 3),
+            "frame_time_buckets_ms": {
+                ("+Inf" if b == float("inf") else str(b)): c
+                for b, c in zip(FRAME_BUCKETS_MS, self._cumulative_buckets())
+            },
+            "dropped_frames": self.dropped_frames,
+            "gc_collections": self.gc_count,
+            "gc_pause_sum_ms": round(self.gc_sum_ms, 3),
+            "gc_pause_max_ms": round(self.gc_max_ms, 3),
+            "memory_rss_bytes": rss,
+            "memory_peak_bytes": peak,
+            "caches": caches,
+        }
+
+    def _cumulative_buckets(self):
+        total = 0
+        out = []
+        for c in self.bucket_counts:
+            total += c
+            out.append(total)
+        return out
+
+    def to_prometheus(self, snap):
+        """Formata um snapshot no formato texto de exposição do Prometheus."""
+        lines = [
+            "# HELP gabrielzito_frame_time_ms Tempo de trabalho por frame.",
+            "# TYPE gabrielzito_frame_time_ms histogram",
+        ]
+        for bound, count in snap["frame_time_buckets_ms"].items():
+            lines.append(f'gabrielzito_frame_time_ms_bucket{{le="{bound}"}} {count}')
+        lines.append(f"gabrielzito_frame_time_ms_sum {snap['frame_time_sum_ms']}")
+        lines.append(f"gabrielzito_frame_time_ms_count {snap['frames']}")
+        lines += [
+            "# TYPE gabrielzito_dropped_frames_total counter",
+            f"gabrielzito_dropped_frames_total {snap['dropped_frames']}",
+            "# TYPE gabrielzito_scene gauge",
+            f'gabrielzito_scene{{scene="{snap["scene"]}"}} 1',
+            "# TYPE gabrielzito_prizes gauge",
+            f"gabrielzito_prizes {snap['prize_count']}",
+            "# TYPE gabrielzito_gc_collections_total counter",
+            f"gabrielzito_gc_collections_total {snap['gc_collections']}",
+            "# TYPE gabrielzito_gc_pause_ms_sum counter",
+            f"gabrielzito_gc_pause_ms_sum {snap['gc_pause_sum_ms']}",
+            "# TYPE gabrielzito_gc_pause_ms_max gauge",
+            f"gabrielzito_gc_pause_ms_max {snap['gc_pause_max_ms']}",
+        ]
+        if snap["memory_rss_bytes"] is not None:
+            lines += ["# TYPE gabrielzito_memory_rss_bytes gauge",
+                      f"gabrielzito_memory_rss_bytes {snap['memory_rss_bytes']}"]
+        if snap["memory_peak_bytes"] is not None:
+            lines += ["# TYPE gabrielzito_memory_peak_bytes gauge",
+                      f"gabrielzito_memory_peak_bytes {snap['memory_peak_bytes']}"]
+        if snap["caches"]:
+            lines.append("# TYPE gabrielzito_cache_hits_total counter")
+            for name, c in snap["caches"].items():
+                lines.append(f'gabrielzito_cache_hits_total{{cache="{name}"}} {c["hits"]}')
+            lines.append("# TYPE gabrielzito_cache_misses_total counter")
+            for name, c in snap["caches"].items():
+                lines.append(f'gabrielzito_cache_misses_total{{cache="{name}"}} {c["misses"]}')
+        return "\n".join(lines) + "\n"
+
+    def flush(self):
+        """Publica um snapshot no arquivo configurado e no endpoint HTTP."""
+        snap = self.snapshot()
+        self.latest_text = self.to_prometheus(snap)
+        if not self.path:
+            return
+        try:
+            if self.fmt == "prom":
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w") as f:
+                    f.write(self.latest_text)
+                os.replace(tmp_path, self.path)
+            else:
+                self._rotate_if_needed()
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(snap) + "\n")
+        except OSError as e:
+            print(f"Erro ao exportar métricas: {e}")
+
+    def _rotate_if_needed(self):
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _start_http(self):
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.latest_text.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # sem log no console do jogo
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
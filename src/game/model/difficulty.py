@@ -3,7 +3,20 @@ Sistema de dificuldade do jogo.
 Define ranges de número de Gabrielzitos e velocidades baseado na dificuldade selecionada.
 Valores são aleatórios dentro dos ranges para evitar comportamento determinístico.
 Cada Gabrielzito tem sua própria velocidade.
+
+Dificuldades personalizadas (ex.: enxames para teste de carga) podem ser
+registradas com `Difficulty.register()` ou carregadas de um arquivo JSON com
+`Difficulty.load_configs()`:
+
+    {"name": "SWARM", "num_prizes_range": [1000, 2000],
+     "prize_speed_range": [0.5, 3.0], "min_gap": 0, "prize_collisions": "exchange"}
+
+`prize_collisions` liga colisões entre gabrielzitos na linha do chão
+("reverse" ou "exchange", ver engine/collision.py); o padrão é "off".
+`prize_motion` escolhe o modelo de movimento: "step" (padrão, passo a passo)
+ou "analytic" (forma fechada, ver game/model/prize_motion.py).
 """
+import json
 import random
 
 class Difficulty:
@@ -14,6 +27,21 @@ class Difficulty:
     Cada Gabrielzito recebe uma velocidade individual.
     """
     
+    # Limite de gabrielzitos das dificuldades personalizadas
+    MAX_PRIZES = 10000
+
+    # Distância mínima padrão entre gabrielzitos na posição inicial (px)
+    DEFAULT_MIN_GAP = 80
+
+    # Maior distância mínima aceita (campo u16 do cabeçalho do replay)
+    MAX_MIN_GAP = 0xFFFF
+
+    # Modos de colisão entre gabrielzitos (ver engine/collision.py)
+    PRIZE_COLLISION_MODES = ("off", "reverse", "exchange")
+
+    # Modelos de movimento dos gabrielzitos (ver game/model/prize_motion.py)
+    PRIZE_MOTION_MODES = ("step", "analytic")
+
     # Configurações de dificuldade (nome: (range_gabrielzitos, range_velocidade))
     CONFIGS = {
         "EASY": {
@@ -30,7 +58,8 @@ class Difficulty:
         }
     }
     
-    def __init__(self, difficulty_name="NORMAL"):
+    def __init__(self, difficulty_name="NORMAL", prize_speeds=None, min_gap=None, prize_collisions=None,
+                 prize_motion=None):
         """
         Inicializa a dificuldade com base no nome fornecido.
         Gera valores aleatórios dentro dos ranges definidos.
@@ -38,14 +67,32 @@ class Difficulty:
         
         Args:
             difficulty_name (str): Nome da dificuldade ("EASY", "NORMAL", "HARD")
+            prize_speeds (list[float]): Velocidades fixas (ex.: replay); se
+                fornecidas, nada é sorteado.
+            min_gap (int): Distância mínima entre gabrielzitos (padrão: a da configuração).
+            prize_collisions (str): Modo de colisão entre gabrielzitos (padrão: o da configuração).
+            prize_motion (str): Modelo de movimento dos gabrielzitos (padrão: o da configuração).
         """
-        if difficulty_name not in self.CONFIGS:
+        if prize_speeds is not None and difficulty_name not in self.CONFIGS:
+            # Replay de uma dificuldade personalizada não registrada nesta execução
+            config = {}
+        elif difficulty_name not in self.CONFIGS:
             print(f"Warning: Dificuldade '{difficulty_name}' inválida. Usando NORMAL.")
             difficulty_name = "NORMAL"
+            config = self.CONFIGS[difficulty_name]
+        else:
+            config = self.CONFIGS[difficulty_name]
         
         self.name = difficulty_name
-        config = self.CONFIGS[difficulty_name]
+        self.min_gap = min_gap if min_gap is not None else config.get("min_gap", self.DEFAULT_MIN_GAP)
+        self.prize_collisions = prize_collisions or config.get("prize_collisions", "off")
+        self.prize_motion = prize_motion or config.get("prize_motion", "step")
         
+        if prize_speeds is not None:
+            self.prize_speeds = list(prize_speeds)
+            self.num_prizes = len(self.prize_speeds)
+            return
+
         # Gerar número aleatório de Gabrielzitos
         num_min, num_max = config["num_prizes_range"]
         self.num_prizes = random.randint(num_min, num_max)
@@ -68,3 +115,55 @@ class Difficulty:
     def get_available_difficulties():
         """Retorna lista de nomes de dificuldades disponíveis"""
         return list(Difficulty.CONFIGS.keys())
+
+    @staticmethod
+    def register(name, num_prizes_range, prize_speed_range, min_gap=DEFAULT_MIN_GAP, prize_collisions="off",
+                 prize_motion="step"):
+        """
+        Registra (ou substitui) uma dificuldade personalizada.
+
+        Raises:
+            ValueError: Se os ranges forem inválidos ou passarem de MAX_PRIZES.
+        """
+        name = str(name).upper()
+        num_min, num_max = (int(v) for v in num_prizes_range)
+        speed_min, speed_max = (float(v) for v in prize_speed_range)
+        min_gap = int(min_gap)
+        if not 1 <= num_min <= num_max <= Difficulty.MAX_PRIZES:
+            raise ValueError(f"{name}: número de gabrielzitos deve estar entre 1 e {Difficulty.MAX_PRIZES}")
+        if speed_min > speed_max:
+            raise ValueError(f"{name}: range de velocidade invertido")
+        if not 0 <= min_gap <= Difficulty.MAX_MIN_GAP:
+            raise ValueError(f"{name}: min_gap deve estar entre 0 e {Difficulty.MAX_MIN_GAP}")
+        if prize_collisions not in Difficulty.PRIZE_COLLISION_MODES:
+            raise ValueError(f"{name}: prize_collisions deve ser um de {Difficulty.PRIZE_COLLISION_MODES}")
+        if prize_motion not in Difficulty.PRIZE_MOTION_MODES:
+            raise ValueError(f"{name}: prize_motion deve ser um de {Difficulty.PRIZE_MOTION_MODES}")
+
+        Difficulty.CONFIGS[name] = {
+            "num_prizes_range": (num_min, num_max),
+            "prize_speed_range": (speed_min, speed_max),
+            "min_gap": min_gap,
+            "prize_collisions": prize_collisions,
+            "prize_motion": prize_motion,
+        }
+        return name
+
+    @staticmethod
+    def load_configs(path):
+        """
+        Registra as dificuldades de um arquivo JSON (um objeto ou uma lista).
+        Retorna os nomes registrados, na ordem do arquivo.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        entries = data if isinstance(data, list) else [data]
+        return [
+            Difficulty.register(
+                entry["name"], entry["num_prizes_range"], entry["prize_speed_range"],
+                entry.get("min_gap", Difficulty.DEFAULT_MIN_GAP),
+                entry.get("prize_collisions", "off"),
+                entry.get("prize_motion", "step"),
+            )
+            for entry in entries
+        ]
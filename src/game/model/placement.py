@@ -0,0 +1,51 @@
+"""
+Posicionamento inicial dos gabrielzitos na pista (1-D) sem sobreposição.
+
+Em vez de sortear candidatos e rejeitar os que ficam perto demais, sorteia
+diretamente a "folga" de cada prêmio: com n prêmios e distância mínima g no
+intervalo [min_x, max_x], sobra L = (max_x - min_x) - (n - 1) * g de espaço
+livre. Sorteando n valores uniformes em [0, L] e ordenando (u_0 <= ... <= u_n-1),
+
+    x_i = min_x + u_i + i * g
+
+respeita a distância mínima por construção. Custo O(n log n) (a ordenação),
+sem tentativas, e sempre encontra solução quando ela existe (L >= 0).
+"""
+import random
+
+
+class PlacementError(ValueError):
+    """Não há como posicionar os prêmios com a distância mínima pedida."""
+
+
+def place_on_track(num_prizes, min_x, max_x, min_gap, rng=random):
+    """
+    Sorteia `num_prizes` posições inteiras em [min_x, max_x] com distância
+    mínima `min_gap` entre quaisquer duas. A ordem das posições é embaralhada
+    (prêmio i não é sempre o i-ésimo da esquerda).
+
+    Raises:
+        PlacementError: Se os prêmios não cabem no intervalo.
+    """
+    if num_prizes <= 0:
+        return []
+    slack = (max_x - min_x) - (num_prizes - 1) * min_gap
+    if slack < 0:
+        track = max_x - min_x
+        fits = track // min_gap + 1 if min_gap > 0 and track >= 0 else 0
+        raise PlacementError(
+            f"{num_prizes} gabrielzitos com distância mínima {min_gap}px precisam de "
+            f"{(num_prizes - 1) * min_gap}px de pista, mas só há {track}px "
+            f"(cabem no máximo {fits})"
+        )
+
+    offsets = sorted(rng.randint(0, slack) for _ in range(num_prizes))
+    positions = [min_x + u + i * min_gap for i, u in enumerate(offsets)]
+    rng.shuffle(positions)
+    return positions
+
+
+def even_spacing(num_prizes, min_x, max_x):
+    """Posições igualmente espaçadas (fallback quando não há solução com a distância mínima)."""
+    spacing = (max_x - min_x) / (num_prizes + 1)
+    return [int(min_x + spacing * (i + 1)) for i in range(num_prizes)]
@@ -0,0 +1,154 @@
+"""
+Armazenamento dos prêmios em estrutura de arrays (NumPy).
+
+Cada atributo é um array com uma posição por gabrielzito. Movimento, quicada
+nas bordas, animação, grudar na garra, teste de agarrar e checagem de vitória
+viram operações vetorizadas sobre todos os prêmios de uma vez.
+
+`PrizeView` dá a API de um prêmio só (prize.x, prize.captured,
+prize.attach()...) para a renderização e demais código que acessa um prêmio
+por vez.
+"""
+import numpy as np
+
+# Registro de um prêmio no snapshot e no hash do mundo (mesma ordem de bytes
+# dos antigos struct "<4db??" e "<ddb??")
+SNAPSHOT_DTYPE = np.dtype([
+    ("x", "<f8"), ("y", "<f8"), ("speed", "<f8"), ("frame_index", "<f8"),
+    ("direction", "i1"), ("captured", "?"), ("being_held", "?"),
+])
+HASH_DTYPE = np.dtype([
+    ("x", "<f8"), ("y", "<f8"), ("direction", "i1"), ("captured", "?"), ("being_held", "?"),
+])
+
+
+class PrizeArray:
+    """
+    Todos os gabrielzitos do mundo, um array por atributo.
+
+    Args:
+        xs (list[float]): Posição X inicial de cada prêmio.
+        y (float): Posição Y (a mesma para todos).
+        speeds (list[float]): Velocidade de cada prêmio.
+    """
+
+    size = 60
+    anim_cycle_speed = 0.15
+    num_frames = 12
+
+    def __init__(self, xs, y, speeds):
+        n = len(xs)
+        self.x = np.array(xs, dtype=np.float64)
+        self.y = np.full(n, y, dtype=np.float64)
+        self.speed = np.array(speeds, dtype=np.float64)
+        self.direction = np.ones(n, dtype=np.int8)
+        self.frame_index = np.zeros(n, dtype=np.float64)
+        self.captured = np.zeros(n, dtype=bool)
+        self.being_held = np.zeros(n, dtype=bool)
+        self.views = [PrizeView(self, i) for i in range(n)]
+
+    def __len__(self):
+        return len(self.views)
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __getitem__(self, index):
+        return self.views[index]
+
+    def step(self, min_x, max_x, follow_x, follow_y, held_x):
+        """
+        Um tick de todos os prêmios, em uma passada:
+        movimento + animação + quicada dos livres, capturados acompanham
+        (follow_x, follow_y) e os segurados grudam em (held_x, follow_y).
+        """
+        active = ~self.captured
+        self.x += self.speed * self.direction * active
+
+        # Animação proporcional à velocidade, ciclo de 12 quadros
+        frames = self.frame_index + np.abs(self.speed) * self.anim_cycle_speed
+        np.fmod(frames, self.num_frames, out=frames)
+        np.copyto(self.frame_index, frames, where=active)
+
+        # Quicada nas bordas
+        half = self.size // 2
+        bounce = active & ((self.x - half <= min_x) | (self.x + half >= max_x))
+        np.negative(self.direction, out=self.direction, where=bounce)
+
+        self.follow(follow_x, follow_y, held_x)
+
+    def follow(self, follow_x, follow_y, held_x):
+        """Capturados acompanham (follow_x, follow_y); segurados grudam em (held_x, follow_y)."""
+        np.copyto(self.x, follow_x, where=self.captured)
+        np.copyto(self.x, held_x, where=self.being_held)
+        np.copyto(self.y, follow_y, where=self.captured | self.being_held)
+
+    def attach(self, indices):
+        """
+        Prende na garra os prêmios livres dentre `indices`.
+        Retorna os índices efetivamente presos.
+        """
+        free = indices[~self.captured[indices] & ~self.being_held[indices]]
+        self.being_held[free] = True
+        return free
+
+    def capture_held(self):
+        """Finaliza a captura dos prêmios segurados (vão para o inventário)."""
+        self.captured |= self.being_held
+        self.being_held[:] = False
+
+    def all_captured(self):
+        return bool(self.captured.all())
+
+    def captured_count(self):
+        return int(np.count_nonzero(self.captured))
+
+    def to_records(self, dtype):
+        """Array estruturado (layout empacotado) com os campos de `dtype`."""
+        records = np.empty(len(self), dtype=dtype)
+        for name in dtype.names:
+            records[name] = getattr(self, name)
+        return records
+
+    def load_records(self, records):
+        """Copia os campos de um array estruturado para os arrays (no lugar)."""
+        for name in records.dtype.names:
+            getattr(self, name)[:] = records[name]
+
+
+class PrizeView:
+    """Visão de um único prêmio do PrizeArray (atributos e métodos de um prêmio)."""
+    __slots__ = ("array", "index")
+
+    size = PrizeArray.size
+    anim_cycle_speed = PrizeArray.anim_cycle_speed
+
+    def __init__(self, array, index):
+        self.array = array
+        self.index = index
+
+    def _get(name, cast):
+        def getter(self):
+            return cast(getattr(self.array, name)[self.index])
+
+        def setter(self, value):
+            getattr(self.array, name)[self.index] = value
+        return property(getter, setter)
+
+    x = _get("x", float)
+    y = _get("y", float)
+    speed = _get("speed", float)
+    direction = _get("direction", int)
+    frame_index = _get("frame_index", float)
+    captured = _get("captured", bool)
+    being_held = _get("being_held", bool)
+    del _get
+
+    def attach(self):
+        """Prende o prêmio na garra (estado intermediário)."""
+        self.being_held = True
+
+    def capture(self):
+        """Finaliza a captura (some do jogo e vai para inventário)."""
+        self.captured = True
+        self.being_held = False
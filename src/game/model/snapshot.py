@@ -0,0 +1,89 @@
+"""
+Snapshots binários do World e ring buffer de snapshots por tick.
+
+Layout fixo (little-endian), gerado por `World.snapshot()`:
+    cabeçalho: versão u8 | estado u8 | ticks do relógio u32 | n_prêmios u16
+               | ufo.x, ufo.y, ufo.velocity_x, claw.x, claw.y, claw.velocity_y f64
+               | claw.is_closed bool
+    por prêmio: x, y, speed, frame_index f64 | direction i8 | captured, being_held bool
+    só com movimento em forma fechada (game/model/prize_motion.py):
+               tick do movimento i64 | por prêmio: tick, fase, quadro da âncora (i64, f64, f64)
+
+O Cable não tem estado próprio (é derivado do UFO e da garra).
+"""
+import struct
+
+SNAPSHOT_VERSION = 1
+
+HEADER = struct.Struct("<BBIH6d?")
+PRIZE = struct.Struct("<4db??")
+MOTION = struct.Struct("<q")
+ANCHOR = struct.Struct("<q2d")
+
+
+def snapshot_size(num_prizes, analytic_motion=False):
+    """Tamanho em bytes do snapshot de um mundo com `num_prizes` prêmios."""
+    size = HEADER.size + PRIZE.size * num_prizes
+    if analytic_motion:
+        size += MOTION.size + ANCHOR.size * num_prizes
+    return size
+
+
+class SnapshotRing:
+    """
+    Ring buffer de snapshots de tamanho fixo, indexados pelo tick.
+
+    Todos os snapshots de uma partida têm o mesmo tamanho (o número de prêmios
+    não muda), então a memória é um único bytearray pré-alocado: a capacidade
+    é o que cabe no orçamento e o snapshot mais antigo é sobrescrito.
+
+    Args:
+        slot_size (int): Tamanho de cada snapshot (ver `snapshot_size`).
+        budget_bytes (int): Memória máxima do buffer.
+    """
+
+    def __init__(self, slot_size, budget_bytes=4 * 1024 * 1024):
+        self.slot_size = slot_size
+        self.capacity = max(1, budget_bytes // slot_size)
+        self.buffer = bytearray(self.capacity * slot_size)
+        self.first_tick = 0   # tick mais antigo ainda no buffer
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def last_tick(self):
+        """Tick do snapshot mais recente (ou None se vazio)."""
+        return self.first_tick + self.count - 1 if self.count else None
+
+    def clear(self):
+        self.first_tick = 0
+        self.count = 0
+
+    def push(self, tick, data):
+        """
+        Guarda o snapshot do `tick`. Ticks devem ser consecutivos; um tick fora
+        de sequência (ex.: após voltar no tempo) descarta o que vem depois dele.
+        """
+        if len(data) != self.slot_size:
+            raise ValueError(f"Snapshot de {len(data)} bytes (esperado {self.slot_size})")
+        if not self.count or not (self.first_tick <= tick <= self.first_tick + self.count):
+            self.first_tick, self.count = tick, 0
+        self.count = tick - self.first_tick
+        if self.count == self.capacity:
+            self.first_tick += 1
+            self.count -= 1
+        slot = (tick % self.capacity) * self.slot_size
+        self.buffer[slot:slot + self.slot_size] = data
+        self.count += 1
+
+    def get(self, tick):
+        """Retorna o snapshot do `tick` (memoryview) ou None se não estiver no buffer."""
+        if not self.count or not (self.first_tick <= tick <= self.last_tick):
+            return None
+        slot = (tick % self.capacity) * self.slot_size
+        return memoryview(self.buffer)[slot:slot + self.slot_size]
+
+    def memory_bytes(self):
+        return len(self.buffer)
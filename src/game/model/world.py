@@ -1,18 +1,26 @@
 import pygame
-import random
-from engine.collision import simple_grab
+import struct
+import zlib
+import numpy as np
+from contextlib import contextmanager
+from engine.collision import grab_prizes, resolve_prize_collisions, SortedAxisIndex
 from game.model.cable import Cable
 from game.model.ufo import UFO
-from game.model.prize import Prize
+from game.model.placement import place_on_track, even_spacing, PlacementError
+from game.model.prize_array import PrizeArray, SNAPSHOT_DTYPE, HASH_DTYPE
+from game.model.prize_motion import AnalyticMotion, ANCHOR_DTYPE
 from game.model.claw import Claw
 from game.model.gamestate_enum import GameState
+from game.profiler import profiler
+from game.clock import RealClock
+from game.model import snapshot as snap
 
 class World:
     """
     Gerencia o estado global do jogo, contendo todas as entidades (UFO, Garra, Prêmios)
     e a lógica principal de interação e atualização física.
     """
-    def __init__(self, width, height, difficulty, debug=False):
+    def __init__(self, width, height, difficulty, debug=False, clock=None):
         """
         Inicializa o mundo do jogo com dimensões específicas e instancia
         os objetos iniciais e o estado da máquina de estados.
@@ -22,10 +30,12 @@ class World:
             height (int): Altura da tela
             difficulty (Difficulty): Instância da classe Difficulty
             debug (bool): Se True, exibe informações de debug
+            clock (RealClock | SimulatedClock): Relógio avançado a cada tick de simulação
         """
         self.width = width
         self.height = height
         self.debug = debug
+        self.clock = clock or RealClock()
 
         self.ufo = UFO(width // 2, 100)
         self.claw = Claw(self.ufo.x, self.ufo.y + 50, self.ufo)
@@ -33,35 +43,30 @@ class World:
 
         self.state = GameState.MOVE 
 
+        # Posições do tick anterior (para interpolar a renderização)
+        self.previous_positions = None
+
         # Cria gabrielzitos dinamicamente baseado na dificuldade
-        self.prizes = []
+        # (estrutura de arrays: um array NumPy por atributo)
         num_prizes = difficulty.num_prizes
         prize_y = 490  # Posição Y fixa (mais abaixo para melhor visual)
+        self.min_gap = difficulty.min_gap  # distância mínima entre gabrielzitos (px)
         
-        # Distribui gabrielzitos em posições aleatórias sem sobreposição
-        prize_half = 30  # metade do tamanho do gabrielzito (60/2)
-        min_x = 50 + prize_half  # garante margem + não ultrapassar borda
-        max_x = width - 50 - prize_half
-        min_gap = 80  # distância mínima entre gabrielzitos (px)
-        for i in range(num_prizes):
-            attempts = 0
-            prize_x = None
-            while attempts < 200:
-                candidate = random.randint(min_x, max_x)
-                if all(abs(candidate - p.x) >= min_gap for p in self.prizes):
-                    prize_x = candidate
-                    break
-                attempts += 1
-
-            # Fallback: usar espaçamento regular garantindo limites
-            if prize_x is None:
-                spacing = (max_x - min_x) // (num_prizes + 1)
-                prize_x = min_x + spacing * (i + 1)
-
-            prize = Prize(prize_x, prize_y)
-            # Aplica velocidade individual do array de dificuldade
-            prize.speed = difficulty.prize_speeds[i]
-            self.prizes.append(prize)
+        # Velocidade individual de cada um vem do array de dificuldade
+        self.prizes = PrizeArray(self.random_prize_positions(num_prizes), prize_y, difficulty.prize_speeds)
+
+        # Broad phase das consultas de agarrar e das colisões entre prêmios
+        # (prêmios ordenados por X). Mantido aqui: reordenado uma vez por tick
+        # em update_prizes, depois do movimento, e quando as posições saltam
+        # (reroll_prizes, restore); as consultas só fazem a busca binária
+        self.prize_index = SortedAxisIndex(self.prizes.x)
+        self.prize_collisions = difficulty.prize_collisions  # "off", "reverse" ou "exchange"
+
+        # Movimento dos livres: passo a passo (PrizeArray.step) ou em forma
+        # fechada (ver game/model/prize_motion.py)
+        self.motion = None
+        if difficulty.prize_motion == "analytic":
+            self.motion = AnalyticMotion(self.prizes, 50, width - 50)
         
         # Mostra gabrielzitos criados (somente em modo debug)
         if self.debug:
@@ -69,6 +74,78 @@ class World:
             for i, p in enumerate(self.prizes):
                 print(f"  Gabrielzito {i+1}: pos=({p.x}, {p.y}), speed={p.speed:.2f}")
 
+    def random_prize_positions(self, num_prizes):
+        """
+        Sorteia as posições X dos gabrielzitos, sem sobreposição
+        (amostragem direta das folgas, ver game/model/placement.py).
+        Se não couberem com a distância mínima, avisa e espaça igualmente.
+        """
+        prize_half = 30  # metade do tamanho do gabrielzito (60/2)
+        min_x = 50 + prize_half  # garante margem + não ultrapassar borda
+        max_x = self.width - 50 - prize_half
+        try:
+            return place_on_track(num_prizes, min_x, max_x, self.min_gap)
+        except PlacementError as e:
+            print(f"Warning: {e}. Usando espaçamento regular.")
+            return even_spacing(num_prizes, min_x, max_x)
+
+    def reroll_prizes(self):
+        """Sorteia novas posições para os gabrielzitos existentes (nova partida)."""
+        self.prizes.x[:] = self.random_prize_positions(len(self.prizes))
+        if self.motion is not None:
+            self.motion.reanchor()
+        self.prize_index.refresh()
+
+    def snapshot(self):
+        """
+        Serializa o estado da simulação em um snapshot binário de layout fixo
+        (ver game/model/snapshot.py).
+        """
+        ufo, claw = self.ufo, self.claw
+        motion = self.motion
+        data = bytearray(snap.snapshot_size(len(self.prizes), motion is not None))
+        snap.HEADER.pack_into(
+            data, 0,
+            snap.SNAPSHOT_VERSION, self.state, getattr(self.clock, "ticks", 0), len(self.prizes),
+            ufo.x, ufo.y, ufo.velocity_x, claw.x, claw.y, claw.velocity_y, claw.is_closed,
+        )
+        offset = snap.HEADER.size + snap.PRIZE.size * len(self.prizes)
+        data[snap.HEADER.size:offset] = self.prizes.to_records(SNAPSHOT_DTYPE).tobytes()
+        if motion is not None:
+            snap.MOTION.pack_into(data, offset, motion.tick)
+            data[offset + snap.MOTION.size:] = motion.to_records().tobytes()
+        return bytes(data)
+
+    def restore(self, data):
+        """
+        Restaura um snapshot de `snapshot()` no lugar: as entidades existentes
+        recebem os valores, nada é realocado.
+        """
+        (version, state, clock_ticks, num_prizes,
+         ufo_x, ufo_y, ufo_vx, claw_x, claw_y, claw_vy, claw_closed) = snap.HEADER.unpack_from(data, 0)
+        if (version != snap.SNAPSHOT_VERSION or num_prizes != len(self.prizes)
+                or len(data) != snap.snapshot_size(num_prizes, self.motion is not None)):
+            raise ValueError("Snapshot incompatível com este mundo")
+
+        self.state = state
+        if hasattr(self.clock, "ticks"):
+            self.clock.ticks = clock_ticks
+        self.ufo.x, self.ufo.y, self.ufo.velocity_x = ufo_x, ufo_y, ufo_vx
+        self.claw.x, self.claw.y, self.claw.velocity_y = claw_x, claw_y, claw_vy
+        self.claw.is_closed = claw_closed
+
+        self.prizes.load_records(np.frombuffer(data, dtype=SNAPSHOT_DTYPE, count=num_prizes,
+                                               offset=snap.HEADER.size))
+        if self.motion is not None:
+            offset = snap.HEADER.size + snap.PRIZE.size * num_prizes
+            (motion_tick,) = snap.MOTION.unpack_from(data, offset)
+            self.motion.load(motion_tick, np.frombuffer(data, dtype=ANCHOR_DTYPE,
+                                                        offset=offset + snap.MOTION.size))
+
+        # Posições saltaram: reordena o índice; sem tick anterior para interpolar
+        self.prize_index.refresh()
+        self.previous_positions = None
+
     def handle_input_trigger(self):
         """
         Gerencia a reação ao botão de ação (Espaço).
@@ -85,9 +162,11 @@ class World:
 
     def update(self, keys):
         """
-        Loop principal de lógica. Atualiza física, gerencia a máquina de estados
-        (Move, Drop, Grab, Lift) e sincroniza posições das entidades.
+        Loop principal de lógica. Avança um tick de simulação: atualiza física,
+        gerencia a máquina de estados (Move, Drop, Grab, Lift) e sincroniza
+        posições das entidades.
         """
+        self.previous_positions = self.get_positions()
         self.ufo.update_physics()
 
         # Lógica de Estados
@@ -115,10 +194,8 @@ class World:
                 if self.claw.y <= limit_y:
                     self.claw.y = limit_y # Garante a posição exata (snap)
                     self.claw.stop()  # para o impulso de subida
-                    # Finaliza captura
-                    for prize in self.prizes:
-                        if prize.being_held:
-                            prize.capture() # Gabrielzito some e conta ponto
+                    # Finaliza captura (Gabrielzitos somem e contam ponto)
+                    self.prizes.capture_held()
                     
                     self.claw.open() # Abre a garra para a próxima
                     self.state = GameState.MOVE
@@ -130,11 +207,56 @@ class World:
         # Mantém a garra alinhada ao UFO no eixo X
         self.claw.x = self.ufo.x
 
-        # Atualiza posição dos prêmios que estão subindo
-        for prize in self.prizes:
-            if prize.being_held:
-                prize.x = self.claw.x
-                prize.y = self.claw.y + 20 # Ajuste visual de altura
+        # Relógio simulado anda um tick (o real ignora)
+        self.clock.advance()
+
+    def state_hash(self):
+        """
+        CRC32 do estado completo da simulação (bit a bit, floats como double).
+        Usado pelo replay para detectar divergências tick a tick.
+        """
+        header = struct.pack(
+            "<ddddd?B",
+            self.ufo.x, self.ufo.velocity_x,
+            self.claw.x, self.claw.y, self.claw.velocity_y,
+            self.claw.is_closed, self.state,
+        )
+        return zlib.crc32(self.prizes.to_records(HASH_DTYPE).tobytes(), zlib.crc32(header))
+
+    def get_positions(self):
+        """Posições de tudo que se move: (ufo.x, claw.x, claw.y, x dos prêmios, y dos prêmios)."""
+        return (
+            self.ufo.x, self.claw.x, self.claw.y,
+            self.prizes.x.copy(), self.prizes.y.copy(),
+        )
+
+    def set_positions(self, positions):
+        """Aplica posições no formato de `get_positions()`."""
+        self.ufo.x, self.claw.x, self.claw.y, prize_x, prize_y = positions
+        self.prizes.x[:] = prize_x
+        self.prizes.y[:] = prize_y
+
+    @contextmanager
+    def interpolated(self, alpha):
+        """
+        Contexto de renderização: posiciona as entidades entre o tick anterior e
+        o atual (fração `alpha`) e restaura as posições reais ao sair.
+        """
+        previous = self.previous_positions
+        if previous is None or alpha >= 1.0:
+            yield
+            return
+
+        current = self.get_positions()
+
+        def lerp(a, b):
+            return a + (b - a) * alpha
+
+        self.set_positions(tuple(lerp(a, b) for a, b in zip(previous, current)))
+        try:
+            yield
+        finally:
+            self.set_positions(current)
 
     def handle_lateral_movement(self, keys):
         """
@@ -161,19 +283,27 @@ class World:
         Percorre a lista de prêmios e verifica colisões com a garra
         para determinar se algum objeto foi capturado.
         """
-        for prize in self.prizes:
-            # simple_grab já verifica internamente se a garra está fechada
-            simple_grab(self.claw, prize)
+        profiler.mark("grab_attempt")
+        # grab_prizes já verifica internamente se a garra está fechada
+        grab_prizes(self.claw, self.prizes, self.prize_index)
 
     def update_prizes(self):
         """
-        Atualiza a lógica de cada prêmio. Se um prêmio estiver capturado,
-        sua posição é travada na posição da garra.
+        Atualiza todos os prêmios em uma passada vetorizada: movimento,
+        animação e quicada dos livres. Capturados acompanham a garra e os que
+        estão subindo grudam nela (já alinhada ao UFO).
+        Com colisões ligadas, os livres que se tocam quicam entre si.
         """
-        for prize in self.prizes:
-            prize.update(50, self.width - 50)
-            
-            # Se o premio for capturado, ele acompanha a posição da garra
-            if prize.captured:
-                prize.x = self.claw.x
-                prize.y = self.claw.y + 20
\ No newline at end of file
+        follow = (self.claw.x, self.claw.y + 20, self.ufo.x)  # Ajuste visual de altura
+        if self.motion is None:
+            self.prizes.step(50, self.width - 50, *follow)
+        else:
+            self.motion.advance()
+            self.prizes.follow(*follow)
+
+        # Índice em dia com as posições do tick (as colisões só mudam velocidades)
+        self.prize_index.refresh()
+        if self.prize_collisions != "off":
+            changed = resolve_prize_collisions(self.prizes, self.prize_index, self.prize_collisions)
+            if self.motion is not None and len(changed):
+                self.motion.reanchor(changed)
\ No newline at end of file
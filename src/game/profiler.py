@@ -0,0 +1,219 @@
+"""
+Profiler de frame por estágio (ferramenta de debug, complementa game/fps.py).
+
+Uso:
+    from game.profiler import profiler
+
+    with profiler.scope("cable"):
+        self.render_cable(px_array)
+
+Os tempos de cada frame vão para um ring buffer e podem ser desenhados como um
+gráfico de barras empilhadas (HUD), alternado pela tecla F3 no main.py.
+Quando desativado, `scope()` devolve um contexto nulo compartilhado: o custo é
+uma checagem de flag e um `with` vazio.
+"""
+import os
+import time
+from collections import deque
+import pygame
+from engine.raster import draw_text_raster
+
+# Estágios conhecidos, na ordem de empilhamento do gráfico, com suas cores
+STAGE_COLORS = {
+    "events":      (120, 120, 120),
+    "world_update": (255, 80, 80),
+    "background":  (80, 80, 255),
+    "cable":       (150, 150, 170),
+    "ufo":         (180, 180, 255),
+    "claw":        (0, 255, 0),
+    "prizes":      (255, 200, 0),
+    "inventory":   (255, 120, 200),
+    "timer":       (255, 255, 255),
+    "game_over":   (255, 0, 255),
+    "audio":       (0, 160, 255),
+    "menu_update": (255, 160, 60),
+    "menu_render": (100, 220, 220),
+    "hud":         (60, 60, 60),
+}
+COLOR_OTHER = (90, 60, 40)       # tempo do frame fora de qualquer escopo
+COLOR_BUDGET = (255, 60, 60)     # linha do orçamento de frame
+
+
+class _NullScope:
+    """Contexto vazio usado quando o profiler está desligado."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Contexto que mede o tempo de um estágio e o acumula no frame atual."""
+    __slots__ = ("profiler", "name", "t0")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, (time.perf_counter() - self.t0) * 1000.0)
+        return False
+
+
+class FrameProfiler:
+    """
+    Coleta tempos por estágio (ms) de cada frame em um ring buffer.
+
+    Atributos:
+        enabled (bool): Liga a coleta (escopos passam a medir).
+        hud_visible (bool): Desenha o gráfico na tela.
+        history (deque): Últimos frames, cada um {'total': ms, 'stages': {nome: ms}, 'events': [...]}.
+    """
+
+    def __init__(self, history_size=120, budget_ms=1000.0 / 60):
+        self.enabled = False
+        self.always_on = False   # mantém a coleta ligada sem HUD (ex.: flight recorder)
+        self.hud_visible = False
+        self.budget_ms = budget_ms
+        self.history = deque(maxlen=history_size)
+        self.current = {}
+        self.events = []
+        self.frame_start = None
+        self.font = None
+
+    def scope(self, name):
+        """Retorna o contexto de medição do estágio `name` (nulo se desligado)."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name, ms):
+        """Acumula `ms` no estágio `name` do frame atual."""
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def mark(self, name, **data):
+        """Registra um evento pontual do jogo (ex.: "grab", "audio") no frame atual."""
+        if not self.enabled:
+            return
+        event = {"name": name, "t": round(time.perf_counter(), 6)}
+        if data:
+            event.update(data)
+        self.events.append(event)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self.events = []
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Fecha o frame atual e o grava no ring buffer. Retorna o registro (ou None)."""
+        if not self.enabled or self.frame_start is None:
+            return None
+        total = (time.perf_counter() - self.frame_start) * 1000.0
+        record = {"total": total, "stages": self.current, "events": self.events}
+        self.history.append(record)
+        self.frame_start = None
+        return record
+
+    def toggle_hud(self):
+        """Liga/desliga o HUD (e a coleta junto com ele, exceto se `always_on`)."""
+        self.hud_visible = not self.hud_visible
+        self.enabled = self.hud_visible or self.always_on
+        if not self.enabled:
+            self.history.clear()
+            self.frame_start = None
+
+    def averages(self):
+        """Média (ms) de cada estágio no histórico."""
+        if not self.history:
+            return {}
+        sums = {}
+        for record in self.history:
+            for name, ms in record["stages"].items():
+                sums[name] = sums.get(name, 0.0) + ms
+        n = len(self.history)
+        return {name: total / n for name, total in sums.items()}
+
+    def _get_font(self):
+        if self.font is None:
+            base_path = os.path.dirname(os.path.abspath(__file__))
+            font_path = os.path.normpath(os.path.join(base_path, "..", "..", "assets", "fonts", "PixeloidSans.ttf"))
+            self.font = pygame.font.Font(font_path if os.path.exists(font_path) else None, 9)
+        return self.font
+
+    def render_hud(self, screen, clock=None):
+        """
+        Desenha o gráfico de barras empilhadas (um frame por coluna de 2 px) no
+        canto inferior esquerdo, com linha de orçamento e legenda das médias.
+        """
+        if not self.hud_visible:
+            return
+        with self.scope("hud"):
+            graph_h = 100
+            px_per_ms = graph_h / (self.budget_ms * 2)  # escala: 2x o orçamento
+            x0 = 10
+            y_base = screen.get_height() - 10
+            bar_w = 2
+
+            with pygame.PixelArray(screen) as px_array:
+                # Fundo escuro da área do gráfico
+                graph_w = self.history.maxlen * bar_w
+                px_array[x0:x0 + graph_w, y_base - graph_h:y_base] = (15, 15, 20)
+
+                for i, record in enumerate(self.history):
+                    x = x0 + i * bar_w
+                    y = y_base
+                    accounted = 0.0
+                    for name, color in STAGE_COLORS.items():
+                        ms = record["stages"].get(name)
+                        if not ms:
+                            continue
+                        accounted += ms
+                        y = self._draw_segment(px_array, x, y, bar_w, ms * px_per_ms, color, y_base - graph_h)
+                    other = record["total"] - accounted
+                    if other > 0:
+                        self._draw_segment(px_array, x, y, bar_w, other * px_per_ms, COLOR_OTHER, y_base - graph_h)
+
+                # Linha do orçamento de frame
+                y_budget = int(y_base - self.budget_ms * px_per_ms)
+                px_array[x0:x0 + graph_w, y_budget] = COLOR_BUDGET
+
+                # Legenda: média de cada estágio
+                font = self._get_font()
+                lines = []
+                if clock is not None:
+                    lines.append((f"FPS {clock.get_fps():.0f}", (255, 255, 255)))
+                if self.history:
+                    avg_total = sum(r["total"] for r in self.history) / len(self.history)
+                    lines.append((f"frame {avg_total:.1f} ms", (255, 255, 255)))
+                for name, ms in sorted(self.averages().items(), key=lambda kv: -kv[1]):
+                    lines.append((f"{name} {ms:.2f}", STAGE_COLORS.get(name, COLOR_OTHER)))
+                # Coluna alinhada pela base do gráfico, crescendo para cima
+                line_y = max(0, y_base - len(lines) * 11)
+                px_array[x0 + graph_w:x0 + graph_w + 110, line_y:y_base] = (15, 15, 20)
+                for text, color in lines:
+                    draw_text_raster(px_array, font, text, x0 + graph_w + 6, line_y, color)
+                    line_y += 11
+
+    def _draw_segment(self, px_array, x, y, w, height, color, y_top):
+        """Desenha um segmento vertical da barra (de baixo para cima) e retorna o novo topo."""
+        y_end = max(y_top, int(y - height))
+        if y_end < y:
+            px_array[x:x + w, y_end:y] = color
+        return y_end
+
+
+# Instância global usada pelos módulos do jogo
+profiler = FrameProfiler()
@@ -0,0 +1,344 @@
+"""
+Gravação e replay determinístico de partidas.
+
+Uma gravação guarda a semente do `random`, a dificuldade (nome e velocidades
+dos gabrielzitos) e um byte de input por tick de simulação, mais o CRC32 do
+estado do mundo após cada tick (`World.state_hash()`). O replay alimenta o
+mesmo fluxo em `GameLoop.handle_input`/`update` com um SimulatedClock e
+compara os hashes para detectar divergências.
+
+Formato do arquivo (little-endian):
+    b"GZRP" | versão u8 | semente u32 | len(nome) u8 | nome ascii
+    | n_prêmios u32 | min_gap u16 | física u8 | velocidades f64 * n | n_ticks u32
+    | inputs u8 * n_ticks | hashes u32 * n_ticks
+
+`física`: bits 0-3 = índice do modo em `Difficulty.PRIZE_COLLISION_MODES`,
+bits 4-7 = índice do modelo em `Difficulty.PRIZE_MOTION_MODES`. A versão 3
+(sem esse campo, colisões desligadas e passo a passo) ainda é lida; versões anteriores
+usavam outro sorteio de posições iniciais e não são mais reproduzíveis.
+
+Byte de input: bit 0 = ESQUERDA segurada, bit 1 = DIREITA segurada,
+bits 2-3 = quantos ESPAÇO desde o tick anterior (até 3), bit 4 = ESC,
+bit 5 = ENTER.
+
+Gravação: `python src/main.py --record DIR` (um arquivo por partida).
+Replay (a partir de src/; `ReplayPlayer` permite voltar e buscar ticks):
+    python -m game.replay ARQUIVO... [--render] [--json]
+"""
+import os
+import sys
+import json
+import time
+import random
+import struct
+from array import array
+from datetime import datetime
+import pygame
+from game.clock import SimulatedClock
+from game.game_loop import GameLoop
+from game.benchmark import ScriptedKeys, percentiles
+from game.model.difficulty import Difficulty
+from game.model.snapshot import SnapshotRing
+from game.model.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+MAGIC = b"GZRP"
+VERSION = 4
+SUPPORTED_VERSIONS = (3, 4)
+
+HOLD_LEFT = 0x01
+HOLD_RIGHT = 0x02
+SPACE_SHIFT = 2
+SPACE_MASK = 0x0C
+EDGE_ESCAPE = 0x10
+EDGE_RETURN = 0x20
+
+
+class Replay:
+    """Conteúdo de uma gravação (semente, dificuldade, inputs e hashes por tick)."""
+
+    def __init__(self, seed, difficulty_name, prize_speeds, inputs=None, hashes=None,
+                 min_gap=Difficulty.DEFAULT_MIN_GAP, prize_collisions="off", prize_motion="step"):
+        self.seed = seed
+        self.difficulty_name = difficulty_name
+        self.prize_speeds = list(prize_speeds)
+        self.min_gap = min_gap
+        self.prize_collisions = prize_collisions
+        self.prize_motion = prize_motion
+        self.inputs = inputs if inputs is not None else bytearray()
+        self.hashes = hashes if hashes is not None else array("I")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def to_bytes(self):
+        name = self.difficulty_name.encode("ascii")
+        header = struct.pack("<4sBIB", MAGIC, VERSION, self.seed, len(name)) + name
+        physics = (Difficulty.PRIZE_COLLISION_MODES.index(self.prize_collisions)
+                   | Difficulty.PRIZE_MOTION_MODES.index(self.prize_motion) << 4)
+        header += struct.pack(f"<IHB{len(self.prize_speeds)}d", len(self.prize_speeds), self.min_gap,
+                              physics, *self.prize_speeds)
+        header += struct.pack("<I", len(self.inputs))
+        hashes = array("I", self.hashes)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        return header + bytes(self.inputs) + hashes.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC:
+            raise ValueError("Arquivo de replay inválido (assinatura)")
+        version, seed, name_len = struct.unpack_from("<BIB", data, 4)
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Versão de replay não suportada: {version} (esperada {VERSION}; "
+                             "gravações antigas usam outro posicionamento inicial)")
+        offset = 10
+        name = data[offset:offset + name_len].decode("ascii")
+        offset += name_len
+        n_speeds, min_gap = struct.unpack_from("<IH", data, offset)
+        offset += 6
+        prize_collisions, prize_motion = "off", "step"
+        if version >= 4:
+            physics = data[offset]
+            prize_collisions = Difficulty.PRIZE_COLLISION_MODES[physics & 0x0F]
+            prize_motion = Difficulty.PRIZE_MOTION_MODES[physics >> 4]
+            offset += 1
+        speeds = struct.unpack_from(f"<{n_speeds}d", data, offset)
+        offset += 8 * n_speeds
+        (n_ticks,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        inputs = bytearray(data[offset:offset + n_ticks])
+        hashes = array("I")
+        hashes.frombytes(data[offset + n_ticks:offset + 5 * n_ticks])
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        if len(inputs) != n_ticks or len(hashes) != n_ticks:
+            raise ValueError("Arquivo de replay truncado")
+        return cls(seed, name, speeds, inputs, hashes, min_gap, prize_collisions, prize_motion)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """
+    Grava as partidas jogadas no main.py (`--record DIR`).
+
+    Uso no loop principal:
+        begin_session(dificuldade)  -> semeia o random antes de criar o GameLoop
+        key_event(tecla)            -> a cada KEYDOWN repassado ao GameLoop
+        tick(keys, world)           -> após cada GameLoop.update
+        end_session()               -> ao sair da partida (grava o arquivo)
+    """
+
+    def __init__(self, directory, debug=False):
+        self.directory = directory
+        self.debug = debug
+        self.replay = None
+        self.pending = 0   # bordas (ESPAÇO/ESC/ENTER) desde o último tick
+
+    def begin_session(self, difficulty):
+        """Encerra a sessão anterior, sorteia e aplica a semente. Retorna a semente."""
+        self.end_session()
+        seed = int.from_bytes(os.urandom(4), "little")
+        random.seed(seed)
+        self.replay = Replay(seed, difficulty.name, difficulty.prize_speeds, min_gap=difficulty.min_gap,
+                             prize_collisions=difficulty.prize_collisions, prize_motion=difficulty.prize_motion)
+        self.pending = 0
+        return seed
+
+    def key_event(self, key):
+        if self.replay is None:
+            return
+        if key == pygame.K_SPACE:
+            count = min(3, ((self.pending & SPACE_MASK) >> SPACE_SHIFT) + 1)
+            self.pending = (self.pending & ~SPACE_MASK) | (count << SPACE_SHIFT)
+        elif key == pygame.K_ESCAPE:
+            self.pending |= EDGE_ESCAPE
+        elif key == pygame.K_RETURN:
+            self.pending |= EDGE_RETURN
+
+    def tick(self, keys, world):
+        if self.replay is None:
+            return
+        value = self.pending
+        if keys[pygame.K_LEFT]:
+            value |= HOLD_LEFT
+        if keys[pygame.K_RIGHT]:
+            value |= HOLD_RIGHT
+        self.replay.inputs.append(value)
+        self.replay.hashes.append(world.state_hash())
+        self.pending = 0
+
+    def end_session(self):
+        """Grava a sessão atual (se tiver ticks). Retorna o caminho ou None."""
+        replay, self.replay = self.replay, None
+        if replay is None or not len(replay):
+            return None
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        path = os.path.join(self.directory, f"replay-{stamp}-{replay.difficulty_name}.gzr")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(replay.to_bytes())
+        except OSError as e:
+            print(f"Erro ao gravar replay: {e}")
+            return None
+        if self.debug:
+            print(f"Replay gravado: {path} ({len(replay)} ticks)")
+        return path
+
+
+def _key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class ReplayPlayer:
+    """
+    Reprodução passo a passo de uma gravação, com volta no tempo e busca.
+
+    O estado após cada tick vai para um SnapshotRing (limitado por
+    `history_bytes`); `seek()` restaura direto do buffer quando o tick ainda
+    está nele e, senão, reinicia do snapshot inicial e avança até o tick.
+
+    Args:
+        replay (Replay): Gravação a reproduzir.
+        screen (pygame.Surface): Se fornecida, cada tick também é renderizado.
+        history_bytes (int): Orçamento do ring buffer (0 desliga o histórico).
+    """
+
+    def __init__(self, replay, screen=None, history_bytes=4 * 1024 * 1024):
+        self.replay = replay
+        self.screen = screen
+        random.seed(replay.seed)
+        difficulty = Difficulty(replay.difficulty_name, prize_speeds=replay.prize_speeds,
+                                min_gap=replay.min_gap, prize_collisions=replay.prize_collisions,
+                                prize_motion=replay.prize_motion)
+        self.game_loop = GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, difficulty,
+                                  clock=SimulatedClock(), headless=screen is None)
+        self.keys = ScriptedKeys()
+        self.tick = 0            # próximo tick a executar
+        self.divergence = None   # primeiro tick cujo hash não bate com a gravação
+        self.history = None
+        if history_bytes:
+            self.history = SnapshotRing(len(self.game_loop.initial_snapshot), history_bytes)
+            self.history.push(0, self.game_loop.initial_snapshot)
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay)
+
+    def step(self):
+        """Executa o próximo tick da gravação. Retorna False se divergiu."""
+        game_loop = self.game_loop
+        value = self.replay.inputs[self.tick]
+        for _ in range((value & SPACE_MASK) >> SPACE_SHIFT):
+            game_loop.handle_input(_key_event(pygame.K_SPACE))
+        if value & EDGE_ESCAPE:
+            game_loop.handle_input(_key_event(pygame.K_ESCAPE))
+        if value & EDGE_RETURN:
+            game_loop.handle_input(_key_event(pygame.K_RETURN))
+
+        self.keys.held.clear()
+        if value & HOLD_LEFT:
+            self.keys.held.add(pygame.K_LEFT)
+        if value & HOLD_RIGHT:
+            self.keys.held.add(pygame.K_RIGHT)
+        game_loop.update(self.keys)
+
+        if self.screen is not None:
+            game_loop.render(self.screen)
+
+        ok = game_loop.world.state_hash() == self.replay.hashes[self.tick]
+        if not ok and self.divergence is None:
+            self.divergence = self.tick
+        self.tick += 1
+        if self.history is not None:
+            self.history.push(self.tick, game_loop.world.snapshot())
+        return ok
+
+    def seek(self, tick):
+        """Posiciona a reprodução no estado antes do tick `tick` (0 = início)."""
+        tick = max(0, min(tick, len(self.replay)))
+        data = self.history.get(tick) if self.history is not None else None
+        if data is not None:
+            self.game_loop.restore_snapshot(data)
+            self.tick = tick
+            return
+        if tick < self.tick:
+            self.game_loop.restore_snapshot(self.game_loop.initial_snapshot)
+            self.tick = 0
+            if self.history is not None:
+                self.history.push(0, self.game_loop.initial_snapshot)
+        while self.tick < tick:
+            self.step()
+
+
+def play_replay(replay, screen=None, stop_on_divergence=True):
+    """
+    Reproduz uma gravação. Com `screen`, também renderiza cada tick e mede o
+    tempo de frame (uso como carga de benchmark repetível).
+
+    Returns:
+        dict: ticks, primeiro tick divergente (ou None), vitória e tempos.
+    """
+    player = ReplayPlayer(replay, screen, history_bytes=0)
+    frame_ms = []
+
+    t0 = time.perf_counter()
+    while not player.finished:
+        tick_start = time.perf_counter()
+        ok = player.step()
+        if screen is not None:
+            frame_ms.append((time.perf_counter() - tick_start) * 1000.0)
+        if not ok and stop_on_divergence:
+            break
+    wall_s = time.perf_counter() - t0
+
+    report = {
+        "difficulty": replay.difficulty_name,
+        "seed": replay.seed,
+        "ticks": len(replay),
+        "divergence_tick": player.divergence,
+        "victory": player.game_loop.victory,
+        "wall_s": round(wall_s, 3),
+    }
+    if screen is not None:
+        report["frame_ms"] = percentiles(frame_ms)
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    paths = [arg for arg in argv if not arg.startswith("--")]
+    if not paths:
+        print("Uso: python -m game.replay ARQUIVO... [--render] [--json]")
+        return 2
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) if "--render" in argv else None
+
+    reports = []
+    for path in paths:
+        report = play_replay(Replay.load(path), screen)
+        report["file"] = path
+        reports.append(report)
+    pygame.quit()
+
+    if "--json" in argv:
+        print(json.dumps(reports, indent=2))
+    else:
+        for r in reports:
+            status = "OK" if r["divergence_tick"] is None else f"DIVERGIU no tick {r['divergence_tick']}"
+            line = f"{r['file']}: {r['difficulty']} {r['ticks']} ticks, {status}, {r['wall_s']:.2f} s"
+            if "frame_ms" in r:
+                line += f" (frame p50 {r['frame_ms']['p50']} ms, p99 {r['frame_ms']['p99']} ms)"
+            print(line)
+    return 1 if any(r["divergence_tick"] is not None for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Gerenciador de cenas: pilha de cenas, pool de cenas prontas e carga em segundo plano.
+
+- Pilha: a cena do topo recebe input, update e render. Entrar no jogo empilha
+  o GameLoop sobre o menu; voltar desempilha e o menu, que continuou vivo
+  embaixo, reaparece sem ser recriado (fontes, texturas e highscores já prontos).
+- Pool: cenas que saíram da pilha ficam guardadas por chave (ex.: o GameLoop
+  de cada dificuldade) e são reaproveitadas na próxima entrada.
+- Carga: `preload(chave, fábrica)` constrói a próxima cena numa thread
+  enquanto a atual continua animando; `ready()` diz quando ela pode entrar.
+  Com `loader` (IncrementalLoader), a fábrica devolve um gerador de passos
+  e a cena é construída em fatias de tempo na thread principal.
+
+Uso (main.py):
+    scenes.preload(GameState.MOVE, fabrica)        # ao escolher JOGAR
+    if menu.is_transition_complete() and scenes.ready(GameState.MOVE):
+        game_loop = scenes.push(GameState.MOVE, scenes.take(GameState.MOVE))
+    ...
+    scenes.pop()                                   # ESC: GameLoop vai para o pool
+"""
+import time
+import threading
+
+
+class SceneBuild:
+    """Construção de uma cena numa thread (resultado ou exceção em `result()`)."""
+
+    def __init__(self, key, factory):
+        self.key = key
+        self.factory = factory
+        self.scene = None
+        self.error = None
+        self.build_ms = None
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"scene-build-{key}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self.scene = self.factory()
+        except Exception as e:  # repassada ao main thread em result()
+            self.error = e
+        self.build_ms = (time.perf_counter() - start) * 1000.0
+        self.done.set()
+
+    def result(self, timeout=None):
+        """Espera a construção e retorna a cena (relança o erro da fábrica)."""
+        self.done.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.scene
+
+
+class SceneManager:
+    """
+    Pilha de cenas + pool de cenas prontas + construções em andamento.
+
+    Args:
+        debug (bool): Se True, imprime construções e trocas de cena.
+    """
+
+    def __init__(self, debug=False):
+        self.debug = debug
+        self.stack = []      # [(chave, cena)], topo no fim
+        self.pool = {}       # chave -> cena pronta fora da pilha
+        self.builds = {}     # chave -> SceneBuild em andamento ou terminada
+
+    @property
+    def current(self):
+        return self.stack[-1][1] if self.stack else None
+
+    @property
+    def current_key(self):
+        return self.stack[-1][0] if self.stack else None
+
+    def push(self, key, scene):
+        """Empilha `scene` (a de baixo continua viva). Retorna a cena."""
+        self.stack.append((key, scene))
+        if self.debug:
+            print(f"Cena: {key} (pilha: {[k for k, _ in self.stack]})")
+        return scene
+
+    def pop(self, keep=True):
+        """
+        Desempilha a cena do topo; com `keep`, ela vai para o pool.
+        Retorna a nova cena do topo.
+        """
+        key, scene = self.stack.pop()
+        if keep:
+            self.pool[key] = scene
+        if self.debug:
+            print(f"Cena: {self.current_key} (pool: {list(self.pool)})")
+        return self.current
+
+    def preload(self, key, factory, loader=None):
+        """
+        Começa a construir a cena `key`, se ela não estiver no pool nem a
+        caminho: numa thread, ou com `loader` em passos (`factory()` devolve
+        o gerador, que retorna a cena).
+        """
+        if key in self.pool or key in self.builds:
+            return
+        self.builds[key] = loader.add(factory(), key) if loader else SceneBuild(key, factory)
+
+    def ready(self, key):
+        """True se a cena `key` está no pool ou sua construção terminou."""
+        build = self.builds.get(key)
+        return key in self.pool or (build is not None and build.done.is_set())
+
+    def take(self, key, factory=None):
+        """
+        Retira a cena `key` do pool ou da construção (esperando se preciso).
+        Sem nenhum dos dois, constrói agora com `factory`.
+        """
+        if key in self.pool:
+            return self.pool.pop(key)
+        build = self.builds.pop(key, None)
+        if build is None:
+            return factory()
+        scene = build.result()
+        if self.debug:
+            print(f"Cena {key} construída em {build.build_ms:.0f} ms")
+        return scene
+
+    def discard(self, key):
+        """Esquece a cena `key` do pool (ex.: dificuldade alterada)."""
+        self.pool.pop(key, None)
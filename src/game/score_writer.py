@@ -0,0 +1,159 @@
+"""
+Gravação de highscores em segundo plano (write-behind).
+
+`GameLoop.save_high_score` só enfileira a linha; uma thread escritora junta o
+que estiver na fila em lotes e anexa cada lote ao `highscores.txt` com uma
+única escrita, sob lock exclusivo do arquivo (`fcntl.flock`), para que dois
+processos não intercalem linhas. O `fsync` roda em cadência controlada (no
+máximo um a cada `fsync_interval_s`) em vez de a cada vitória, e sempre no
+encerramento (`close()`, chamado pelo main.py ao sair).
+
+Formato das linhas: DIFICULDADE|MILISEGUNDOS|TIMESTAMP
+"""
+import os
+import time
+import queue
+import atexit
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock entre processos (append simples)
+    fcntl = None
+
+SCORE_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           "..", "..", "highscores.txt"))
+
+_STOP = object()
+
+
+class ScoreWriter:
+    """
+    Fila de highscores com thread escritora (iniciada no primeiro `submit`).
+
+    Args:
+        path (str): Arquivo de highscores.
+        fsync_interval_s (float): Intervalo mínimo entre fsyncs.
+        batch_max (int): Máximo de linhas por escrita.
+        debug (bool): Se True, imprime cada lote gravado.
+    """
+
+    def __init__(self, path=SCORE_PATH, fsync_interval_s=2.0, batch_max=64, debug=False):
+        self.path = path
+        self.fsync_interval_s = fsync_interval_s
+        self.batch_max = batch_max
+        self.debug = debug
+        self.queue = queue.Queue()
+        self.thread = None
+        self.written = 0          # linhas gravadas
+        self.batches = 0
+        self.fsyncs = 0
+        self.errors = 0
+        self._dirty = False       # escrito mas ainda sem fsync
+        self._last_fsync = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+
+    def submit(self, entry):
+        """Enfileira uma linha (sem bloquear o loop do jogo)."""
+        if not entry.endswith("\n"):
+            entry += "\n"
+        self.start()
+        self.queue.put(entry)
+
+    def flush(self):
+        """Espera a fila esvaziar (as linhas enfileiradas até aqui estão no arquivo)."""
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.join()
+
+    def close(self, timeout=5.0):
+        """Grava o que falta, faz o fsync final e encerra a thread."""
+        thread = self.thread
+        if thread is None or not thread.is_alive():
+            return
+        self.queue.put(_STOP)
+        thread.join(timeout)
+
+    def _run(self):
+        while True:
+            # Com escrita pendente de fsync, acorda a tempo de fazê-lo
+            timeout = None
+            if self._dirty:
+                timeout = max(0.0, self._last_fsync + self.fsync_interval_s - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self._fsync()
+                continue
+
+            batch, stop = [], item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self.batch_max:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            if stop or time.monotonic() - self._last_fsync >= self.fsync_interval_s:
+                self._fsync()
+            for _ in range(len(batch) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch):
+        data = "".join(batch).encode("utf-8")
+        try:
+            with open(self.path, "ab") as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.write(data)
+                    f.flush()
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+            self.written += len(batch)
+            self.batches += 1
+            self._dirty = True
+            if self.debug:
+                print(f"Scores salvos ({len(batch)}): {data.decode('utf-8').strip()}")
+        except OSError as e:
+            self.errors += 1
+            print(f"Erro ao salvar score: {e}")
+
+    def _fsync(self):
+        if not self._dirty:
+            return
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self.fsyncs += 1
+        except OSError as e:
+            print(f"Erro no fsync dos scores: {e}")
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+
+    def stats(self):
+        return {"written": self.written, "batches": self.batches, "fsyncs": self.fsyncs,
+                "pending": self.queue.qsize(), "errors": self.errors}
+
+
+# Escritor compartilhado (GameLoop enfileira, main.py fecha ao sair)
+score_writer = ScoreWriter()
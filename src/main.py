@@ -2,23 +2,96 @@
 Ponto de entrada principal do Claw Machine Game.
 Gerencia estados do jogo (Menu, Jogando, Explicação).
 """
+import os
 import sys
 import pygame
-from game.menu import Menu
-from game.game_loop import GameLoop
-from game.model.gamestate_enum import GameState
 from game.model.difficulty import Difficulty
 from game.model.config import *
-from game.audio_manager import play_soundtrack
+from game.audio_manager import play_soundtrack, sound_bank, configure_mixer, enable_latency_probe, select_backend
+from game.profiler import profiler
+from game.score_writer import score_writer
+from game.asset_loader import assets
+from game.incremental_loader import IncrementalLoader
+from game.main_loop import MainLoop
+
+
+def _arg_value(flag, default=None):
+    """
+    Retorna o valor que segue `flag` em sys.argv (ex.: --benchmark 600).
+    Flag presente sem valor retorna "" e flag ausente retorna `default`.
+    """
+    for i, arg in enumerate(sys.argv):
+        if arg.lower() == flag:
+            value = sys.argv[i + 1] if i + 1 < len(sys.argv) else ""
+            return "" if value.startswith("--") else value
+        if arg.lower().startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return default
+
 
 # Flag de debug (ativada com --debug)
 DEBUG_MODE = "--debug" in sys.argv or "--DEBUG" in sys.argv
+score_writer.debug = DEBUG_MODE
+score_writer.start()  # thread pronta antes da primeira vitória
+
+# Modo benchmark headless (--benchmark N [--benchmark-out arquivo.json])
+BENCHMARK_FRAMES = _arg_value("--benchmark")
+
+# Gravador de frames lentos (--flight-recorder [ORÇAMENTO_MS] [--flight-profile])
+FLIGHT_RECORDER_BUDGET = _arg_value("--flight-recorder")
+
+# Exportação de métricas (--metrics-file ARQ [--metrics-format prom|jsonl] [--metrics-port PORTA])
+METRICS_FILE = _arg_value("--metrics-file")
+METRICS_PORT = _arg_value("--metrics-port")
+
+# Gravação de partidas para replay determinístico (--record DIR)
+RECORD_DIR = _arg_value("--record")
+
+# Dificuldade personalizada: enxame (--swarm N [--prize-collisions reverse|exchange]
+# [--prize-motion analytic]) ou arquivo JSON (--difficulty-file ARQ)
+SWARM_SIZE = _arg_value("--swarm")
+PRIZE_COLLISIONS = _arg_value("--prize-collisions")
+PRIZE_MOTION = _arg_value("--prize-motion")
+DIFFICULTY_FILE = _arg_value("--difficulty-file")
+
+# Mixer de áudio (--audio-preset default|low-latency|low-cpu [--audio-buffer N]
+# [--audio-frequency HZ] [--audio-channels N]) e medição de latência (--audio-latency)
+AUDIO_BUFFER = _arg_value("--audio-buffer")
+AUDIO_FREQUENCY = _arg_value("--audio-frequency")
+AUDIO_CHANNELS = _arg_value("--audio-channels")
+configure_mixer(
+    _arg_value("--audio-preset") or "default",
+    frequency=AUDIO_FREQUENCY or None,
+    buffer=AUDIO_BUFFER or None,
+    channels=AUDIO_CHANNELS or None,
+)
+latency_probe = enable_latency_probe() if "--audio-latency" in sys.argv else None
+
+# Carga das texturas: threads do pool (--asset-workers N, 0 = sequencial) e
+# relatório de tempos por asset ao sair (--asset-report; --debug imprime cada lote)
+ASSET_WORKERS = _arg_value("--asset-workers")
+if ASSET_WORKERS:
+    assets.workers = int(ASSET_WORKERS)
+assets.debug = DEBUG_MODE
+
+# Carga incremental sem thread (--incremental-load [ORÇAMENTO_MS]): o GameLoop é
+# montado em passos pequenos no tempo livre de cada frame, com barra de progresso
+INCREMENTAL_BUDGET = _arg_value("--incremental-load")
+loader = IncrementalLoader(float(INCREMENTAL_BUDGET or 4.0)) if INCREMENTAL_BUDGET is not None else None
+
+# Sem áudio (--no-audio); também automático sem dispositivo de som (driver dummy)
+NO_AUDIO = "--no-audio" in sys.argv
+if BENCHMARK_FRAMES is not None:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 pygame.init()
 
 # Permitir rodar em modo janela com `--window`; o padrão continua sendo fullscreen
 windowed = "--window" in sys.argv or "--WINDOW" in sys.argv
-if windowed:
+if BENCHMARK_FRAMES is not None:
+    flags = 0  # driver dummy não suporta SCALED
+elif windowed:
     flags = pygame.SCALED | pygame.RESIZABLE
 else:
     flags = pygame.SCALED | pygame.RESIZABLE | pygame.FULLSCREEN
@@ -27,72 +100,92 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
 pygame.display.set_caption("Gabrielzito Abduction Arcade Game")
 clock = pygame.time.Clock()
 
+audio_backend = select_backend(null=NO_AUDIO)
 play_soundtrack(volume=0.25)
 
-# Sistema de dificuldade (instância global)
-current_difficulty = Difficulty("NORMAL")
-
-# Sistema de estados
-current_state = GameState.MENU
-menu = Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
-game_loop = None
-
-running = True
-while running:
-    clock.tick(TARGET_FPS)
-
-    # Processamento de eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        # Estado: MENU
-        if current_state == GameState.MENU:
-            action = menu.handle_input(event)
-            
-            # Atualizar dificuldade se mudou
-            if action == "DIFFICULTY_CHANGED":
-                difficulty_name = menu.get_selected_difficulty()
-                current_difficulty = Difficulty(difficulty_name)
-                menu.set_current_difficulty(difficulty_name)
-        
-        # Estado: JOGANDO
-        elif current_state == GameState.MOVE:
-            action = game_loop.handle_input(event)
-            
-            if action == "BACK_TO_MENU":
-                current_state = GameState.MENU
-                # Preservar a dificuldade ao recriar o menu
-                menu = Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
-                menu.set_current_difficulty(current_difficulty.name)
-                game_loop = None
-
-            elif action == "RESTART_GAME":
-                game_loop = GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, current_difficulty, debug=DEBUG_MODE)
-
-    # Atualização
-    if current_state == GameState.MENU:
-        menu.update()
-        
-        # Verificar se transição do menu completou
-        if menu.is_transition_complete():
-            game_loop = GameLoop(SCREEN_WIDTH, SCREEN_HEIGHT, current_difficulty, debug=DEBUG_MODE)
-            current_state = GameState.MOVE
-    
-    elif current_state == GameState.MOVE:
-        keys = pygame.key.get_pressed()
-        game_loop.update(keys)
-
-    # Renderização
-    if current_state == GameState.MENU:
-        menu.render(screen)
-    
-    elif current_state == GameState.MOVE:
-        game_loop.render(screen)
-
-    #from game.fps import show_fps
-    # show_fps(screen, clock)
-    pygame.display.flip()
+# Decodifica os efeitos sonoros em segundo plano (play_audio reaproveita os Sounds)
+if audio_backend.name == "pygame":
+    sound_bank.preload(background=True)
+
+flight_recorder = None
+if FLIGHT_RECORDER_BUDGET is not None:
+    from game.flight_recorder import FlightRecorder
+    flight_recorder = FlightRecorder(
+        profiler,
+        budget_ms=float(FLIGHT_RECORDER_BUDGET or 1000.0 / TARGET_FPS),
+        use_cprofile="--flight-profile" in sys.argv,
+        fps=TARGET_FPS,
+        debug=DEBUG_MODE,
+    )
+
+frame_metrics = None
+metrics_exporter = None
+if METRICS_FILE or METRICS_PORT:
+    from game.metrics import FrameMetrics, MetricsExporter
+    frame_metrics = FrameMetrics(budget_ms=1000.0 / TARGET_FPS)
+    frame_metrics.register_cache("sound_bank", sound_bank.cache_stats)
+    metrics_exporter = MetricsExporter(
+        frame_metrics,
+        path=METRICS_FILE or None,
+        fmt=_arg_value("--metrics-format", "prom"),
+        port=int(METRICS_PORT) if METRICS_PORT else None,
+        interval_s=float(_arg_value("--metrics-interval", "5")),
+    ).start()
+
+replay_recorder = None
+if RECORD_DIR is not None:
+    from game.replay import ReplayRecorder
+    replay_recorder = ReplayRecorder(RECORD_DIR or "replays", debug=DEBUG_MODE)
+
+# Dificuldades personalizadas (registradas antes do menu para aparecerem no seletor)
+start_difficulty = "NORMAL"
+if DIFFICULTY_FILE:
+    try:
+        start_difficulty = Difficulty.load_configs(DIFFICULTY_FILE)[0]
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        print(f"Erro ao carregar dificuldades de {DIFFICULTY_FILE}: {e}")
+if SWARM_SIZE is not None:
+    swarm_prizes = int(SWARM_SIZE or 1000)
+    try:
+        start_difficulty = Difficulty.register("SWARM", (swarm_prizes, swarm_prizes), (0.5, 3.0), min_gap=0,
+                                               prize_collisions=PRIZE_COLLISIONS or "off",
+                                               prize_motion=PRIZE_MOTION or "step")
+    except ValueError as e:
+        print(f"Erro na dificuldade --swarm: {e}")
+
+# Loop principal (o mesmo que o --benchmark mede, ver game/main_loop.py)
+main_loop = MainLoop(screen, clock, start_difficulty, loader=loader, replay_recorder=replay_recorder,
+                     flight_recorder=flight_recorder, frame_metrics=frame_metrics,
+                     latency_probe=latency_probe, debug=DEBUG_MODE)
+
+if BENCHMARK_FRAMES is not None:
+    from game.benchmark import run_benchmark
+    run_benchmark(main_loop, int(BENCHMARK_FRAMES or 600), _arg_value("--benchmark-out"), debug=DEBUG_MODE)
+    main_loop.running = False
+
+while main_loop.running:
+    main_loop.frame(pygame.event.get(), clock.tick(TARGET_FPS))
+
+if metrics_exporter:
+    metrics_exporter.stop()
+if replay_recorder:
+    replay_recorder.end_session()
+# Grava os scores pendentes (com fsync) antes de sair
+score_writer.close()
+if DEBUG_MODE:
+    if audio_backend.name == "pygame":
+        print(f"SoundBank: {sound_bank.stats()}")
+    else:
+        print(f"Áudio desligado, sons pedidos: {audio_backend.counts}")
+if latency_probe:
+    import json
+    print(json.dumps(latency_probe.report(), indent=2))
+if "--asset-report" in sys.argv:
+    import json
+    report = assets.report()
+    if loader:
+        report["incremental"] = loader.stats()
+    print(json.dumps(report, indent=2))
 
 pygame.quit()
 